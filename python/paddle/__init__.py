@@ -61,15 +61,41 @@ from .framework.dtype import complex128  # noqa: F401
 
 Tensor = framework.core.eager.Tensor  # noqa: F401
 Tensor.__qualname__ = 'Tensor'  # noqa: F401
-import paddle.distributed  # noqa: F401
+# The heavy subpackages and the high-level apis are imported on first access,
+# to keep `import paddle` fast.
+from .utils.lazy_import import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    submodules=[
+        'audio',
+        'callbacks',
+        'distributed',
+        'distributed.fleet',
+        'distribution',
+        'geometric',
+        'hapi',
+        'hub',
+        'incubate',
+        'onnx',
+        'quantization',
+        'sparse',
+        'text',
+        'vision',
+    ],
+    attributes={
+        'DataParallel': 'distributed',
+        'Model': 'hapi',
+        'summary': 'hapi',
+        'flops': 'hapi',
+    },
+)
+
 import paddle.sysconfig  # noqa: F401
-import paddle.distribution  # noqa: F401
 import paddle.nn  # noqa: F401
-import paddle.distributed.fleet  # noqa: F401
 import paddle.optimizer  # noqa: F401
 import paddle.metric  # noqa: F401
 import paddle.regularizer  # noqa: F401
-import paddle.incubate  # noqa: F401
 import paddle.autograd  # noqa: F401
 import paddle.device  # noqa: F401
 import paddle.decomposition  # noqa: F401
@@ -79,14 +105,8 @@ import paddle.amp  # noqa: F401
 import paddle.dataset  # noqa: F401
 import paddle.inference  # noqa: F401
 import paddle.io  # noqa: F401
-import paddle.onnx  # noqa: F401
 import paddle.reader  # noqa: F401
 import paddle.static  # noqa: F401
-import paddle.vision  # noqa: F401
-import paddle.audio  # noqa: F401
-import paddle.geometric  # noqa: F401
-import paddle.sparse  # noqa: F401
-import paddle.quantization  # noqa: F401
 
 from .tensor.attribute import is_complex  # noqa: F401
 from .tensor.attribute import is_integer  # noqa: F401
@@ -426,7 +446,8 @@ from .autograd import set_grad_enabled  # noqa: F401
 from .autograd import is_grad_enabled  # noqa: F401
 from .framework import save  # noqa: F401
 from .framework import load  # noqa: F401
-from .distributed import DataParallel  # noqa: F401
+from .framework import async_save  # noqa: F401
+from .framework import clear_async_save_task_queue  # noqa: F401
 
 from .framework import set_default_dtype  # noqa: F401
 from .framework import get_default_dtype  # noqa: F401
@@ -451,19 +472,11 @@ from .device import is_compiled_with_rocm  # noqa: F401
 from .device import is_compiled_with_custom_device  # noqa: F401
 
 # high-level api
-from .hapi import Model  # noqa: F401
-from . import callbacks  # noqa: F401
-from .hapi import summary  # noqa: F401
-from .hapi import flops  # noqa: F401
-from . import hub  # noqa: F401
 from . import linalg  # noqa: F401
 from . import fft  # noqa: F401
 from . import signal  # noqa: F401
 from . import _ir_ops  # noqa: F401
 
-import paddle.text  # noqa: F401
-import paddle.vision  # noqa: F401
-
 from .tensor.random import check_shape  # noqa: F401
 from .nn.initializer.lazy_init import LazyGuard  # noqa: F401
 
@@ -514,6 +527,8 @@ __all__ = [  # noqa
     'unstack',
     'get_default_dtype',
     'save',
+    'async_save',
+    'clear_async_save_task_queue',
     'multinomial',
     'get_cuda_rng_state',
     'get_rng_state',
@@ -55,9 +55,14 @@ class PaddleModel(SerializableBase):
 
 
 class CheckpointSaver:
-    def __init__(self, fs):
+    def __init__(self, fs, chunk_size=256 * 1024 * 1024):
+        """
+        The files no smaller than chunk_size bytes are uploaded to HDFS in
+        parts in parallel, None means uploading every file as a whole.
+        """
         self._fs = fs
         self._checkpoint_prefix = "__paddle_checkpoint__"
+        self._chunk_size = chunk_size
 
     def save_checkpoint(
         self, path, slists, trainer_id=None, local_cache_path=".cache"
@@ -82,7 +87,7 @@ class CheckpointSaver:
         tmp_path = "{}.tmp".format(real_path)
         saved_path = tmp_path
 
-        from paddle.distributed.fleet.utils.fs import LocalFS
+        from paddle.distributed.fleet.utils.fs import HDFSClient, LocalFS
 
         local_fs = LocalFS()
 
@@ -109,7 +114,12 @@ class CheckpointSaver:
 
         if self._fs.need_upload_download():
             self._fs.delete(tmp_path)
-            self._fs.upload(cache_path, tmp_path)
+            if isinstance(self._fs, HDFSClient):
+                self._fs.upload(
+                    cache_path, tmp_path, chunk_size=self._chunk_size
+                )
+            else:
+                self._fs.upload(cache_path, tmp_path)
             local_fs.delete(cache_path)
         self._fs.mv(tmp_path, real_path)
 
@@ -157,6 +167,7 @@ class CheckpointSaver:
                 local_fs.mkdirs(local_cache_path)
             if local_fs.is_exist(cache_path):
                 local_fs.delete(cache_path)
+            local_fs.mkdirs(cache_path)
 
         real_path = "{}/{}.{}".format(
             path, self._checkpoint_prefix, checkpoint_no
@@ -23,6 +23,7 @@ import sys
 import tempfile
 
 import httpx
+import numpy as np
 
 import paddle
 import paddle.dataset
@@ -225,3 +226,70 @@ def _check_exists_and_download(path, url, md5, module_name, download=True):
         return paddle.dataset.common.download(url, module_name, md5)
     else:
         raise ValueError(f'{path} not exists and auto download disabled')
+
+
+def _load_cached_arrays(module_name, sources, key, build_fn):
+    """
+    Load numpy arrays of a dataset from the cache under
+    DATA_HOME/module_name/cache as read-only memory mapped arrays, the
+    cache will be built by :attr:`build_fn` once if it does not exist.
+
+    Memory mapped arrays are loaded instantly and shared by page cache
+    among processes, e.g. DataLoader workers, instead of each process
+    holding a copy of the whole dataset.
+
+    Args:
+        module_name(str): dataset name, same as the download directory.
+        sources(list[str]): source files of the dataset, whose path, size
+            and modification time are part of the cache key, so the cache
+            will be rebuilt if source files changed.
+        key(str): extra cache key, e.g. mode of the dataset.
+        build_fn(callable): function returning a dict of name to numpy
+            array to be cached.
+
+    Returns:
+        dict: name to read-only memory mapped numpy array.
+    """
+    md5 = hashlib.md5()
+    for source in sources:
+        stat = os.stat(source)
+        source = os.path.abspath(source)
+        md5.update(f"{source}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    md5.update(str(key).encode())
+
+    cache_root = os.path.join(DATA_HOME, module_name, 'cache')
+    cache_dir = os.path.join(cache_root, md5.hexdigest())
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_root, exist_ok=True)
+        arrays = build_fn()
+        # NOTE: write into a temporary directory and rename it as the
+        #       cache directory, so other processes building the same
+        #       cache concurrently never see an incomplete cache
+        tmp_dir = tempfile.mkdtemp(dir=cache_root)
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp_dir, name + '.npy'), array)
+        try:
+            os.rename(tmp_dir, cache_dir)
+        except OSError:
+            # cache already built by another process
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return {
+        name[: -len('.npy')]: np.load(
+            os.path.join(cache_dir, name), mmap_mode='r'
+        )
+        for name in os.listdir(cache_dir)
+        if name.endswith('.npy')
+    }
+
+
+def _pack_bytes(values):
+    """
+    Pack a list of bytes, e.g. encoded images, into a uint8 array of
+    concatenated bytes and an int64 offsets array of length len(values) + 1,
+    the i-th bytes is data[offsets[i]:offsets[i + 1]].
+    """
+    offsets = np.zeros([len(values) + 1], dtype='int64')
+    np.cumsum([len(value) for value in values], out=offsets[1:])
+    data = np.frombuffer(b''.join(values), dtype='uint8')
+    return data, offsets
@@ -14,11 +14,16 @@
 
 import abc
 import functools
+import hashlib
+import json
 import multiprocessing
 import os
 import re
 import shutil
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # (TODO: GhostScreaming) It will be removed later.
 from paddle.base import core
@@ -48,6 +53,10 @@ class FSShellCmdAborted(ExecuteError):
     pass
 
 
+class FSChecksumError(Exception):
+    pass
+
+
 class FS:
     @abc.abstractmethod
     def ls_dir(self, fs_path):
@@ -110,6 +119,186 @@ class FS:
         raise NotImplementedError
 
 
+# the suffix of the directory holding the parts of a file uploaded in chunks
+_CHUNKED_SUFFIX = ".paddle_parts"
+_MANIFEST_NAME = "MANIFEST"
+_COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def _copy_range(src_path, src_offset, dst_path, dst_offset, length=None):
+    """
+    Copy `length` bytes of `src_path` from `src_offset` to `dst_path` at
+    `dst_offset`, or the rest of `src_path` if `length` is None. `dst_path`
+    is created if it doesn't exist.
+    """
+    mode = "r+b" if os.path.exists(dst_path) else "wb"
+    with open(src_path, "rb") as src, open(dst_path, mode) as dst:
+        src.seek(src_offset)
+        dst.seek(dst_offset)
+        while length is None or length > 0:
+            size = _COPY_BUFFER_SIZE
+            if length is not None:
+                size = min(size, length)
+                length -= size
+            buf = src.read(size)
+            if not buf:
+                break
+            dst.write(buf)
+
+
+def _merge_tree(src_path, dst_path):
+    """
+    Copy the directory `src_path` into `dst_path`, which may exist, like
+    `shutil.copytree(..., dirs_exist_ok=True)` of Python 3.8.
+    """
+    os.makedirs(dst_path, exist_ok=True)
+    for name in os.listdir(src_path):
+        src = os.path.join(src_path, name)
+        dst = os.path.join(dst_path, name)
+        if os.path.isdir(src):
+            _merge_tree(src, dst)
+        else:
+            shutil.copy2(src, dst)
+
+
+def _md5_range(path, offset, length):
+    md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while length > 0:
+            buf = f.read(min(_COPY_BUFFER_SIZE, length))
+            if not buf:
+                break
+            md5.update(buf)
+            length -= len(buf)
+    return md5.hexdigest()
+
+
+class _ChunkedTransfer:
+    """
+    Transfer a large file in parts of `chunk_size` bytes with `num_threads`
+    threads.
+
+    The file is stored as the directory `<fs_path>.paddle_parts`, which holds
+    the parts named `part-<index>.<md5>` and a MANIFEST of the size, the chunk
+    size and the md5s of the parts. A part is renamed to its name only after
+    it's written completely, and the MANIFEST is written after all the parts,
+    so an interrupted upload is resumed by skipping the parts whose md5s match
+    the local file. A download verifies the md5 of every part, and resumes by
+    skipping the parts of the partial local file which match the MANIFEST.
+
+    `chunk_size` is None for downloads, whose chunk size is read from the
+    MANIFEST. The file system implements `_write_part(local_path, offset, length,
+    fs_path)`, `_read_part(fs_path, local_path, offset)` and
+    `_read_manifest(fs_path)` besides the methods of FS.
+    """
+
+    def __init__(self, fs, chunk_size, num_threads, retry_times=2):
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(
+                f"chunk_size must be positive, but got {chunk_size}"
+            )
+        self._fs = fs
+        self._chunk_size = chunk_size
+        self._num_threads = max(num_threads, 1)
+        self._retry_times = retry_times
+
+    @staticmethod
+    def parts_path(fs_path):
+        return fs_path.rstrip("/") + _CHUNKED_SUFFIX
+
+    @staticmethod
+    def part_name(index, md5):
+        return f"part-{index:05d}.{md5}"
+
+    @staticmethod
+    def chunks(size, chunk_size):
+        return [
+            (offset, min(chunk_size, size - offset))
+            for offset in range(0, size, chunk_size)
+        ]
+
+    def _map(self, func, items):
+        if len(items) <= 1 or self._num_threads == 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self._num_threads, len(items))
+        ) as executor:
+            return list(executor.map(func, items))
+
+    def upload(self, local_path, fs_path):
+        size = os.path.getsize(local_path)
+        chunks = self.chunks(size, self._chunk_size)
+        md5s = self._map(lambda chunk: _md5_range(local_path, *chunk), chunks)
+        names = [self.part_name(i, md5) for i, md5 in enumerate(md5s)]
+
+        parts_path = self.parts_path(fs_path)
+        if self._fs.is_exist(parts_path):
+            _, files = self._fs.ls_dir(parts_path)
+        else:
+            self._fs.mkdirs(parts_path)
+            files = []
+        if _MANIFEST_NAME in files:
+            if set(names) <= set(files):
+                return
+            # the parts are changing, so the directory is incomplete until
+            # the new MANIFEST is written
+            self._fs.delete(f"{parts_path}/{_MANIFEST_NAME}")
+
+        def upload_part(index):
+            offset, length = chunks[index]
+            part_path = f"{parts_path}/{names[index]}"
+            self._fs._write_part(local_path, offset, length, part_path + ".tmp")
+            self._fs.mv(part_path + ".tmp", part_path, test_exists=False)
+
+        self._map(
+            upload_part, [i for i, n in enumerate(names) if n not in files]
+        )
+
+        # the parts of an older version of the file
+        for name in set(files) - set(names) - {_MANIFEST_NAME}:
+            self._fs.delete(f"{parts_path}/{name}")
+
+        manifest = {"size": size, "chunk_size": self._chunk_size, "parts": md5s}
+        fd, manifest_path = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(manifest, f)
+            self._fs._write_part(
+                manifest_path,
+                0,
+                os.path.getsize(manifest_path),
+                f"{parts_path}/{_MANIFEST_NAME}",
+            )
+        finally:
+            os.remove(manifest_path)
+
+    def download(self, fs_path, local_path):
+        parts_path = self.parts_path(fs_path)
+        manifest = self._fs._read_manifest(f"{parts_path}/{_MANIFEST_NAME}")
+        size, md5s = manifest["size"], manifest["parts"]
+        chunks = self.chunks(size, manifest["chunk_size"])
+
+        partial_path = local_path + ".partial"
+        with open(partial_path, "ab") as f:
+            f.truncate(size)
+
+        def download_part(index):
+            offset, length = chunks[index]
+            part_path = f"{parts_path}/{self.part_name(index, md5s[index])}"
+            for _ in range(self._retry_times + 1):
+                self._fs._read_part(part_path, partial_path, offset)
+                if _md5_range(partial_path, offset, length) == md5s[index]:
+                    return
+            raise FSChecksumError(f"{part_path} mismatches its md5")
+
+        done = self._map(lambda chunk: _md5_range(partial_path, *chunk), chunks)
+        self._map(
+            download_part, [i for i, md5 in enumerate(md5s) if done[i] != md5]
+        )
+        os.replace(partial_path, local_path)
+
+
 class LocalFS(FS):
     """
     A tool of local file system.
@@ -379,6 +568,125 @@ class LocalFS(FS):
 
         return dirs
 
+    def upload(self, local_path, fs_path, chunk_size=None, num_threads=8):
+        """
+        Copy the local path to `fs_path` like HDFSClient.upload, which is useful to
+        stage and test the uploads locally.
+
+        Args:
+            local_path(str): The local path.
+            fs_path(str): The destination path.
+            chunk_size(int|None): The files no smaller than `chunk_size` bytes are copied
+                in parts of `chunk_size` bytes, which are stored in `<fs_path>.paddle_parts`
+                with their md5s, so an interrupted copy is resumed from the copied parts.
+                Only the files directly under `local_path` are copied in parts, and None
+                means copying every file as a whole. Default is None.
+            num_threads(int): The number of threads to copy the parts of a file. Default is 8.
+
+        Examples:
+            .. code-block:: python
+
+                from paddle.distributed.fleet.utils import LocalFS
+
+                client = LocalFS()
+                client.touch("test_upload_src")
+                client.upload("test_upload_src", "test_upload_dst", chunk_size=1024)
+                client.delete("test_upload_src")
+                client.delete("test_upload_dst")
+        """
+        if not self.is_exist(local_path):
+            raise FSFileNotExistsError(f"{local_path} not exists")
+
+        if self.is_dir(local_path):
+            self.mkdirs(fs_path)
+            names = sorted(os.listdir(local_path))
+            srcs = [os.path.join(local_path, name) for name in names]
+            dsts = [os.path.join(fs_path, name) for name in names]
+        else:
+            srcs = [local_path]
+            if self.is_dir(fs_path):
+                fs_path = os.path.join(fs_path, os.path.basename(local_path))
+            dsts = [fs_path]
+
+        transfer = _ChunkedTransfer(self, chunk_size, num_threads)
+        for src, dst in zip(srcs, dsts):
+            chunked = (
+                chunk_size is not None
+                and os.path.isfile(src)
+                and os.path.getsize(src) >= chunk_size
+            )
+            # a file is stored either as a whole or in parts, so the other
+            # form is deleted for a download not to return a stale copy
+            self.delete(dst if chunked else transfer.parts_path(dst))
+            if os.path.isdir(src):
+                _merge_tree(src, dst)
+            elif chunked:
+                transfer.upload(src, dst)
+            else:
+                shutil.copyfile(src, dst)
+
+    def download(self, fs_path, local_path, num_threads=8):
+        """
+        Copy `fs_path` to the local path like HDFSClient.download, which joins the files
+        uploaded in parts.
+
+        Args:
+            fs_path(str): The source path.
+            local_path(str): The local path.
+            num_threads(int): The number of threads to copy the parts of a file. Default is 8.
+
+        Examples:
+            .. code-block:: python
+
+                from paddle.distributed.fleet.utils import LocalFS
+
+                client = LocalFS()
+                client.touch("test_download_src")
+                client.download("test_download_src", "test_download_dst")
+                client.delete("test_download_src")
+                client.delete("test_download_dst")
+        """
+        transfer = _ChunkedTransfer(self, None, num_threads)
+        if not self.is_exist(fs_path):
+            if not self.is_exist(transfer.parts_path(fs_path)):
+                raise FSFileNotExistsError(f"{fs_path} not exists")
+            if self.is_dir(local_path):
+                local_path = os.path.join(
+                    local_path, os.path.basename(fs_path.rstrip("/"))
+                )
+            return transfer.download(fs_path, local_path)
+
+        if self.is_file(fs_path):
+            if self.is_dir(local_path):
+                local_path = os.path.join(local_path, os.path.basename(fs_path))
+            shutil.copyfile(fs_path, local_path)
+            return
+
+        self.mkdirs(local_path)
+        for name in sorted(os.listdir(fs_path)):
+            src = os.path.join(fs_path, name)
+            if name.endswith(_CHUNKED_SUFFIX):
+                name = name[: -len(_CHUNKED_SUFFIX)]
+                transfer.download(
+                    os.path.join(fs_path, name), os.path.join(local_path, name)
+                )
+            elif os.path.isdir(src):
+                _merge_tree(src, os.path.join(local_path, name))
+            else:
+                shutil.copyfile(src, os.path.join(local_path, name))
+
+    def _write_part(self, local_path, offset, length, fs_path):
+        if os.path.exists(fs_path):
+            os.remove(fs_path)
+        _copy_range(local_path, offset, fs_path, 0, length)
+
+    def _read_part(self, fs_path, local_path, offset):
+        _copy_range(fs_path, 0, local_path, offset)
+
+    def _read_manifest(self, fs_path):
+        with open(fs_path) as f:
+            return json.load(f)
+
 
 def _handle_errors(max_time_out=None):
     def decorator(f):
@@ -421,6 +729,91 @@ def _handle_errors(max_time_out=None):
     return decorator
 
 
+class _MetadataCache:
+    """
+    The cache of the stat and ls results of remote paths, which expire after
+    ttl milliseconds. The entries of a path, its ancestors and descendants are
+    invalidated when the path is modified by the client.
+    """
+
+    # the stats of paths
+    DIR = 'dir'
+    FILE = 'file'
+    # exists, but whether it's a directory is unknown
+    EXIST = 'exist'
+    MISSING = 'missing'
+
+    def __init__(self, ttl):
+        self._ttl = float(ttl) / 1000.0
+        self._stats = {}
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self._ttl > 0
+
+    @staticmethod
+    def _key(fs_path):
+        return fs_path.rstrip('/') or fs_path
+
+    def _get(self, entries, fs_path):
+        with self._lock:
+            entry = entries.get(self._key(fs_path))
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del entries[self._key(fs_path)]
+                return None
+            return entry[1]
+
+    def _put(self, entries, fs_path, value):
+        if self.enabled:
+            with self._lock:
+                entries[self._key(fs_path)] = (time.time() + self._ttl, value)
+
+    def get_stat(self, fs_path):
+        return self._get(self._stats, fs_path)
+
+    def put_stat(self, fs_path, stat):
+        # a known type is not overwritten by EXIST
+        if stat == self.EXIST and self.get_stat(fs_path) in (
+            self.DIR,
+            self.FILE,
+        ):
+            return
+        self._put(self._stats, fs_path, stat)
+
+    def get_listing(self, fs_path):
+        listing = self._get(self._listings, fs_path)
+        if listing is None:
+            return None
+        dirs, files = listing
+        return list(dirs), list(files)
+
+    def put_listing(self, fs_path, dirs, files):
+        self._put(self._listings, fs_path, (list(dirs), list(files)))
+        self.put_stat(fs_path, self.DIR)
+        parent = self._key(fs_path)
+        for d in dirs:
+            self.put_stat(f"{parent}/{d}", self.DIR)
+        for f in files:
+            self.put_stat(f"{parent}/{f}", self.FILE)
+
+    def invalidate(self, *fs_paths):
+        with self._lock:
+            for fs_path in fs_paths:
+                key = self._key(fs_path)
+                for entries in (self._stats, self._listings):
+                    for k in list(entries):
+                        if (
+                            k == key
+                            or k.startswith(key + '/')
+                            or key.startswith(k + '/')
+                        ):
+                            del entries[k]
+
+
 class HDFSClient(FS):
     """
     A tool of HDFS.
@@ -429,6 +822,13 @@ class HDFSClient(FS):
         hadoop_home(str): Hadoop home.
         configs(dict): Hadoop config. It is a dictionary and needs to contain the
             keys: "fs.default.name" and "hadoop.job.ugi".
+        time_out(int): Timeout of retrying a command in milliseconds. Default is 5 minutes.
+        sleep_inter(int): Interval of retrying a command in milliseconds. Default is 1000.
+        cache_ttl(int): Time to live of the cached stat and ls results in milliseconds, 0 means
+            not caching. Every command starts a new hadoop process, so caching saves much time when
+            the same paths are checked repeatedly, but the changes made by other clients are not
+            visible until the cached results expire. The changes made by this client invalidate the
+            cached results of the changed paths. Default is 0.
 
     Examples:
 
@@ -451,8 +851,9 @@ class HDFSClient(FS):
         hadoop_home,
         configs,
         time_out=5 * 60 * 1000,  # ms
-        sleep_inter=1000,
-    ):  # ms
+        sleep_inter=1000,  # ms
+        cache_ttl=0,  # ms
+    ):
         self.pre_commands = []
         hadoop_bin = '%s/bin/hadoop' % hadoop_home
         self.pre_commands.append(hadoop_bin)
@@ -470,6 +871,7 @@ class HDFSClient(FS):
         self._bd_err_re = re.compile(
             r'\s?responseErrorMsg\s?\:.*, errorCode\:\s?[0-9]+, path\:'
         )
+        self._cache = _MetadataCache(cache_ttl)
 
     def _run_cmd(self, cmd, redirect_stderr=False, retry_times=5):
         exe_cmd = f"{self._base_cmd} -{cmd}"
@@ -487,6 +889,14 @@ class HDFSClient(FS):
 
         return ret, output.splitlines()
 
+    def _run_write_cmd(self, cmd, fs_paths, **kwargs):
+        # invalidated after the command, so that a lookup made while it
+        # runs can't cache the old metadata
+        try:
+            return self._run_cmd(cmd, **kwargs)
+        finally:
+            self._cache.invalidate(*fs_paths)
+
     @_handle_errors()
     def list_dirs(self, fs_path):
         """
@@ -552,6 +962,10 @@ class HDFSClient(FS):
         return self._ls_dir(fs_path)
 
     def _ls_dir(self, fs_path):
+        listing = self._cache.get_listing(fs_path)
+        if listing is not None:
+            return listing
+
         cmd = f"ls {fs_path}"
         ret, lines = self._run_cmd(cmd)
 
@@ -571,6 +985,7 @@ class HDFSClient(FS):
             else:
                 files.append(p)
 
+        self._cache.put_listing(fs_path, dirs, files)
         return dirs, files
 
     def _test_match(self, lines):
@@ -613,6 +1028,12 @@ class HDFSClient(FS):
         return self._is_dir(fs_path)
 
     def _is_dir(self, fs_path):
+        stat = self._cache.get_stat(fs_path)
+        if stat in (_MetadataCache.DIR, _MetadataCache.FILE):
+            return stat == _MetadataCache.DIR
+        if stat == _MetadataCache.MISSING:
+            return False
+
         cmd = f"test -d {fs_path}"
         ret, lines = self._run_cmd(cmd, redirect_stderr=True, retry_times=1)
         if ret:
@@ -622,8 +1043,12 @@ class HDFSClient(FS):
                 print('\n'.join(lines))
                 raise ExecuteError(cmd)
 
+            # the path is a file if it's known to exist
+            if stat == _MetadataCache.EXIST:
+                self._cache.put_stat(fs_path, _MetadataCache.FILE)
             return False
 
+        self._cache.put_stat(fs_path, _MetadataCache.DIR)
         return True
 
     def is_file(self, fs_path):
@@ -683,13 +1108,101 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 ret = client.is_exist("hdfs:/test_hdfs_client")
         """
+        stat = self._cache.get_stat(fs_path)
+        if stat is not None:
+            return stat != _MetadataCache.MISSING
+
         cmd = f"test -e {fs_path} "
         ret, out = self._run_cmd(cmd, redirect_stderr=True, retry_times=1)
         if ret != 0:
+            self._cache.put_stat(fs_path, _MetadataCache.MISSING)
             return False
 
+        self._cache.put_stat(fs_path, _MetadataCache.EXIST)
         return True
 
+    def prefetch(self, fs_paths, list_dirs=True, num_threads=8):
+        """
+        Fetch the stats of the remote HDFS paths by one hadoop command, and list the directories
+        among them in parallel if `list_dirs` is true, the results are cached for `cache_ttl`
+        milliseconds. So the following `is_exist`, `is_dir`, `is_file`, `ls_dir` and `list_dirs`
+        of these paths and the listed ones don't start new hadoop processes.
+        It does nothing if `cache_ttl` of the client is 0.
+
+        Args:
+            fs_paths(list): The HDFS paths.
+            list_dirs(bool): Whether to list the directories. Default is true.
+            num_threads(int): The number of hadoop processes to list the directories at the same
+                time. Default is 8.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs, cache_ttl=60 * 1000)
+                client.prefetch(["hdfs:/ckpt/0", "hdfs:/ckpt/1"])
+                subdirs = client.list_dirs("hdfs:/ckpt/0")
+        """
+        if not self._cache.enabled or not fs_paths:
+            return
+
+        self._stat_paths(fs_paths)
+        if not list_dirs:
+            return
+
+        dirs = [
+            p
+            for p in fs_paths
+            if self._cache.get_stat(p) == _MetadataCache.DIR
+            and self._cache.get_listing(p) is None
+        ]
+        if len(dirs) == 1:
+            self._ls_dir(dirs[0])
+        elif dirs:
+            with ThreadPoolExecutor(max(min(num_threads, len(dirs)), 1)) as e:
+                # raise the errors of listing
+                list(e.map(self._ls_dir, dirs))
+
+    @_handle_errors()
+    def _stat_paths(self, fs_paths):
+        # `ls -d` prints the paths as they are given, and reports the missing
+        # ones in stderr, so the stats of many paths are fetched by one command
+        cmd = "ls -d " + " ".join(fs_paths)
+        # fails if any path is missing, so not retried
+        ret, lines = self._run_cmd(cmd, redirect_stderr=True, retry_times=0)
+        if ret != 0 and self._test_match(lines):
+            raise ExecuteError(cmd)
+
+        keys = {_MetadataCache._key(p): p for p in fs_paths}
+        stats = {}
+        for line in lines:
+            arr = line.split()
+            if len(arr) == 8 and _MetadataCache._key(arr[7]) in keys:
+                stat = (
+                    _MetadataCache.DIR
+                    if arr[0][0] == 'd'
+                    else _MetadataCache.FILE
+                )
+                path = keys.pop(_MetadataCache._key(arr[7]))
+                stats[path] = stat
+                self._cache.put_stat(path, stat)
+            elif "No such file or directory" in line:
+                for key in list(keys):
+                    if f"`{keys[key]}'" in line or f"`{key}'" in line:
+                        path = keys.pop(key)
+                        stats[path] = _MetadataCache.MISSING
+                        self._cache.put_stat(path, _MetadataCache.MISSING)
+        # the paths printed in other forms are checked one by one later
+        return stats
+
     def upload_dir(self, local_dir, dest_dir, overwrite=False):
         """
         upload dir to hdfs
@@ -710,7 +1223,15 @@ class HDFSClient(FS):
         self._try_upload(local_dir, dest_dir)
 
     # can't retry
-    def upload(self, local_path, fs_path, multi_processes=5, overwrite=False):
+    def upload(
+        self,
+        local_path,
+        fs_path,
+        multi_processes=5,
+        overwrite=False,
+        chunk_size=None,
+        num_threads=8,
+    ):
         """
         Upload the local path to remote HDFS.
 
@@ -719,6 +1240,14 @@ class HDFSClient(FS):
             fs_path(str): The HDFS path.
             multi_processes(int|1): the upload data process at the same time, default=5
             overwrite(bool|False): will overwrite file on HDFS or not
+            chunk_size(int|None): The files no smaller than `chunk_size` bytes are uploaded
+                in parts of `chunk_size` bytes by `num_threads` threads, which are stored in
+                `<fs_path>.paddle_parts` with their md5s, and are joined by `download`. An
+                interrupted upload is resumed from the uploaded parts. Only the files directly
+                under `local_path` are uploaded in parts, and `fs_path` is created as a
+                directory when `local_path` is a directory. None means uploading every file
+                as a whole. Default is None.
+            num_threads(int): The number of threads to upload the parts of a file. Default is 8.
 
         Examples:
 
@@ -774,6 +1303,23 @@ class HDFSClient(FS):
             self.delete(fs_path)
             self.mkdirs(fs_path)
 
+        large_files = []
+        if chunk_size is not None:
+            large_files = [
+                f
+                for f in all_files
+                if os.path.isfile(f) and os.path.getsize(f) >= chunk_size
+            ]
+            if os.path.isdir(local_path):
+                self.mkdirs(fs_path)
+        dsts = self._upload_paths(local_path, fs_path, all_files, large_files)
+        if large_files:
+            transfer = _ChunkedTransfer(self, chunk_size, num_threads)
+            for f, dst in zip(all_files, dsts):
+                if f in large_files:
+                    transfer.upload(f, dst)
+            all_files = [f for f in all_files if f not in large_files]
+
         procs = []
         for i in range(multi_processes):
             process_datas = self._split_files(all_files, i, multi_processes)
@@ -786,13 +1332,54 @@ class HDFSClient(FS):
         # complete the processes
         for proc in procs:
             proc.join()
+        # the files are uploaded by the subprocesses, so their caches are lost
+        self._cache.invalidate(fs_path)
+
+    def _upload_paths(self, local_path, fs_path, local_files, large_files):
+        """
+        Return the HDFS paths of `local_files` uploaded from `local_path` to `fs_path`.
+
+        A file is stored either as a whole or in parts, so the other form of each path,
+        i.e. `<path>.paddle_parts` of a file uploaded as a whole or `<path>` of one of
+        `large_files` uploaded in parts, is deleted for a download not to return a stale
+        copy. The stats of all the paths are fetched by one hadoop command.
+        """
+        in_dir = [fs_path + "/" + os.path.basename(f) for f in local_files]
+        paths = [fs_path] + in_dir
+        stats = self._stat_paths(
+            paths + [_ChunkedTransfer.parts_path(p) for p in paths]
+        )
+
+        def stat(path):
+            # the paths printed in other forms are checked one by one
+            if path not in stats:
+                if not self.is_exist(path):
+                    stats[path] = _MetadataCache.MISSING
+                elif self.is_dir(path):
+                    stats[path] = _MetadataCache.DIR
+                else:
+                    stats[path] = _MetadataCache.FILE
+            return stats[path]
+
+        if os.path.isdir(local_path) or stat(fs_path) == _MetadataCache.DIR:
+            dsts = in_dir
+        else:
+            dsts = [fs_path] * len(local_files)
+        for f, dst in zip(local_files, dsts):
+            if f not in large_files:
+                dst = _ChunkedTransfer.parts_path(dst)
+            if stat(dst) == _MetadataCache.DIR:
+                self._rmr(dst)
+            elif stat(dst) != _MetadataCache.MISSING:
+                self._rm(dst)
+        return dsts
 
     @_handle_errors()
     def _try_upload(self, local_path, fs_path):
         cmd = f"put {local_path} {fs_path}"
         ret = 0
         try:
-            ret, _ = self._run_cmd(cmd)
+            ret, _ = self._run_write_cmd(cmd, [fs_path])
             if ret != 0:
                 raise ExecuteError(cmd)
         except Exception as e:
@@ -800,15 +1387,27 @@ class HDFSClient(FS):
             raise e
 
     # can't retry
-    def download(self, fs_path, local_path, multi_processes=5, overwrite=False):
+    def download(
+        self,
+        fs_path,
+        local_path,
+        multi_processes=5,
+        overwrite=False,
+        num_threads=8,
+    ):
         """
         Download remote HDFS path to the local.
 
+        The files uploaded in parts are downloaded in parts by `num_threads` threads,
+        which are verified by their md5s, and an interrupted download is resumed from
+        the downloaded parts.
+
         Args:
             fs_path(str):  The HDFS path.
             local_path(str): The local path.
             multi_processes(int|1): the download data process at the same time, default=1
             overwrite(bool): is overwrite
+            num_threads(int): The number of threads to download the parts of a file. Default is 8.
 
         Examples:
 
@@ -836,13 +1435,29 @@ class HDFSClient(FS):
             for data in datas:
                 self._try_download(data, local_path)
 
+        transfer = _ChunkedTransfer(self, None, num_threads)
         if not self.is_exist(fs_path):
-            raise FSFileNotExistsError(f"{fs_path} not exits")
+            if not self.is_exist(transfer.parts_path(fs_path)):
+                raise FSFileNotExistsError(f"{fs_path} not exits")
+            # download file uploaded in parts
+            if os.path.isdir(local_path):
+                local_path = os.path.join(
+                    local_path, os.path.basename(fs_path.rstrip("/"))
+                )
+            return transfer.download(fs_path, local_path)
         # download file
         if self.is_file(fs_path):
             return self._try_download(fs_path, local_path)
         # download dir
         dirs, all_filenames = self.ls_dir(fs_path)
+        chunked_files = [
+            d[: -len(_CHUNKED_SUFFIX)]
+            for d in dirs
+            if d.endswith(_CHUNKED_SUFFIX)
+        ]
+        dirs = [d for d in dirs if not d.endswith(_CHUNKED_SUFFIX)]
+        if chunked_files:
+            os.makedirs(local_path, exist_ok=True)
         all_files = [fs_path + "/" + i for i in all_filenames]
         all_files.extend([fs_path + "/" + i for i in dirs])
         procs = []
@@ -858,6 +1473,9 @@ class HDFSClient(FS):
         for proc in procs:
             proc.join()
 
+        for f in chunked_files:
+            transfer.download(fs_path + "/" + f, os.path.join(local_path, f))
+
     @_handle_errors()
     def _try_download(self, fs_path, local_path):
         cmd = f"get {fs_path} {local_path}"
@@ -871,6 +1489,35 @@ class HDFSClient(FS):
             local_fs.delete(local_path)
             raise e
 
+    @_handle_errors()
+    def _write_part(self, local_path, offset, length, fs_path):
+        fd, part_path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            _copy_range(local_path, offset, part_path, 0, length)
+            cmd = f"put -f {part_path} {fs_path}"
+            ret, _ = self._run_write_cmd(cmd, [fs_path])
+            if ret != 0:
+                raise ExecuteError(cmd)
+        finally:
+            os.remove(part_path)
+
+    @_handle_errors()
+    def _read_part(self, fs_path, local_path, offset):
+        part_dir = tempfile.mkdtemp()
+        part_path = os.path.join(part_dir, "part")
+        try:
+            cmd = f"get {fs_path} {part_path}"
+            ret, _ = self._run_cmd(cmd)
+            if ret != 0:
+                raise ExecuteError(cmd)
+            _copy_range(part_path, 0, local_path, offset)
+        finally:
+            shutil.rmtree(part_dir)
+
+    def _read_manifest(self, fs_path):
+        return json.loads("\n".join(self._try_cat(fs_path)))
+
     @_handle_errors()
     def mkdirs(self, fs_path):
         """
@@ -900,7 +1547,7 @@ class HDFSClient(FS):
         out_hdfs = False
 
         cmd = f"mkdir {fs_path} "
-        ret, out = self._run_cmd(cmd, redirect_stderr=True)
+        ret, out = self._run_write_cmd(cmd, [fs_path], redirect_stderr=True)
         if ret != 0:
             for l in out:
                 if "No such file or directory" in l:
@@ -911,7 +1558,7 @@ class HDFSClient(FS):
 
         if out_hdfs and not self.is_exist(fs_path):
             cmd = f"mkdir -p {fs_path}"
-            ret, _ = self._run_cmd(cmd)
+            ret, _ = self._run_write_cmd(cmd, [fs_path])
             if ret != 0:
                 raise ExecuteError(cmd)
 
@@ -957,7 +1604,9 @@ class HDFSClient(FS):
         cmd = f"mv {fs_src_path} {fs_dst_path}"
         ret = 0
         try:
-            ret, _ = self._run_cmd(cmd, retry_times=1)
+            ret, _ = self._run_write_cmd(
+                cmd, [fs_src_path, fs_dst_path], retry_times=1
+            )
             if ret != 0:
                 raise ExecuteError(cmd)
         except Exception as e:
@@ -967,13 +1616,13 @@ class HDFSClient(FS):
 
     def _rmr(self, fs_path):
         cmd = f"rmr {fs_path}"
-        ret, _ = self._run_cmd(cmd)
+        ret, _ = self._run_write_cmd(cmd, [fs_path])
         if ret != 0:
             raise ExecuteError(cmd)
 
     def _rm(self, fs_path):
         cmd = f"rm {fs_path}"
-        ret, _ = self._run_cmd(cmd)
+        ret, _ = self._run_write_cmd(cmd, [fs_path])
         if ret != 0:
             raise ExecuteError(cmd)
 
@@ -1043,7 +1692,7 @@ class HDFSClient(FS):
     @_handle_errors()
     def _touchz(self, fs_path):
         cmd = f"touchz {fs_path}"
-        ret, _ = self._run_cmd(cmd)
+        ret, _ = self._run_write_cmd(cmd, [fs_path])
         if ret != 0:
             raise ExecuteError(cmd)
 
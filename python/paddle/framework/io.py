@@ -37,6 +37,7 @@ from paddle.base.framework import (
     in_dygraph_mode,
 )
 
+from .io_stream import _is_stream_format, _stream_load, _stream_save
 from .io_utils import (
     _is_file_path,
     _is_memory_buffer,
@@ -230,6 +231,9 @@ def _parse_load_config(configs):
         'params_filename',
         'keep_name_table',
         'return_numpy',
+        'mmap',
+        'lazy',
+        'keys',
     ]
 
     # input check
@@ -250,12 +254,15 @@ def _parse_load_config(configs):
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
     inner_config.return_numpy = configs.get('return_numpy', False)
+    inner_config.mmap = configs.get('mmap', False)
+    inner_config.lazy = configs.get('lazy', False)
+    inner_config.keys = configs.get('keys', None)
 
     return inner_config
 
 
 def _parse_save_config(configs):
-    supported_configs = ['use_binary_format', 'pickle_protocol']
+    supported_configs = ['use_binary_format', 'pickle_protocol', 'format']
 
     # input check
     for key in configs:
@@ -273,6 +280,13 @@ def _parse_save_config(configs):
     inner_config = _SaveLoadConfig()
     inner_config.use_binary_format = configs.get('use_binary_format', False)
     inner_config.pickle_protocol = configs.get('pickle_protocol', None)
+    inner_config.format = configs.get('format', 'pickle')
+
+    if inner_config.format not in ['pickle', 'stream']:
+        raise ValueError(
+            "The `format` of `paddle.save` should be 'pickle' or 'stream', "
+            f"but received {inner_config.format}."
+        )
 
     return inner_config
 
@@ -673,6 +687,10 @@ def save(obj, path, protocol=4, **configs):
           use_binary_format(bool): When the saved object is static graph variable, you can specify ``use_binary_for_var``.
           If True, save the file in the c++ binary format when saving a single static graph variable; otherwise, save it in pickle format.
           Default: False
+          format(str): 'pickle' or 'stream'. If 'stream', save the object in the stream format, a json header of
+          tensor dtypes, shapes and offsets followed by raw tensor bytes, tensors are copied to host and written
+          one by one, so the peak host memory is about the size of the largest tensor, and the saved file can be
+          loaded with memory map, lazily or partially by ``paddle.load``. Default: 'pickle'
 
     Returns:
         None
@@ -777,6 +795,14 @@ def save(obj, path, protocol=4, **configs):
             >>> tensor = paddle.randn([2, 3], dtype='float32')
             >>> paddle.save(tensor, byio)
 
+        .. code-block:: python
+            :name: code-example-6
+
+            >>> # example 6: save state_dict in the stream format
+            >>> import paddle
+            >>> linear = paddle.nn.Linear(5, 10)
+            >>> paddle.save(linear.state_dict(), "linear.pdparams", format='stream')
+
     '''
     if _is_file_path(path):
         # 1. input check
@@ -823,6 +849,10 @@ def save(obj, path, protocol=4, **configs):
             with _open_file_buffer(path, "wb") as f:
                 f.write(obj.desc.serialize_to_string())
 
+        elif config.format == 'stream':
+            with _open_file_buffer(path, 'wb') as f:
+                _stream_save(obj, f, protocol)
+
         elif _is_state_dict(obj):
             if in_dygraph_mode():
                 _legacy_save(obj, path, protocol)
@@ -935,6 +965,13 @@ def load(path, **configs):
             by default.
             (3) return_numpy(bool): If specified as True, return tensor as numpy.ndarray, otherwise return tensor as paddle.Tensor.
             Default False.
+            The following options are only supported for files saved with ``format='stream'`` by ``paddle.save`` ,
+            whose format is detected automatically:
+            (4) mmap(bool): If True, read tensors from memory map of the file, returned numpy.ndarray are read-only and
+            share memory with the file if ``return_numpy`` is True. Default False.
+            (5) lazy(bool): If True, return a read-only dict whose values are read from the file when accessed,
+            the file is closed by its ``close`` method. Only supported for saved dict. Default False.
+            (6) keys(list): Only load the given keys of the saved dict. Default None, which means loading all keys.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -1053,10 +1090,32 @@ def load(path, **configs):
             >>> # load state_dict
             >>> dict_load = paddle.load(byio)
 
+        .. code-block:: python
+            :name: code-example-6
+
+            >>> # example 6: load state_dict saved in the stream format
+            >>> import paddle
+            >>> linear = paddle.nn.Linear(5, 10)
+            >>> paddle.save(linear.state_dict(), "linear.pdparams", format='stream')
+            >>> weight = paddle.load("linear.pdparams", keys=['weight'])['weight']
+            >>> with paddle.load("linear.pdparams", mmap=True, lazy=True) as state_dict:
+            ...     bias = state_dict['bias']
+
     '''
 
     if _is_memory_buffer(path) or os.path.isfile(path):
         config = _parse_load_config(configs)
+        if _is_stream_format(path):
+            return _stream_load(
+                path,
+                config,
+                lambda array: _ndarray_to_tensor(array, config.return_numpy),
+            )
+        if config.mmap or config.lazy or config.keys is not None:
+            raise ValueError(
+                "`mmap`, `lazy` and `keys` of `paddle.load` are only supported "
+                "for files saved with format='stream' by `paddle.save`."
+            )
         exception_type = pickle.UnpicklingError
         try:
             with _open_file_buffer(path, 'rb') as f:
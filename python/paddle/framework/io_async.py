@@ -0,0 +1,292 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from paddle.base import core
+from paddle.base.framework import in_dygraph_mode
+
+from .io import save
+from .io_utils import _is_file_path
+
+__all__ = []
+
+# max number of saves which are snapshotted but not finished writing
+MAX_IN_FLIGHT_SAVES = 2
+
+
+def _snapshot(obj):
+    """
+    Copy tensors in obj to host memory, so following in-place updates of
+    training will not change the saved values.
+    """
+    if isinstance(obj, core.eager.Tensor):
+        if obj.type == core.VarDesc.VarType.VOCAB or not obj._is_initialized():
+            # not copyable, left to `paddle.save` to save or raise error
+            return obj
+        # NOTE: `Tensor.cpu` returns itself for CPU tensor, which is still
+        #       shared with training, so copy it explicitly
+        snapshot = obj._copy_to(core.CPUPlace(), True)
+        snapshot.name = obj.name
+        snapshot.stop_gradient = obj.stop_gradient
+        snapshot.persistable = obj.persistable
+        return snapshot
+    elif isinstance(obj, core.LoDTensor):
+        return np.array(obj)
+    elif isinstance(obj, np.ndarray):
+        return obj.copy()
+    elif isinstance(obj, dict):
+        result = type(obj)() if type(obj) is not dict else {}
+        for k, v in obj.items():
+            result[k] = _snapshot(v)
+        return result
+    elif isinstance(obj, (list, tuple)):
+        result = [_snapshot(v) for v in obj]
+        return type(obj)(result) if isinstance(obj, tuple) else result
+    return obj
+
+
+class AsyncSaveTask:
+    """
+    Handle of a save issued by :code:`AsyncSaver.save` or
+    :code:`paddle.async_save`.
+    """
+
+    def __init__(self, path, future):
+        self.path = path
+        self._future = future
+
+    def done(self):
+        """
+        Whether the save finished, successfully or not.
+        """
+        return self._future.done()
+
+    def _succeeded(self):
+        return self._future.done() and self._future.exception() is None
+
+    def wait(self, timeout=None):
+        """
+        Wait until the file is written and renamed to :attr:`path`, the
+        exception raised in saving will be raised here.
+
+        Args:
+            timeout(float|None): seconds to wait, None for no limit.
+        """
+        self._future.result(timeout)
+
+
+class AsyncSaver:
+    """
+    Save objects with :code:`paddle.save` in a background thread.
+
+    :code:`save` copies tensors of the object to host memory and returns
+    immediately, serialization and writing are done in the background
+    thread. The file is written to a temporary file in the same directory,
+    flushed to disk and renamed to the target path atomically, so the target
+    path is either the old file or the complete new one.
+
+    Args:
+        max_in_flight(int, optional): max number of saves which are
+            snapshotted but not finished writing, :code:`save` blocks until
+            an earlier save finished if reached, which bounds the host
+            memory used by snapshots. Default 2.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> from paddle.framework import AsyncSaver
+
+            >>> linear = paddle.nn.Linear(5, 10)
+            >>> saver = AsyncSaver(max_in_flight=1)
+            >>> task = saver.save(linear.state_dict(), "linear.pdparams")
+            >>> # training goes on while saving
+            >>> task.wait()
+            >>> saver.wait()
+    """
+
+    def __init__(self, max_in_flight=MAX_IN_FLIGHT_SAVES):
+        assert max_in_flight > 0, "max_in_flight should be positive"
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        # single writer thread, saves are finished in issued order
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="paddle_async_save"
+        )
+        self._lock = threading.Lock()
+        self._tasks = []
+
+    def save(self, obj, path, protocol=4, **configs):
+        """
+        Save obj to path in the background, arguments are the same as
+        :code:`paddle.save` except that path should be a file path.
+
+        Returns:
+            AsyncSaveTask, handle of the save.
+        """
+        # NOTE: dygraph mode is thread local, saving in the background
+        #       thread may take a different mode from the caller
+        if not in_dygraph_mode():
+            raise ValueError(
+                "Async save is only supported in dynamic graph mode."
+            )
+        if not _is_file_path(path):
+            raise ValueError(
+                f"Async save only supports saving to file, but got {type(path)}"
+            )
+        if os.path.basename(path) == "":
+            raise ValueError(
+                "The input path MUST be format of dirname/filename "
+                "[dirname\\filename in Windows system], but received "
+                "filename is empty string."
+            )
+
+        self._slots.acquire()
+        try:
+            snapshot = _snapshot(obj)
+            future = self._executor.submit(
+                self._save, snapshot, path, protocol, configs
+            )
+        except:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+
+        task = AsyncSaveTask(path, future)
+        with self._lock:
+            # keep failed saves to raise their exceptions in `wait`
+            self._tasks = [t for t in self._tasks if not t._succeeded()]
+            self._tasks.append(task)
+        return task
+
+    def _save(self, obj, path, protocol, configs):
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+        try:
+            save(obj, tmp_path, protocol, **configs)
+            with open(tmp_path, 'rb') as f:
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def pending(self):
+        """
+        Number of saves not finished.
+        """
+        with self._lock:
+            return len([t for t in self._tasks if not t.done()])
+
+    def wait(self, timeout=None):
+        """
+        Wait until all issued saves finished, the first exception raised in
+        saving will be raised here after waiting for all the saves. Saves
+        not finished in timeout are still tracked by the next :code:`wait`.
+
+        Args:
+            timeout(float|None): seconds to wait for each save, None for no
+                limit.
+        """
+        with self._lock:
+            tasks = list(self._tasks)
+        error = None
+        for task in tasks:
+            try:
+                task.wait(timeout)
+            except Exception as e:
+                if error is None:
+                    error = e
+                if not task.done():
+                    continue
+            with self._lock:
+                if task in self._tasks:
+                    self._tasks.remove(task)
+        if error is not None:
+            raise error
+
+
+_default_saver = None
+_default_saver_lock = threading.Lock()
+
+
+def _get_default_saver():
+    global _default_saver
+    with _default_saver_lock:
+        if _default_saver is None:
+            _default_saver = AsyncSaver()
+        return _default_saver
+
+
+def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
+    '''
+    Save an object to the specified path asynchronously.
+
+    Tensors in the object are copied to host memory and this API returns
+    immediately, then the object is saved by :code:`paddle.save` in a
+    background thread, written to a temporary file and renamed to ``path``
+    atomically. At most 2 saves are in flight, further calls block until an
+    earlier save finished, see :code:`paddle.framework.AsyncSaver` to set it.
+
+    Note:
+        Only supported in dynamic graph mode. Only tensors, numpy.ndarray and
+        their containers (dict, list, tuple) are snapshotted, other objects in
+        ``obj`` should not be modified before the save finished.
+
+    Args:
+        obj(Object) : The object to be saved.
+        path(str) : The file path of the object to be saved.
+        protocol(int, optional): The protocol version of pickle module must be greater than 1 and less than 5.
+                                 Default: 4
+        sync_other_task(bool, optional): Whether to wait for earlier saves to
+            finish before this save. Default: False.
+        **configs(dict, optional): optional keyword arguments of :code:`paddle.save`.
+
+    Returns:
+        AsyncSaveTask, a handle whose ``wait`` method blocks until the save finished.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> emb = paddle.nn.Embedding(10, 10)
+            >>> task = paddle.async_save(emb.state_dict(), "emb.pdparams")
+            >>> task.wait()
+            >>> # or wait for all asynchronous saves
+            >>> paddle.clear_async_save_task_queue()
+    '''
+    saver = _get_default_saver()
+    if sync_other_task:
+        saver.wait()
+    return saver.save(obj, path, protocol, **configs)
+
+
+def clear_async_save_task_queue():
+    '''
+    Wait until all saves issued by :code:`paddle.async_save` finished, the
+    first exception raised in saving will be raised here.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> emb = paddle.nn.Embedding(10, 10)
+            >>> paddle.async_save(emb.state_dict(), "emb.pdparams")
+            >>> paddle.clear_async_save_task_queue()
+    '''
+    _get_default_saver().wait()
@@ -0,0 +1,388 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Streaming format of `paddle.save` / `paddle.load`, the layout of a saved
+# object is:
+#
+#   | MAGIC(8 bytes) | header length(uint64, little endian) | header(json) |
+#   | skeleton(pickle) | tensor 0 | tensor 1 | ...
+#
+# header is padded by spaces to make the data region start aligned, offsets
+# in header are relative to the start of the data region, and each tensor is
+# saved as its raw bytes aligned to `ALIGNMENT`. skeleton is the pickled
+# object with tensors replaced by `_TensorRef`, which is small in general.
+#
+# Tensors are copied to host and written one by one when saving, and can be
+# read one by one, from memory map or lazily when loading.
+
+import collections
+import json
+import mmap
+import pickle
+import struct
+from collections.abc import Mapping
+
+import numpy as np
+
+from paddle.base import core
+from paddle.base.data_feeder import convert_dtype
+
+from .io_utils import _is_file_path, _is_memory_buffer
+
+__all__ = []
+
+MAGIC = b'PDSTREAM'
+VERSION = 1
+ALIGNMENT = 64
+# write in chunks to avoid the bug of writing large bytes on MAC python3
+_MAX_WRITE_BYTES = 2**30
+
+_HEADER_LEN = struct.Struct('<Q')
+_PREFIX_SIZE = len(MAGIC) + _HEADER_LEN.size
+
+
+class _TensorRef:
+    def __init__(self, key):
+        self.key = key
+
+
+def _align(size):
+    return (size + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _is_tensor(obj):
+    return isinstance(obj, (core.eager.Tensor, core.LoDTensor, np.ndarray))
+
+
+def _tensor_meta(value):
+    if isinstance(value, np.ndarray):
+        return value.dtype, list(value.shape), None
+    if isinstance(value, core.LoDTensor):
+        return np.dtype(convert_dtype(value._dtype())), value.shape(), None
+
+    if value.type == core.VarDesc.VarType.VOCAB:
+        raise ValueError(
+            "Saving vocab tensor is not supported in the stream format, "
+            "please use format='pickle' instead."
+        )
+    if not value.value().get_tensor()._is_initialized():
+        raise ValueError(
+            "The saved tensor is not initialized. If you used group sharded, please use save_group_sharded_model."
+        )
+    return np.dtype(convert_dtype(value.dtype)), list(value.shape), value.name
+
+
+def _to_numpy(value):
+    if isinstance(value, core.eager.Tensor):
+        value = value.cpu()
+    return np.ascontiguousarray(np.asarray(value))
+
+
+def _extract_tensors(obj, prefix, tensors):
+    """
+    Replace tensors in obj by _TensorRef, and collect (key, tensor) pairs
+    into tensors. Key of a tensor is its path in obj joined by '/'.
+    """
+    if _is_tensor(obj):
+        key = prefix
+        index = 1
+        while key in tensors:
+            key = f"{prefix}#{index}"
+            index += 1
+        tensors[key] = obj
+        return _TensorRef(key)
+    elif isinstance(obj, dict):
+        skeleton = type(obj)() if type(obj) is not dict else {}
+        for k, v in obj.items():
+            path = str(k) if prefix == '' else f"{prefix}/{k}"
+            skeleton[k] = _extract_tensors(v, path, tensors)
+        return skeleton
+    elif isinstance(obj, (list, tuple)):
+        skeleton = [
+            _extract_tensors(v, f"{prefix}/{i}", tensors)
+            for i, v in enumerate(obj)
+        ]
+        return type(obj)(skeleton) if isinstance(obj, tuple) else skeleton
+    return obj
+
+
+def _write_buffer(f, buffer):
+    buffer = memoryview(buffer).cast('B')
+    for start in range(0, len(buffer), _MAX_WRITE_BYTES):
+        f.write(buffer[start : start + _MAX_WRITE_BYTES])
+
+
+def _stream_save(obj, f, protocol):
+    """
+    Save obj to the binary file object f in the stream format.
+    """
+    tensors = collections.OrderedDict()
+    skeleton = pickle.dumps(
+        _extract_tensors(obj, '', tensors), protocol=protocol
+    )
+
+    entries = collections.OrderedDict()
+    offset = _align(len(skeleton))
+    for key, value in tensors.items():
+        dtype, shape, name = _tensor_meta(value)
+        nbytes = int(np.prod(shape, dtype='int64')) * dtype.itemsize
+        entries[key] = {
+            'dtype': dtype.str,
+            'shape': shape,
+            'offset': offset,
+            'nbytes': nbytes,
+            'name': name,
+        }
+        offset = _align(offset + nbytes)
+
+    header = json.dumps(
+        {
+            'version': VERSION,
+            'alignment': ALIGNMENT,
+            'skeleton': {'offset': 0, 'nbytes': len(skeleton)},
+            'tensors': entries,
+            'data_nbytes': offset,
+        }
+    ).encode('utf-8')
+    header += b' ' * (
+        _align(_PREFIX_SIZE + len(header)) - _PREFIX_SIZE - len(header)
+    )
+    header_len = len(header)
+
+    f.write(MAGIC)
+    f.write(_HEADER_LEN.pack(header_len))
+    f.write(header)
+    f.write(skeleton)
+    position = len(skeleton)
+    for key, value in tensors.items():
+        entry = entries[key]
+        f.write(b'\0' * (entry['offset'] - position))
+        # only one tensor is copied to host at a time
+        _write_buffer(f, _to_numpy(value).reshape(-1).view(np.uint8))
+        position = entry['offset'] + entry['nbytes']
+    f.write(b'\0' * (offset - position))
+
+
+def _is_stream_format(path):
+    if _is_memory_buffer(path):
+        position = path.tell()
+        magic = path.read(len(MAGIC))
+        path.seek(position)
+    elif _is_file_path(path):
+        with open(path, 'rb') as f:
+            magic = f.read(len(MAGIC))
+    else:
+        return False
+    return magic == MAGIC
+
+
+class _StreamReader:
+    """
+    Read skeleton and tensors of an object saved in the stream format
+    from a file path or a BytesIO.
+    """
+
+    def __init__(self, path, use_mmap=False):
+        self._buffer = None
+        if _is_memory_buffer(path):
+            base = path.tell()
+            self._file = path
+            self._own_file = False
+        else:
+            base = 0
+            self._file = open(path, 'rb')
+            self._own_file = True
+
+        prefix = self._read(base, _PREFIX_SIZE)
+        if prefix[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not saved in the stream format.")
+        (header_len,) = _HEADER_LEN.unpack(prefix[len(MAGIC) :])
+        self.header = json.loads(
+            self._read(base + _PREFIX_SIZE, header_len).decode('utf-8')
+        )
+        if self.header['version'] > VERSION:
+            raise ValueError(
+                f"The stream format version {self.header['version']} of "
+                f"{path} is not supported, please upgrade paddle."
+            )
+        self._data_start = base + _PREFIX_SIZE + header_len
+        self.end = self._data_start + self.header['data_nbytes']
+
+        if use_mmap and self._own_file:
+            self._buffer = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            # memory map is still valid after file closed
+            self.close()
+
+        skeleton = self.header['skeleton']
+        self.skeleton = pickle.loads(
+            self._read(
+                self._data_start + skeleton['offset'], skeleton['nbytes']
+            )
+        )
+
+    def _read(self, offset, nbytes):
+        if self._buffer is not None:
+            return bytes(self._buffer[offset : offset + nbytes])
+        self._file.seek(offset)
+        data = self._file.read(nbytes)
+        if len(data) != nbytes:
+            raise ValueError("The file saved in the stream format is broken.")
+        return data
+
+    def tensor_keys(self):
+        return list(self.header['tensors'].keys())
+
+    def read_tensor(self, key):
+        """
+        Read the tensor of key as numpy.ndarray, which is read-only and
+        shares memory with the memory map if loaded with mmap.
+        """
+        entry = self.header['tensors'][key]
+        dtype = np.dtype(entry['dtype'])
+        count = entry['nbytes'] // dtype.itemsize
+        offset = self._data_start + entry['offset']
+        if self._buffer is not None:
+            array = np.frombuffer(
+                self._buffer, dtype=dtype, count=count, offset=offset
+            )
+        else:
+            array = np.empty([count], dtype=dtype)
+            self._file.seek(offset)
+            if self._file.readinto(array.view(np.uint8)) != entry['nbytes']:
+                raise ValueError(
+                    "The file saved in the stream format is broken."
+                )
+        return array.reshape(entry['shape'])
+
+    def tensor_name(self, key):
+        return self.header['tensors'][key]['name']
+
+    def close(self):
+        if self._file is None:
+            return
+        if self._own_file:
+            self._file.close()
+        else:
+            # move to the end of this object, so following objects saved in
+            # the same buffer can be loaded then
+            self._file.seek(self.end)
+        self._file = None
+
+
+def _resolve(skeleton, reader, convert_fn):
+    if isinstance(skeleton, _TensorRef):
+        tensor = convert_fn(reader.read_tensor(skeleton.key))
+        name = reader.tensor_name(skeleton.key)
+        # default name is "generatedxxx" which is set in Tensor init
+        if name and getattr(tensor, "name", ""):
+            tensor.name = name
+        return tensor
+    elif isinstance(skeleton, dict):
+        result = type(skeleton)() if type(skeleton) is not dict else {}
+        for k, v in skeleton.items():
+            result[k] = _resolve(v, reader, convert_fn)
+        return result
+    elif isinstance(skeleton, (list, tuple)):
+        result = [_resolve(v, reader, convert_fn) for v in skeleton]
+        return type(skeleton)(result) if isinstance(skeleton, tuple) else result
+    return skeleton
+
+
+def _name_table(skeleton, reader):
+    return {
+        k: reader.tensor_name(v.key)
+        for k, v in skeleton.items()
+        if isinstance(v, _TensorRef) and reader.tensor_name(v.key)
+    }
+
+
+class LazyStateDict(Mapping):
+    """
+    Read-only dict loaded by ``paddle.load(path, lazy=True)`` from a file
+    saved in the stream format. Values are read from the file each time they
+    are accessed, so only accessed tensors occupy memory.
+
+    Call :code:`close` or use it as a context manager to close the file.
+    """
+
+    def __init__(self, reader, convert_fn):
+        self._reader = reader
+        self._convert_fn = convert_fn
+
+    def __getitem__(self, key):
+        return _resolve(
+            self._reader.skeleton[key], self._reader, self._convert_fn
+        )
+
+    def __iter__(self):
+        return iter(self._reader.skeleton)
+
+    def __len__(self):
+        return len(self._reader.skeleton)
+
+    def __contains__(self, key):
+        return key in self._reader.skeleton
+
+    def close(self):
+        self._reader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _stream_load(path, config, convert_fn):
+    """
+    Load an object saved in the stream format.
+
+    Args:
+        path(str|BytesIO): the path/buffer to load.
+        config(_SaveLoadConfig): `mmap`, `lazy`, `keys`, `keep_name_table`
+            are used.
+        convert_fn(callable): convert a loaded numpy.ndarray to the
+            returned type.
+    """
+    reader = _StreamReader(path, use_mmap=config.mmap)
+    skeleton = reader.skeleton
+
+    if config.lazy or config.keys is not None:
+        if not isinstance(skeleton, dict):
+            reader.close()
+            raise ValueError(
+                "`lazy` and `keys` of `paddle.load` are only supported for "
+                f"dict object, but the saved object is {type(skeleton)}."
+            )
+    if config.keys is not None:
+        missing = [k for k in config.keys if k not in skeleton]
+        if missing:
+            reader.close()
+            raise KeyError(f"Keys {missing} are not found in {path}.")
+        reader.skeleton = skeleton = {k: skeleton[k] for k in config.keys}
+
+    if config.lazy:
+        return LazyStateDict(reader, convert_fn)
+
+    try:
+        result = _resolve(skeleton, reader, convert_fn)
+        if config.keep_name_table and isinstance(result, dict):
+            result["StructuredToParameterName@@"] = _name_table(
+                skeleton, reader
+            )
+    finally:
+        reader.close()
+    return result
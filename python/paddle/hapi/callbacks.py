@@ -558,6 +558,11 @@ class ModelCheckpoint(Callback):
             are saved. Default: 1.
         save_dir(str|None): The directory to save checkpoint during training.
             If None, will not save checkpoint. Default: None.
+        async_save(bool): Whether to save checkpoint asynchronously, model
+            weights and optimizer state are copied to host memory and written
+            to files in background while training goes on, all saves are
+            waited at the end of training. Only supported in dynamic graph
+            mode. Default: False.
 
     Examples:
         .. code-block:: python
@@ -589,9 +594,11 @@ class ModelCheckpoint(Callback):
             >>> model.fit(train_dataset, batch_size=64, callbacks=callback)
     """
 
-    def __init__(self, save_freq=1, save_dir=None):
+    def __init__(self, save_freq=1, save_dir=None, async_save=False):
         self.save_freq = save_freq
         self.save_dir = save_dir
+        self.async_save = async_save
+        self._save_tasks = []
 
     def on_epoch_begin(self, epoch=None, logs=None):
         self.epoch = epoch
@@ -603,17 +610,28 @@ class ModelCheckpoint(Callback):
             and paddle.distributed.ParallelEnv().local_rank == 0
         )
 
+    def _save(self, path):
+        print(f'save checkpoint at {os.path.abspath(path)}')
+        if not self.async_save:
+            self.model.save(path)
+            return
+        # drop finished saves, exceptions raised in saving are raised here
+        for task in self._save_tasks:
+            if task.done():
+                task.wait()
+        self._save_tasks = [t for t in self._save_tasks if not t.done()]
+        self._save_tasks.extend(self.model.save(path, async_save=True) or [])
+
     def on_epoch_end(self, epoch, logs=None):
         if self._is_save() and self.epoch % self.save_freq == 0:
-            path = f'{self.save_dir}/{epoch}'
-            print(f'save checkpoint at {os.path.abspath(path)}')
-            self.model.save(path)
+            self._save(f'{self.save_dir}/{epoch}')
 
     def on_train_end(self, logs=None):
         if self._is_save():
-            path = f'{self.save_dir}/final'
-            print(f'save checkpoint at {os.path.abspath(path)}')
-            self.model.save(path)
+            self._save(f'{self.save_dir}/final')
+            for task in self._save_tasks:
+                task.wait()
+            self._save_tasks = []
 
 
 class LRScheduler(Callback):
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import contextlib
+import functools
 import inspect
 import os
 import pickle
@@ -65,6 +66,76 @@ def to_numpy(var):
     return np.array(t)
 
 
+class _DeferredLogs(dict):
+    """
+    Logs of `Model._run_one_epoch` whose losses and metrics are fetched from
+    device lazily, only when any of them is read or `_sync` is called, so
+    that following steps can be launched without waiting for device.
+    Other items such as `step` and `batch_size` can be read without sync.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = None
+        self._pending_keys = ()
+
+    def _defer(self, keys, fetch_fn):
+        # fetch_fn returns the values of keys, pending fetch of previous step
+        # is replaced as it is outdated. Keys are set in advance so that
+        # `len`, `in` and iteration are right without sync.
+        self._pending = fetch_fn
+        self._pending_keys = tuple(keys)
+        for k in self._pending_keys:
+            super().setdefault(k, None)
+
+    def _sync(self):
+        if self._pending is not None:
+            fetch_fn, self._pending = self._pending, None
+            keys, self._pending_keys = self._pending_keys, ()
+            super().update(zip(keys, fetch_fn()))
+
+    def __getitem__(self, key):
+        if key in self._pending_keys:
+            self._sync()
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        if key in self._pending_keys:
+            self._sync()
+        super().__setitem__(key, value)
+
+    def get(self, key, default=None):
+        if key in self._pending_keys:
+            self._sync()
+        return super().get(key, default)
+
+
+def _synced_dict_method(name):
+    method = getattr(dict, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._sync()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in [
+    '__repr__',
+    '__eq__',
+    '__ne__',
+    'values',
+    'items',
+    'copy',
+    'pop',
+    'popitem',
+    'setdefault',
+    'update',
+]:
+    setattr(_DeferredLogs, _name, _synced_dict_method(_name))
+
+
 def flatten_list(l):
     assert isinstance(l, list), "not a list"
     outl = []
@@ -352,7 +423,13 @@ class StaticGraphAdapter:
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
-    def save(self, path):
+    def save(self, path, async_save=False):
+        if async_save:
+            warnings.warn(
+                "Asynchronous save is not supported in static graph mode, "
+                "the model will be saved synchronously."
+            )
+
         def _save(state, path):
             if not state:
                 return
@@ -790,6 +867,15 @@ class DynamicGraphAdapter:
         self._amp_custom_lists = {}
         self._use_fp16_guard = True
 
+        # if True, losses are returned as device tensors and metric outputs
+        # are cached on device until `_sync_metrics`, see Model.fit
+        self._deferred_sync = False
+        self._pending_metric_outs = []
+        # if True, metrics with mergeable states are updated by samples of
+        # this rank only and reduced by `_reduce_metrics`, see Model.evaluate
+        self._reduce_metric_states = False
+        self._reducible_metrics = None
+
         if self._nranks > 1:
             dist.init_parallel_env()
             stradegy = paddle.distributed.parallel.ParallelStrategy()
@@ -811,6 +897,83 @@ class DynamicGraphAdapter:
     def mode(self, value):
         self.model.mode = value
 
+    def _fetch_losses(self, losses):
+        if self._deferred_sync:
+            return [l.detach() for l in losses]
+        return [to_numpy(l) for l in losses]
+
+    def _update_metric(self, metric, metric_outs):
+        if self._deferred_sync:
+            self._pending_metric_outs.append((metric, to_list(metric_outs)))
+            return None
+        return metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
+
+    def _sync_metrics(self):
+        # update metrics in order of steps with cached metric outputs
+        pending, self._pending_metric_outs = self._pending_metric_outs, []
+        for metric, metric_outs in pending:
+            metric.update(*[to_numpy(m) for m in metric_outs])
+
+    def _is_reducible(self, metric):
+        if not self._reduce_metric_states:
+            return False
+        if self._reducible_metrics is None:
+            self._reducible_metrics = [
+                m for m in self.model._metrics if m.get_state() is not None
+            ]
+        return any(m is metric for m in self._reducible_metrics)
+
+    def _update_merge_count(self, samples):
+        # return the number of valid samples in the merged batch of all
+        # ranks, padding samples of DistributedBatchSampler are cut off
+        if self.model._test_dataloader is None or not isinstance(
+            self.model._test_dataloader, DataLoader
+        ):
+            return None
+        total_size = len(self.model._test_dataloader.dataset)
+        current_count = self._merge_count.get(self.mode + '_total', 0)
+
+        if current_count + samples >= total_size:
+            samples = int(total_size - current_count)
+            self._merge_count[self.mode + '_total'] = 0
+        else:
+            self._merge_count[self.mode + '_total'] += samples
+        self._merge_count[self.mode + '_batch'] = samples
+        return samples
+
+    def _reduce_metrics(self):
+        """
+        All-reduce states of metrics updated by samples of this rank, so
+        that they are the same as updated by samples of all ranks.
+        """
+        metrics = [m for m in self.model._metrics if self._is_reducible(m)]
+        self._reducible_metrics = None
+        if self._nranks < 2 or len(metrics) == 0:
+            return
+
+        # reduce states of all metrics in one buffer
+        states = [m.get_state() for m in metrics]
+        values = [np.asarray(v) for state in states for v in state.values()]
+        buffer = paddle.to_tensor(
+            np.concatenate([v.astype('float64').reshape([-1]) for v in values])
+        )
+        dist.all_reduce(buffer)
+        buffer = buffer.numpy()
+
+        offset = 0
+        for metric, state in zip(metrics, states):
+            reduced = {}
+            for k, v in state.items():
+                v = np.asarray(v)
+                reduced[k] = (
+                    buffer[offset : offset + v.size]
+                    .reshape(v.shape)
+                    .astype(v.dtype)
+                )
+                offset += v.size
+            metric.reset()
+            metric.merge_state(reduced)
+
     # TODO multi device in dygraph mode not implemented at present time
     def train_batch(self, inputs, labels=None, update=True):
         assert (
@@ -856,13 +1019,12 @@ class DynamicGraphAdapter:
         metrics = []
         for metric in self.model._metrics:
             metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
-            metrics.append(m)
+            metrics.append(self._update_metric(metric, metric_outs))
 
         return (
-            ([to_numpy(l) for l in losses], metrics)
+            (self._fetch_losses(losses), metrics)
             if len(metrics) > 0
-            else [to_numpy(l) for l in losses]
+            else self._fetch_losses(losses)
         )
 
     def eval_batch(self, inputs, labels=None):
@@ -887,43 +1049,48 @@ class DynamicGraphAdapter:
             losses = self.model._loss(*(to_list(outputs) + labels))
             losses = to_list(losses)
 
+        outputs = to_list(outputs)
+        local_outputs, local_labels = outputs, labels
         if self._nranks > 1:
-            outputs = [_all_gather(o) for o in to_list(outputs)]
-            labels = [_all_gather(l) for l in labels]
+            local_size = outputs[0].shape[0]
+            merged_size = self._update_merge_count(local_size * self._nranks)
 
-            if self.model._test_dataloader is not None and isinstance(
-                self.model._test_dataloader, DataLoader
-            ):
-                total_size = len(self.model._test_dataloader.dataset)
-                samples = outputs[0].shape[0]
-                current_count = self._merge_count.get(self.mode + '_total', 0)
-
-                if current_count + samples >= total_size:
-                    outputs = [
-                        o[: int(total_size - current_count)] for o in outputs
-                    ]
-                    labels = [
-                        l[: int(total_size - current_count)] for l in labels
-                    ]
-                    self._merge_count[self.mode + '_total'] = 0
-                    self._merge_count[self.mode + '_batch'] = int(
-                        total_size - current_count
-                    )
-                else:
-                    self._merge_count[self.mode + '_total'] += samples
-                    self._merge_count[self.mode + '_batch'] = samples
+            # metrics without mergeable states are updated by outputs and
+            # labels gathered from all ranks
+            if not all(self._is_reducible(m) for m in self.model._metrics):
+                outputs = [_all_gather(o) for o in outputs]
+                labels = [_all_gather(l) for l in labels]
+                if merged_size is not None:
+                    # cut off padding value.
+                    outputs = [o[:merged_size] for o in outputs]
+                    labels = [l[:merged_size] for l in labels]
+
+            if merged_size is not None:
+                # samples of this rank are at [rank * local_size,
+                # (rank + 1) * local_size) of the merged batch
+                local_valid = min(
+                    max(merged_size - dist.get_rank() * local_size, 0),
+                    local_size,
+                )
+                local_outputs = [o[:local_valid] for o in local_outputs]
+                local_labels = [l[:local_valid] for l in local_labels]
 
         metrics = []
         for metric in self.model._metrics:
-            # cut off padding value.
-            metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
-            metrics.append(m)
+            if self._is_reducible(metric):
+                if local_outputs[0].shape[0] == 0:
+                    # all samples of this rank are padding
+                    metrics.append(None)
+                    continue
+                metric_outs = metric.compute(*(local_outputs + local_labels))
+            else:
+                metric_outs = metric.compute(*(outputs + labels))
+            metrics.append(self._update_metric(metric, metric_outs))
 
         if self.model._loss and len(metrics):
-            return [to_numpy(l) for l in losses], metrics
+            return self._fetch_losses(losses), metrics
         elif self.model._loss:
-            return [to_numpy(l) for l in losses]
+            return self._fetch_losses(losses)
         else:
             return metrics
 
@@ -941,17 +1108,21 @@ class DynamicGraphAdapter:
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
-    def save(self, path):
+    def save(self, path, async_save=False):
+        save = paddle.async_save if async_save else paddle.save
+        tasks = []
         params = self.model.network.state_dict()
-        paddle.save(params, path + '.pdparams')
+        tasks.append(save(params, path + '.pdparams'))
         if self.model._optimizer is not None:
             if self.model._optimizer.state_dict():
                 optim = self.model._optimizer.state_dict()
-                paddle.save(optim, path + '.pdopt')
+                tasks.append(save(optim, path + '.pdopt'))
         if hasattr(self.model, '_scaler') and self.model._scaler is not None:
             if self.model._scaler.state_dict():
                 scaler = self.model._scaler.state_dict()
-                paddle.save(scaler, path + '.pdscaler')
+                tasks.append(save(scaler, path + '.pdscaler'))
+        if async_save:
+            return tasks
 
     def load(self, param_state_pairs, optim_state, scaler_state=None):
         # restore parameter states
@@ -1349,7 +1520,7 @@ class Model:
             self._update_inputs()
         return loss
 
-    def save(self, path, training=True):
+    def save(self, path, training=True, async_save=False):
         """
 
         This function saves parameters, optimizer information or model and
@@ -1372,9 +1543,15 @@ class Model:
                 A exception will be raised.
             training (bool, optional): Whether to save for training. If not, save
                 for inference only. Default: True.
+            async_save (bool, optional): Whether to save for training asynchronously
+                by ``paddle.async_save`` in dynamic graph mode, parameters and
+                optimizer states are copied to host memory and written to files in
+                background. Default: False.
 
         Returns:
-            None
+            None, or list of handles of asynchronous saves if ``async_save`` is True
+            and ``training`` is True in dynamic graph mode, call ``wait`` of them
+            to wait until files written.
 
         Examples:
 
@@ -1414,7 +1591,7 @@ class Model:
             if not training:
                 self._save_inference_model(path)
             else:
-                self._adapter.save(path)
+                return self._adapter.save(path, async_save=async_save)
 
     def load(self, path, skip_mismatch=False, reset_optimizer=False):
         """
@@ -1764,6 +1941,7 @@ class Model:
         callbacks=None,
         accumulate_grad_batches=1,
         num_iters=None,
+        deferred_sync=False,
     ):
         """
 
@@ -1812,6 +1990,10 @@ class Model:
             num_iters (int|None, optional): The number of iterations to evaluate the model.
                 If None, evaluate on whole input dataset, otherwise, evaluate `num_iters` times.
                 Default: None.
+            deferred_sync (bool, optional): Whether to keep losses and metric outputs of
+                each step on device and fetch them only every `log_freq` steps or when
+                `logs` of callbacks are read, which avoids synchronizing device every
+                step. Only supported in dynamic graph mode. Default: False.
 
         Returns:
             None
@@ -1974,7 +2156,13 @@ class Model:
         cbks.on_begin('train')
         for epoch in range(epochs):
             cbks.on_epoch_begin(epoch)
-            logs = self._run_one_epoch(train_loader, cbks, 'train')
+            logs = self._run_one_epoch(
+                train_loader,
+                cbks,
+                'train',
+                deferred_sync=deferred_sync,
+                sync_freq=log_freq,
+            )
             cbks.on_epoch_end(epoch, logs)
 
             if do_eval and epoch % eval_freq == 0:
@@ -1984,7 +2172,13 @@ class Model:
                     {'steps': eval_steps, 'metrics': self._metrics_name()},
                 )
 
-                eval_logs = self._run_one_epoch(eval_loader, cbks, 'eval')
+                eval_logs = self._run_one_epoch(
+                    eval_loader,
+                    cbks,
+                    'eval',
+                    deferred_sync=deferred_sync,
+                    sync_freq=log_freq,
+                )
 
                 cbks.on_end('eval', eval_logs)
             if self.stop_training:
@@ -2002,6 +2196,7 @@ class Model:
         num_workers=0,
         callbacks=None,
         num_iters=None,
+        deferred_sync=False,
     ):
         """
         Evaluate the loss and metrics of the model on input dataset.
@@ -2027,6 +2222,10 @@ class Model:
             num_iters (int|None, optional): The number of iterations to evaluate the model.
                 If None, evaluate on whole input dataset, otherwise, evaluate `num_iters` times.
                 Default: None.
+            deferred_sync (bool, optional): Whether to keep losses and metric outputs of
+                each step on device and fetch them only every `log_freq` steps or when
+                `logs` of callbacks are read. Only supported in dynamic graph mode.
+                Default: False.
         Returns:
             dict: Result of metric. The key is the names of Metric,
                 value is a scalar or numpy.array.
@@ -2092,7 +2291,13 @@ class Model:
             'eval', {'steps': eval_steps, 'metrics': self._metrics_name()}
         )
 
-        logs = self._run_one_epoch(eval_loader, cbks, 'eval')
+        logs = self._run_one_epoch(
+            eval_loader,
+            cbks,
+            'eval',
+            deferred_sync=deferred_sync,
+            sync_freq=log_freq,
+        )
 
         cbks.on_end('eval', logs)
 
@@ -2287,7 +2492,62 @@ class Model:
         callbacks,
         mode,
         logs={},
+        deferred_sync=False,
+        sync_freq=1,
+    ):
+        # losses and metrics are kept on device and fetched lazily in
+        # deferred sync, only supported in dygraph
+        deferred_sync = (
+            deferred_sync and mode != 'predict' and in_dynamic_mode()
+        )
+        # in distributed evaluation, states of mergeable metrics are
+        # all-reduced at the end instead of gathering outputs every step
+        reduce_metrics = (
+            mode == 'eval'
+            and in_dynamic_mode()
+            and self._adapter._nranks > 1
+            and len(self._metrics) > 0
+        )
+        if deferred_sync:
+            logs = _DeferredLogs(logs)
+            self._adapter._deferred_sync = True
+        if reduce_metrics:
+            self._adapter._reduce_metric_states = True
+        try:
+            outputs = self._run_steps(
+                data_loader,
+                callbacks,
+                mode,
+                logs,
+                deferred_sync,
+                sync_freq,
+            )
+            if deferred_sync:
+                logs._sync()
+            if reduce_metrics:
+                self._adapter._reduce_metrics()
+                metrics_name = self._metrics_name()[1 if self._loss else 0 :]
+                for k, v in zip(metrics_name, self._accumulate_metrics()):
+                    logs[k] = v
+        finally:
+            if deferred_sync:
+                self._adapter._deferred_sync = False
+                self._adapter._pending_metric_outs = []
+            if reduce_metrics:
+                self._adapter._reduce_metric_states = False
+                self._adapter._reducible_metrics = None
+        self._reset_metrics()
+
+        if deferred_sync:
+            logs = dict(logs)
+        if mode == 'predict':
+            return logs, outputs
+        return logs
+
+    def _run_steps(
+        self, data_loader, callbacks, mode, logs, deferred_sync, sync_freq
     ):
+        deferred_steps = 0
         outputs = []
         for step, data in enumerate(data_loader):
             # Data might come from different types of data_loader and have
@@ -2323,21 +2583,19 @@ class Model:
 
                 outs = getattr(self, mode + '_batch')(*_inputs)
 
-                if self._metrics and self._loss:
-                    metrics = [[float(l) for l in outs[0]]]
-                elif self._loss:
-                    metrics = [[float(l) for l in outs]]
+                if deferred_sync:
+                    logs._defer(
+                        self._metrics_name(),
+                        functools.partial(self._fetch_metrics, outs),
+                    )
+                    deferred_steps += 1
+                    if deferred_steps % sync_freq == 0:
+                        logs._sync()
                 else:
-                    metrics = []
-
-                # metrics
-                for metric in self._metrics:
-                    res = metric.accumulate()
-                    metrics.extend(to_list(res))
-
-                assert len(self._metrics_name()) == len(metrics)
-                for k, v in zip(self._metrics_name(), metrics):
-                    logs[k] = v
+                    for k, v in zip(
+                        self._metrics_name(), self._fetch_metrics(outs)
+                    ):
+                        logs[k] = v
             else:
                 if self._inputs is not None:
                     outs = self.predict_batch(data[: len(self._inputs)])
@@ -2364,11 +2622,31 @@ class Model:
                     self.stop_training = True
                     del self.num_iters
                     break
-        self._reset_metrics()
+        return outputs
 
-        if mode == 'predict':
-            return logs, outputs
-        return logs
+    def _fetch_metrics(self, outs):
+        if self._metrics and self._loss:
+            metrics = [[float(l) for l in outs[0]]]
+        elif self._loss:
+            metrics = [[float(l) for l in outs]]
+        else:
+            metrics = []
+
+        # metric outputs cached in deferred sync are updated before
+        # accumulated
+        if getattr(self._adapter, '_deferred_sync', False):
+            self._adapter._sync_metrics()
+        metrics.extend(self._accumulate_metrics())
+
+        assert len(self._metrics_name()) == len(metrics)
+        return metrics
+
+    def _accumulate_metrics(self):
+        metrics = []
+        for metric in self._metrics:
+            res = metric.accumulate()
+            metrics.extend(to_list(res))
+        return metrics
 
     def summary(self, input_size=None, dtype=None):
         """Prints a string summary of the network.
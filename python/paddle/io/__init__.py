@@ -29,6 +29,8 @@ from .dataloader import ChainDataset  # noqa: F401
 from .dataloader import WeightedRandomSampler  # noqa: F401
 from .dataloader import Subset  # noqa: F401
 from .dataloader import random_split  # noqa: F401
+from .dataloader import SchemaCollateFn  # noqa: F401
+from .dataloader import WorkerAutoScaler  # noqa: F401
 
 __all__ = [  # noqa
     'Dataset',
@@ -46,4 +48,6 @@ __all__ = [  # noqa
     'WeightedRandomSampler',
     'random_split',
     'Subset',
+    'SchemaCollateFn',
+    'WorkerAutoScaler',
 ]
@@ -25,6 +25,10 @@ from .batch_sampler import DistributedBatchSampler
 
 from .worker import get_worker_info
 
+from .collate import SchemaCollateFn
+
+from .autoscaler import WorkerAutoScaler
+
 from .sampler import Sampler
 from .sampler import SequenceSampler
 from .sampler import RandomSampler
@@ -0,0 +1,190 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+
+class WorkerAutoScaler:
+    """
+    Policy to adjust the number of worker subprocesses and the outstanding
+    batch window (:attr:`prefetch_factor`) of multi-process DataLoader
+    between epochs.
+
+    In each epoch, the DataLoader measures how long the consumer waits for
+    batches and how long workers stay idle waiting for indices. At the end
+    of an epoch:
+
+    1. if the consumer waits longer than :attr:`wait_threshold` of the epoch
+       time and workers are busy, a worker is added; if workers are idle,
+       the outstanding batch window is grown instead.
+    2. if the consumer does not wait and workers are idle longer than
+       :attr:`idle_threshold` of their time, a worker is retired, or the
+       outstanding batch window is shrunk when :attr:`min_workers` reached.
+
+    The new setting takes effect from the next epoch. With
+    ``persistent_workers=True``, worker subprocesses are started or retired
+    in place, otherwise the next iterator is created with the new setting.
+
+    Args:
+        min_workers(int, optional): minimum number of workers. Default 1.
+        max_workers(int|None, optional): maximum number of workers, None for
+            the CPU count. Default None.
+        min_prefetch_factor(int, optional): minimum prefetch factor. Default 1.
+        max_prefetch_factor(int, optional): maximum prefetch factor. Default 8.
+        wait_threshold(float, optional): ratio of epoch time the consumer
+            waits for batches above which the DataLoader is regarded as
+            starving the consumer. Default 0.05.
+        idle_threshold(float, optional): ratio of worker time spent idle
+            above which workers are regarded as over-provisioned. Default 0.3.
+        callback(callable, optional): called with a dict describing the
+            decision made at the end of each epoch, with keys ``epoch``,
+            ``action`` (one of ``'add_worker'``, ``'retire_worker'``,
+            ``'grow_window'``, ``'shrink_window'`` and ``'keep'``),
+            ``num_workers``, ``prefetch_factor``, ``prev_num_workers``,
+            ``prev_prefetch_factor``, ``elapsed``, ``consumer_wait`` and
+            ``worker_idle``. Default None.
+
+    Returns:
+        WorkerAutoScaler, the autoscaling policy to be set as
+        :attr:`worker_autoscaler` of ``paddle.io.DataLoader``.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> from paddle.io import Dataset, DataLoader, WorkerAutoScaler
+
+            >>> class RandomDataset(Dataset):
+            ...     def __getitem__(self, idx):
+            ...         return np.random.random([8]).astype('float32')
+            ...     def __len__(self):
+            ...         return 64
+
+            >>> autoscaler = WorkerAutoScaler(
+            ...     min_workers=1, max_workers=4, callback=print)
+            >>> loader = DataLoader(RandomDataset(), batch_size=8,
+            ...     num_workers=2, worker_autoscaler=autoscaler)
+            >>> for epoch in range(2):
+            ...     for data in loader:
+            ...         pass
+    """
+
+    ACTIONS = (
+        'add_worker',
+        'retire_worker',
+        'grow_window',
+        'shrink_window',
+        'keep',
+    )
+
+    def __init__(
+        self,
+        min_workers=1,
+        max_workers=None,
+        min_prefetch_factor=1,
+        max_prefetch_factor=8,
+        wait_threshold=0.05,
+        idle_threshold=0.3,
+        callback=None,
+    ):
+        if max_workers is None:
+            max_workers = max(os.cpu_count() or 1, min_workers)
+        assert (
+            0 < min_workers <= max_workers
+        ), "min_workers should be positive and not greater than max_workers"
+        assert (
+            0 < min_prefetch_factor <= max_prefetch_factor
+        ), "min_prefetch_factor should be positive and not greater than max_prefetch_factor"
+        assert wait_threshold >= 0, "wait_threshold should be non-negative"
+        assert idle_threshold >= 0, "idle_threshold should be non-negative"
+
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.min_prefetch_factor = min_prefetch_factor
+        self.max_prefetch_factor = max_prefetch_factor
+        self.wait_threshold = wait_threshold
+        self.idle_threshold = idle_threshold
+        self.callback = callback
+
+        # current setting, initialized by the first DataLoader iterator
+        self.num_workers = None
+        self.prefetch_factor = None
+        self.epoch = 0
+
+    def _bind(self, num_workers, prefetch_factor):
+        if self.num_workers is None:
+            self.num_workers = min(
+                max(num_workers, self.min_workers), self.max_workers
+            )
+            self.prefetch_factor = min(
+                max(prefetch_factor, self.min_prefetch_factor),
+                self.max_prefetch_factor,
+            )
+
+    def _decide(self, wait_ratio, idle_ratio):
+        if wait_ratio > self.wait_threshold:
+            if idle_ratio < self.idle_threshold:
+                if self.num_workers < self.max_workers:
+                    return 'add_worker'
+            elif self.prefetch_factor < self.max_prefetch_factor:
+                return 'grow_window'
+        elif idle_ratio > self.idle_threshold:
+            if self.num_workers > self.min_workers:
+                return 'retire_worker'
+            elif self.prefetch_factor > self.min_prefetch_factor:
+                return 'shrink_window'
+        return 'keep'
+
+    def _step(self, elapsed, consumer_wait, worker_idle):
+        """
+        Make a decision with the statistics of an epoch.
+
+        Args:
+            elapsed(float): seconds of the epoch.
+            consumer_wait(float): seconds the consumer waits for batches.
+            worker_idle(float): total seconds workers wait for indices.
+
+        Returns:
+            dict, the decision.
+        """
+        elapsed = max(elapsed, 1e-9)
+        wait_ratio = consumer_wait / elapsed
+        idle_ratio = worker_idle / (elapsed * self.num_workers)
+        action = self._decide(wait_ratio, idle_ratio)
+
+        decision = {
+            'epoch': self.epoch,
+            'action': action,
+            'prev_num_workers': self.num_workers,
+            'prev_prefetch_factor': self.prefetch_factor,
+            'elapsed': elapsed,
+            'consumer_wait': consumer_wait,
+            'worker_idle': worker_idle,
+        }
+        if action == 'add_worker':
+            self.num_workers += 1
+        elif action == 'retire_worker':
+            self.num_workers -= 1
+        elif action == 'grow_window':
+            self.prefetch_factor += 1
+        elif action == 'shrink_window':
+            self.prefetch_factor -= 1
+        decision['num_workers'] = self.num_workers
+        decision['prefetch_factor'] = self.prefetch_factor
+        self.epoch += 1
+
+        if self.callback is not None:
+            self.callback(decision)
+        return decision
@@ -17,7 +17,12 @@ import math
 import numpy as np
 
 from .dataset import IterableDataset
-from .sampler import RandomSampler, Sampler, SequenceSampler
+from .sampler import (
+    RandomSampler,
+    Sampler,
+    SequenceSampler,
+    _FeistelPermutation,
+)
 
 
 class BatchSampler(Sampler):
@@ -200,6 +205,12 @@ class DistributedBatchSampler(BatchSampler):
             batch indices. Default False.
         drop_last(bool, optional): whether drop the last incomplete(less than a mini-batch) batch dataset size.
             Default False.
+        low_memory(bool, optional): If True and :attr:`shuffle` is True, shuffled
+            indices of each mini-batch are generated by a pseudo-random permutation
+            with O(1) memory instead of holding a permutation array of the whole
+            dataset, which is useful for very large datasets. Note that the shuffled
+            order is different from the order when :attr:`low_memory` is False.
+            Default False.
 
     Returns:
         DistributedBatchSampler, return an iterable object for indices iterating.
@@ -240,6 +251,7 @@ class DistributedBatchSampler(BatchSampler):
         rank=None,
         shuffle=False,
         drop_last=False,
+        low_memory=False,
     ):
         self.dataset = dataset
 
@@ -272,57 +284,65 @@ class DistributedBatchSampler(BatchSampler):
             self.local_rank = ParallelEnv().local_rank
 
         self.drop_last = drop_last
+        self.low_memory = low_memory
         self.epoch = 0
         self.num_samples = int(math.ceil(len(self.dataset) * 1.0 / self.nranks))
         self.total_size = self.num_samples * self.nranks
 
+    def _local_positions(self, start, end):
+        # positions in the padded dataset of local samples [start, end),
+        # mini-batches are assigned to ranks in turn, and the last
+        # incomplete mini-batch of all ranks is split evenly
+        local = np.arange(start, end, dtype='int64')
+        if self.nranks == 1:
+            return local
+
+        last_batch_size = self.total_size % (self.batch_size * self.nranks)
+        assert last_batch_size % self.nranks == 0
+        last_local_batch_size = last_batch_size // self.nranks
+        full_local_size = (self.total_size - last_batch_size) // self.nranks
+
+        positions = (
+            local // self.batch_size * self.batch_size * self.nranks
+            + self.local_rank * self.batch_size
+            + local % self.batch_size
+        )
+        in_last_batch = local >= full_local_size
+        positions[in_last_batch] = (
+            self.total_size
+            - last_batch_size
+            + self.local_rank * last_local_batch_size
+            + local[in_last_batch]
+            - full_local_size
+        )
+        return positions
+
     def __iter__(self):
         num_samples = len(self.dataset)
-        indices = np.arange(num_samples).tolist()
-        indices += indices[: (self.total_size - len(indices))]
-        assert len(indices) == self.total_size
-        if self.shuffle:
-            np.random.RandomState(self.epoch).shuffle(indices)
+        # NOTE: indices are padded to total_size by the leading indices,
+        #       i.e. position p of the padded dataset is index p % num_samples
+        if self.shuffle and self.low_memory:
+            permutation = _FeistelPermutation(self.total_size, self.epoch)
             self.epoch += 1
-
-        # subsample
-        def _get_indices_by_batch_size(indices):
-            subsampled_indices = []
-            last_batch_size = self.total_size % (self.batch_size * self.nranks)
-            assert last_batch_size % self.nranks == 0
-            last_local_batch_size = last_batch_size // self.nranks
-
-            for i in range(
-                self.local_rank * self.batch_size,
-                len(indices) - last_batch_size,
-                self.batch_size * self.nranks,
-            ):
-                subsampled_indices.extend(indices[i : i + self.batch_size])
-
-            indices = indices[len(indices) - last_batch_size :]
-            subsampled_indices.extend(
-                indices[
-                    self.local_rank
-                    * last_local_batch_size : (self.local_rank + 1)
-                    * last_local_batch_size
-                ]
-            )
-            return subsampled_indices
-
-        if self.nranks > 1:
-            indices = _get_indices_by_batch_size(indices)
-
-        assert len(indices) == self.num_samples
-        _sample_iter = iter(indices)
-
-        batch_indices = []
-        for idx in _sample_iter:
-            batch_indices.append(idx)
-            if len(batch_indices) == self.batch_size:
-                yield batch_indices
-                batch_indices = []
-        if not self.drop_last and len(batch_indices) > 0:
-            yield batch_indices
+        elif self.shuffle:
+            permutation = np.arange(self.total_size) % num_samples
+            np.random.RandomState(self.epoch).shuffle(permutation)
+            self.epoch += 1
+        else:
+            permutation = None
+
+        for start in range(0, self.num_samples, self.batch_size):
+            end = min(start + self.batch_size, self.num_samples)
+            if self.drop_last and end - start < self.batch_size:
+                return
+            indices = self._local_positions(start, end)
+            if self.shuffle and self.low_memory:
+                indices = permutation(indices) % num_samples
+            elif self.shuffle:
+                indices = permutation[indices]
+            else:
+                indices = indices % num_samples
+            yield indices.tolist()
 
     def __len__(self):
         num_samples = self.num_samples
@@ -42,6 +42,7 @@ from .worker import (
     _DatasetKind,
     _IterableDatasetStopIteration,
     _ResumeIteration,
+    _RetireWorker,
     _worker_loop,
     _WorkerException,
 )
@@ -361,6 +362,18 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
 
         self._persistent_workers = loader._persistent_workers
         self._resume_worker_cnt = 0
+        # set by _thread_loop when all workers resumed, see _reset
+        self._resume_done_event = threading.Event()
+
+        # autoscaling is only supported for map-style dataset, for
+        # IterableDataset is split by worker number in workers
+        self._autoscaler = loader._worker_autoscaler
+        if self._dataset_kind == _DatasetKind.ITER:
+            self._autoscaler = None
+        if self._autoscaler is not None:
+            self._autoscaler._bind(self._num_workers, self._prefetch_factor)
+            self._num_workers = self._autoscaler.num_workers
+            self._prefetch_factor = self._autoscaler.prefetch_factor
 
         assert (
             self._num_workers > 0
@@ -425,6 +438,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
 
         self._init_thread()
         self._shutdown = False
+        self._start_epoch_stats()
 
     def _init_workers(self):
         from paddle.incubate import multiprocessing
@@ -433,6 +447,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._workers = []
         self._worker_status = []
         self._indices_queues = []
+        self._worker_idle_times = []
         self._workers_idx_cycle = itertools.cycle(range(self._num_workers))
 
         # create data_queue for workers
@@ -444,36 +459,94 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._thread_done_event = threading.Event()
 
         for i in range(self._num_workers):
-            indices_queue = multiprocessing.Queue()
-            indices_queue.cancel_join_thread()
-            self._indices_queues.append(indices_queue)
-            worker = multiprocessing.Process(
-                target=_worker_loop,
-                args=(
-                    self._dataset,
-                    self._dataset_kind,
-                    indices_queue,
-                    self._data_queue,
-                    self._workers_done_event,
-                    self._auto_collate_batch,
-                    self._collate_fn,
-                    self._drop_last,
-                    self._worker_init_fn,
-                    i,
-                    self._num_workers,
-                    self._use_shared_memory,
-                    self._base_seed,
-                    self._worker_shm_buffer_size,
-                ),
-            )
-            worker.daemon = True
-            worker.start()
-            self._workers.append(worker)
-            self._worker_status.append(True)
+            self._start_worker(i, self._num_workers)
 
         core._set_process_pids(id(self), tuple(w.pid for w in self._workers))
         _set_SIGCHLD_handler()
 
+    def _start_worker(self, worker_id, num_workers):
+        from paddle.incubate import multiprocessing
+
+        indices_queue = multiprocessing.Queue()
+        indices_queue.cancel_join_thread()
+        self._indices_queues.append(indices_queue)
+
+        # seconds the worker waits for indices, only needed by autoscaling
+        idle_time = None
+        if self._autoscaler is not None:
+            idle_time = multiprocessing.Value('d', 0.0)
+            self._worker_idle_times.append(idle_time)
+
+        worker = multiprocessing.Process(
+            target=_worker_loop,
+            args=(
+                self._dataset,
+                self._dataset_kind,
+                indices_queue,
+                self._data_queue,
+                self._workers_done_event,
+                self._auto_collate_batch,
+                self._collate_fn,
+                self._drop_last,
+                self._worker_init_fn,
+                worker_id,
+                num_workers,
+                self._use_shared_memory,
+                self._base_seed,
+                self._worker_shm_buffer_size,
+                idle_time,
+            ),
+        )
+        worker.daemon = True
+        worker.start()
+        self._workers.append(worker)
+        self._worker_status.append(True)
+
+    def _resize_workers(self, num_workers):
+        # NOTE: only called in _reset when no indices outstanding, workers
+        #       are appended or retired from the tail to keep worker ids
+        #       contiguous
+        for i in range(self._num_workers, num_workers):
+            self._start_worker(i, num_workers)
+
+        if num_workers < self._num_workers:
+            for i in range(num_workers, self._num_workers):
+                self._indices_queues[i].put(_RetireWorker())
+            for i in range(num_workers, self._num_workers):
+                self._workers[i].join()
+                self._indices_queues[i].cancel_join_thread()
+                self._indices_queues[i].close()
+            del self._workers[num_workers:]
+            del self._worker_status[num_workers:]
+            del self._indices_queues[num_workers:]
+            del self._worker_idle_times[num_workers:]
+
+        self._num_workers = num_workers
+        self._workers_idx_cycle = itertools.cycle(range(self._num_workers))
+        core._set_process_pids(id(self), tuple(w.pid for w in self._workers))
+
+    def _start_epoch_stats(self):
+        self._epoch_start_time = time.perf_counter()
+        self._consumer_wait = 0.0
+        self._worker_idle_start = [t.value for t in self._worker_idle_times]
+        self._epoch_stats_done = False
+
+    def _on_epoch_end(self):
+        if self._autoscaler is None or self._epoch_stats_done:
+            return
+        self._epoch_stats_done = True
+        worker_idle = sum(
+            t.value - start
+            for t, start in zip(
+                self._worker_idle_times, self._worker_idle_start
+            )
+        )
+        self._autoscaler._step(
+            time.perf_counter() - self._epoch_start_time,
+            self._consumer_wait,
+            worker_idle,
+        )
+
     def _clear_and_remove_data_queue(self):
         if self._data_queue is not None:
             while True:
@@ -523,13 +596,20 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # 1. Resume workers, clear worker caches
         # put _ResumeIteration to all worker as resume iteration flag
         with self._thread_lock:
+            self._resume_done_event.clear()
             self._resume_worker_cnt = self._num_workers
             for worker_id in range(self._num_workers):
                 self._indices_queues[worker_id].put(_ResumeIteration())
                 self._batches_outstanding += 1
-        # all flag will be check in _thread_loop, simply wait here
-        while self._resume_worker_cnt > 0:
-            time.sleep(0.5)
+        # all flag will be check in _thread_loop, wait until all workers
+        # resumed, check whether the thread is alive on timeout to avoid
+        # hanging if the thread exited for worker failure
+        while not self._resume_done_event.wait(self._timeout):
+            if not self._thread.is_alive():
+                raise RuntimeError(
+                    "DataLoader reader thread exited unexpectedly when "
+                    "resuming workers for next epoch"
+                )
 
         # 2. clear blocking_queue caches
         # in order not to restart the thread, we just clear
@@ -555,11 +635,23 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # set all worker status available
         self._worker_status = [True] * self._num_workers
 
+        # apply the setting decided by autoscaler at the end of last epoch,
+        # blocking_queue capacity is not changed, batches more than its
+        # capacity will be cached in _data_queue
+        if self._autoscaler is not None:
+            if self._autoscaler.num_workers != self._num_workers:
+                self._resize_workers(self._autoscaler.num_workers)
+            self._prefetch_factor = self._autoscaler.prefetch_factor
+            self._outstanding_capacity = self._prefetch_factor * max(
+                self._num_workers, len(self._places)
+            )
+
         # 4. reset _sampler_iter and put prefetch indices to start next epoch
         # init workers and indices queues and put 2 indices in each indices queue
         self._sampler_iter = iter(self._index_sampler)
         for _ in range(self._outstanding_capacity):
             self._try_put_indices()
+        self._start_epoch_stats()
 
     def _shutdown_worker(self, worker_id, shutdown=False):
         if self._worker_status[worker_id] or (
@@ -609,6 +701,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     if isinstance(batch, _ResumeIteration):
                         assert self._resume_worker_cnt > 0
                         self._resume_worker_cnt -= 1
+                        if self._resume_worker_cnt == 0:
+                            self._resume_done_event.set()
                         continue
                     try:
                         # pack as LoDTensorArray
@@ -821,14 +915,17 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._thread_done_event.set()
                     self._blocking_queue.close()
 
+            wait_start = time.perf_counter()
             if in_dynamic_mode():
                 data = core.eager.read_next_tensor_list(
                     self._reader.read_next_list()[0]
                 )
+                self._consumer_wait += time.perf_counter() - wait_start
                 data = _restore_batch(data, self._structure_infos.pop(0))
             else:
                 if self._return_list:
                     data = self._reader.read_next_list()
+                    self._consumer_wait += time.perf_counter() - wait_start
                     for i in range(len(data)):
                         data[i] = data[i]._move_to_list()
                     structs = [
@@ -843,10 +940,12 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                         data = data[0]
                 else:
                     data = self._reader.read_next()
+                    self._consumer_wait += time.perf_counter() - wait_start
             self._on_output_batch()
             benchmark().after_reader()
             return data
         except StopIteration:
+            self._on_epoch_end()
             if not self._persistent_workers:
                 self._reader.shutdown()
                 self._try_shutdown_all()
@@ -31,6 +31,16 @@ class Dataset:
     :code:`__len__`: return dataset sample number. This method is required
     by some implements of :code:`paddle.io.BatchSampler`
 
+    Subclasses can also optionally implement following method:
+
+    :code:`__getitems__`: get a list of samples from dataset with a list of
+    indices, which should be the same as :code:`[self[i] for i in indices]`.
+    If implemented, :code:`paddle.io.DataLoader` reads all samples of a
+    batch in one call, so datasets backed by numpy arrays, memory mapped
+    files or databases can read a batch with one vectorized read. Note that
+    :code:`__getitems__` will not be used if a subclass overrides
+    :code:`__getitem__` only.
+
     see :code:`paddle.io.DataLoader`.
 
     Examples:
@@ -75,6 +85,20 @@ class Dataset:
         )
 
 
+def _has_getitems(dataset):
+    """
+    Whether samples of :attr:`dataset` can be read by :code:`__getitems__`,
+    a subclass which only overrides :code:`__getitem__` of a dataset
+    implementing :code:`__getitems__` still reads samples one by one.
+    """
+    for cls in type(dataset).__mro__:
+        if '__getitems__' in cls.__dict__:
+            return cls.__dict__['__getitems__'] is not None
+        if '__getitem__' in cls.__dict__:
+            return False
+    return False
+
+
 class IterableDataset(Dataset):
     """
     An abstract class to encapsulate methods and behaviors of iterable datasets.
@@ -306,6 +330,14 @@ class TensorDataset(Dataset):
     def __getitem__(self, index):
         return tuple(tensor[index] for tensor in self.tensors)
 
+    def __getitems__(self, indices):
+        index = paddle.to_tensor(indices, dtype='int64')
+        fields = [
+            paddle.index_select(tensor, index).unbind(axis=0)
+            for tensor in self.tensors
+        ]
+        return list(zip(*fields))
+
     def __len__(self):
         return self.tensors[0].shape[0]
 
@@ -474,6 +506,12 @@ class Subset(Dataset):
     def __getitem__(self, idx):
         return self.dataset[self.indices[idx]]
 
+    def __getitems__(self, indices):
+        indices = [self.indices[idx] for idx in indices]
+        if _has_getitems(self.dataset):
+            return self.dataset.__getitems__(indices)
+        return [self.dataset[idx] for idx in indices]
+
     def __len__(self):
         return len(self.indices)
 
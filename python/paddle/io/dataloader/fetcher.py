@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .dataset import _has_getitems
+
 
 class _DatasetFetcher:
     def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
@@ -68,9 +70,17 @@ class _IterableDatasetFetcher(_DatasetFetcher):
 class _MapDatasetFetcher(_DatasetFetcher):
     def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
         super().__init__(dataset, auto_collate_batch, collate_fn, drop_last)
+        self._use_getitems = _has_getitems(dataset)
 
     def fetch(self, batch_indices, done_event=None):
-        if self.auto_collate_batch:
+        if self.auto_collate_batch and self._use_getitems:
+            if done_event is not None and done_event.is_set():
+                return None
+            # NOTE: read the whole batch in one call, batch_indices may
+            #       be a tuple or an generated list in sampler, convert
+            #       it to list for datasets performing fancy indexing
+            data = self.dataset.__getitems__(list(batch_indices))
+        elif self.auto_collate_batch:
             data = []
             for idx in batch_indices:
                 if done_event is None or not done_event.is_set():
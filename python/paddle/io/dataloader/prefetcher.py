@@ -0,0 +1,201 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import time
+
+import paddle
+
+from ...framework import core
+
+
+def _map_tensors(fn, batch):
+    if isinstance(batch, (paddle.Tensor, core.eager.Tensor)):
+        return fn(batch)
+    elif isinstance(batch, dict):
+        return {key: _map_tensors(fn, value) for key, value in batch.items()}
+    elif isinstance(batch, (list, tuple)):
+        return type(batch)(_map_tensors(fn, value) for value in batch)
+    return batch
+
+
+def _is_stream_place(place):
+    return (
+        paddle.is_compiled_with_cuda() and isinstance(place, core.CUDAPlace)
+    ) or isinstance(place, core.CustomPlace)
+
+
+class _PinnedBufferPool:
+    """
+    Pool of CUDA pinned host buffers recycled across batches. Host tensors
+    are copied into the buffers, so that the copies from them to the device
+    are really asynchronous. A buffer is reused after the event recorded
+    after the device copy reading it completes.
+
+    Args:
+        capacity(int): max number of free buffers kept for each shape and
+            dtype.
+    """
+
+    def __init__(self, capacity):
+        self._capacity = capacity
+        self._free = collections.defaultdict(collections.deque)
+        # (event, buffers) of the device copies in flight, in the order of
+        # recording on the staging stream
+        self._in_use = collections.deque()
+
+    def _reclaim(self):
+        while self._in_use and self._in_use[0][0].query():
+            _, buffers = self._in_use.popleft()
+            for buffer in buffers:
+                free = self._free[(tuple(buffer.shape), buffer.dtype)]
+                if len(free) < self._capacity:
+                    free.append(buffer)
+
+    def pin(self, tensor, buffers):
+        """
+        Returns a pinned copy of the CPU tensor, and appends the buffer used
+        to buffers. Tensors on other places are returned as they are.
+        """
+        if not tensor.place.is_cpu_place():
+            return tensor
+        self._reclaim()
+        free = self._free.get((tuple(tensor.shape), tensor.dtype))
+        if free:
+            buffer = free.popleft()
+            buffer.copy_(tensor, True)
+        else:
+            buffer = tensor.pin_memory()
+        buffers.append(buffer)
+        return buffer
+
+    def release(self, event, buffers):
+        """
+        Returns buffers to the pool once event completes.
+        """
+        self._in_use.append((event, buffers))
+
+
+class _DevicePrefetcher:
+    """
+    Device prefetch stage of DataLoader, which wraps a DataLoader iterator
+    yielding host batches and copies the next :attr:`depth` batches to
+    :attr:`place` on a separate stream while the current batch is used by
+    the model. For CUDA places, the batches are copied into recycled pinned
+    buffers before the asynchronous copies.
+
+    For places without stream support, e.g. CPUPlace, staging is a no-op
+    and batches are only buffered, so the stage can be tested on CPU.
+
+    Args:
+        iterator(iterator): DataLoader iterator yielding host batches.
+        place(Place): the place to copy batches to.
+        depth(int): number of batches staged ahead of the current one.
+    """
+
+    def __init__(self, iterator, place, depth):
+        assert depth > 0, "depth of device prefetch should be positive"
+        self._iterator = iterator
+        self._place = place
+        self._depth = depth
+        self._staged = collections.deque()
+        self._exhausted = False
+
+        if _is_stream_place(place):
+            self._stream = paddle.device.Stream(place)
+            self._compute_stream = paddle.device.current_stream(place)
+        else:
+            self._stream = None
+            self._compute_stream = None
+        self._pinned_pool = None
+        if self._stream is not None and isinstance(place, core.CUDAPlace):
+            # buffers of the staged batches and the batch being copied
+            self._pinned_pool = _PinnedBufferPool(depth + 2)
+
+        self._num_batches = 0
+        self._stall_time = 0.0
+
+    def _stage(self):
+        try:
+            batch = next(self._iterator)
+        except StopIteration:
+            self._exhausted = True
+            return
+
+        if self._stream is None:
+            self._staged.append((batch, None))
+            return
+
+        # NOTE: memory of batches freed by the model may be still in use
+        #       by kernels queued on the compute stream, and memory allocated
+        #       on the staging stream can be reused by following copies on
+        #       the staging stream, so the staging stream should wait for the
+        #       compute stream before copying the next batch. This still
+        #       overlaps copying with the kernels of the current step.
+        self._stream.wait_stream(self._compute_stream)
+        buffers = []
+        if self._pinned_pool is not None:
+            batch = _map_tensors(
+                lambda tensor: self._pinned_pool.pin(tensor, buffers), batch
+            )
+        with paddle.device.stream_guard(self._stream):
+            batch = _map_tensors(
+                lambda tensor: tensor._copy_to(self._place, False), batch
+            )
+            event = self._stream.record_event()
+        if self._pinned_pool is not None:
+            self._pinned_pool.release(event, buffers)
+        self._staged.append((batch, event))
+
+    def __iter__(self):
+        return self
+
+    def __len__(self):
+        return len(self._iterator)
+
+    def __next__(self):
+        start = time.perf_counter()
+        # keep the current batch and `depth` batches after it staged
+        while not self._exhausted and len(self._staged) <= self._depth:
+            self._stage()
+        if len(self._staged) == 0:
+            raise StopIteration
+
+        batch, event = self._staged.popleft()
+        if event is not None:
+            self._compute_stream.wait_event(event)
+        self._num_batches += 1
+        self._stall_time += time.perf_counter() - start
+        return batch
+
+    @property
+    def metrics(self):
+        """
+        Metrics of the device prefetch stage:
+
+        queue_depth: number of batches staged ahead currently.
+
+        num_batches: number of batches output.
+
+        stall_time: total seconds blocked in getting batches, which is
+        mostly waiting for the data loading pipeline to produce batches.
+
+        avg_stall_time: average stall_time per batch.
+        """
+        return {
+            'queue_depth': len(self._staged),
+            'num_batches': self._num_batches,
+            'stall_time': self._stall_time,
+            'avg_stall_time': self._stall_time / max(self._num_batches, 1),
+        }
@@ -17,6 +17,66 @@ import numpy as np
 from ...framework import core
 
 
+# sample number converted from numpy array to python list at a time by
+# samplers, which bounds the memory of python int objects
+_CHUNK_SIZE = 65536
+
+
+class _FeistelPermutation:
+    """
+    A pseudo-random permutation of [0, size) keyed by :attr:`seed`, which
+    maps positions to permuted indices in batch without holding an index
+    array of :attr:`size`.
+
+    The permutation is a balanced Feistel network on the smallest domain of
+    2^(2k) >= size, positions mapped outside [0, size) are mapped again until
+    they fall inside (cycle walking), which keeps it a bijection on [0, size).
+    """
+
+    ROUNDS = 4
+
+    def __init__(self, size, seed):
+        assert size > 0, "size of permutation should be positive"
+        self.size = size
+        half_bits = max(1, (int(size - 1).bit_length() + 1) // 2)
+        self._half_bits = np.uint64(half_bits)
+        self._mask = np.uint64((1 << half_bits) - 1)
+        self._keys = np.random.RandomState(seed).randint(
+            0, 2**32, size=self.ROUNDS, dtype='uint64'
+        )
+
+    def _round(self, value, key):
+        # splitmix64 finalizer, uint64 multiplication wraps around
+        value = value ^ key
+        value ^= value >> np.uint64(30)
+        value *= np.uint64(0xBF58476D1CE4E5B9)
+        value ^= value >> np.uint64(27)
+        value *= np.uint64(0x94D049BB133111EB)
+        value ^= value >> np.uint64(31)
+        return value & self._mask
+
+    def _encrypt(self, value):
+        left = value >> self._half_bits
+        right = value & self._mask
+        for key in self._keys:
+            left, right = right, left ^ self._round(right, key)
+        return (left << self._half_bits) | right
+
+    def __call__(self, positions):
+        """
+        Map an int64 array of positions in [0, size) to permuted indices.
+        """
+        values = self._encrypt(np.asarray(positions, dtype='uint64'))
+        outside = values >= self.size
+        while outside.any():
+            values[outside] = self._encrypt(values[outside])
+            outside = values >= self.size
+        return values.astype('int64')
+
+    def __len__(self):
+        return self.size
+
+
 class Sampler:
     """
     An abstract class to encapsulate methods and behaviors of samplers.
@@ -162,6 +222,13 @@ class RandomSampler(Sampler):
         num_samples(int, optional): set sample number to draw if :attr:`replacement`
                 is True, then it will take samples according to the number you set. Default None, disabled.
         generator(Generator, optional): specify a generator to sample the :code:`data_source`. Default None, disabled.
+        low_memory(bool, optional): If True and :attr:`replacement` is False,
+                shuffled indices are generated chunk by chunk by a
+                pseudo-random permutation with O(1) memory instead of
+                holding a permutation array of the whole :attr:`data_source`,
+                which is useful for very large datasets. Note that the shuffled
+                order is different from the order when :attr:`low_memory` is
+                False. Default False.
 
     Returns:
         RandomSampler: a Sampler yield sample index randomly.
@@ -198,12 +265,18 @@ class RandomSampler(Sampler):
     """
 
     def __init__(
-        self, data_source, replacement=False, num_samples=None, generator=None
+        self,
+        data_source,
+        replacement=False,
+        num_samples=None,
+        generator=None,
+        low_memory=False,
     ):
         self.data_source = data_source
         self.replacement = replacement
         self._num_samples = num_samples
         self.generator = generator
+        self.low_memory = low_memory
 
         if not isinstance(self.replacement, bool):
             raise TypeError(
@@ -237,17 +310,25 @@ class RandomSampler(Sampler):
                 except StopIteration:
                     return
                 yield index
+        elif self.replacement:
+            # NOTE: draw indices chunk by chunk, which generates the same
+            #       indices as drawing all at once
+            for start in range(0, self.num_samples, _CHUNK_SIZE):
+                size = min(_CHUNK_SIZE, self.num_samples - start)
+                yield from np.random.randint(0, n, size=size).tolist()
+        elif self.low_memory:
+            permutation = _FeistelPermutation(
+                n, np.random.randint(0, 2**32, dtype='int64')
+            )
+            for start in range(0, n, _CHUNK_SIZE):
+                positions = np.arange(
+                    start, min(start + _CHUNK_SIZE, n), dtype='int64'
+                )
+                yield from permutation(positions).tolist()
         else:
-            if self.replacement:
-                for index in np.random.choice(
-                    np.arange(n), self.num_samples, replace=True
-                ).tolist():
-                    yield index
-            else:
-                for index in np.random.choice(
-                    np.arange(n), n, replace=False
-                ).tolist():
-                    yield index
+            indices = np.random.permutation(n)
+            for start in range(0, n, _CHUNK_SIZE):
+                yield from indices[start : start + _CHUNK_SIZE].tolist()
 
     def __len__(self):
         return self.num_samples
@@ -15,6 +15,7 @@
 import os
 import queue
 import sys
+import time
 import traceback
 
 import numpy as np
@@ -40,6 +41,10 @@ class _ResumeIteration:
     pass
 
 
+class _RetireWorker:
+    pass
+
+
 class _DatasetKind:
     MAP = 0
     ITER = 1
@@ -287,6 +292,7 @@ def _worker_loop(
     use_shared_memory,
     base_seed,
     shm_cahce_size=0,
+    idle_time=None,
 ):
     try:
         # NOTE: [ mmap files clear ] When the child process exits unexpectedly,
@@ -334,6 +340,9 @@ def _worker_loop(
         iterator_drained = False
         parent_watch_dog = ParentWatchDog()
 
+        # NOTE: idle time is only counted when indices got, waiting time
+        #       between epochs is not counted
+        idle_start = time.perf_counter()
         while parent_watch_dog.is_alive():
             try:
                 data = indices_queue.get(MP_STATUS_CHECK_INTERVAL)
@@ -344,10 +353,19 @@ def _worker_loop(
                 out_queue.put((data, None, None))
                 iterator_drained = False
                 fetcher = _DatasetKind.create_fetcher(
-                    dataset_kind, dataset, auto_collate_batch, collate_fn, True
+                    dataset_kind,
+                    dataset,
+                    auto_collate_batch,
+                    collate_fn,
+                    drop_last,
                 )
+                idle_start = time.perf_counter()
                 continue
 
+            # retired by autoscaling of DataLoader
+            if isinstance(data, _RetireWorker):
+                break
+
             # None as poison piil, so worker event should be set
             if data is None:
                 assert (
@@ -360,6 +378,8 @@ def _worker_loop(
                 continue
 
             idx, indices = data
+            if idle_time is not None:
+                idle_time.value += time.perf_counter() - idle_start
             try:
                 if init_exception is not None:
                     batch = init_exception
@@ -401,6 +421,7 @@ def _worker_loop(
                     out_queue.put((idx, tensor_list, structure))
                 else:
                     out_queue.put((idx, batch, structure))
+            idle_start = time.perf_counter()
     except KeyboardInterrupt:
         # NOTE: Main process will raise KeyboardInterrupt anyways, ignore it in child process
         pass
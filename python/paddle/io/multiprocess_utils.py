@@ -39,10 +39,29 @@ def _clear_multiprocess_queue_set():
                 break
 
 
+# NOTE: The shared memory segments created by the main process for
+# paddle.reader.multiprocess_reader, they are unlinked when the reader
+# finishes, and the remaining ones are unlinked at exit.
+shared_memory_set = set()
+
+
+def _unlink_shared_memory_set():
+    global shared_memory_set
+    for shm in list(shared_memory_set):
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+        shared_memory_set.discard(shm)
+
+
 # NOTE: main process clear function at exit
 def _cleanup():
     # NOTE: inter-process Queue shared memory objects clear function
     _clear_multiprocess_queue_set()
+    # NOTE: shared memory segments of paddle.reader.multiprocess_reader
+    _unlink_shared_memory_set()
     # NOTE: main process memory map files clear function
     core._cleanup_mmap_fds()
 
@@ -34,6 +34,7 @@ from .dataloader.dataloader_iter import (
     _DataLoaderIterSingleProcess,
     _DatasetKind,
 )
+from .dataloader.prefetcher import _DevicePrefetcher
 
 # NOTE: [ avoid hanging & failed quickly ]
 # These value is used in getting data from another process
@@ -311,6 +312,28 @@ class DataLoader:
         worker_init_fn(callable, optional): init function which will be called with
             worker id on each subproces starting if not set as None. Default
             None.
+        persistent_workers(bool, optional): whether to keep the subprocesses,
+            their inter-process queues and dataset objects alive after a
+            dataset has been consumed once, so the next ``iter(loader)`` can
+            resume them instead of starting new subprocesses. Indices of
+            :attr:`batch_sampler` are regenerated on each ``iter(loader)``,
+            so epoch set by ``batch_sampler.set_epoch`` before it takes effect.
+            Only enabled in multi-process mode. Default False.
+        device_prefetch(int, optional): number of batches to copy to the
+            target place ahead of the current batch in dynamic mode. If
+            :attr:`device_prefetch` > 0, batches are loaded into host memory,
+            copied into recycled pinned buffers and then copied to the target
+            GPU on a separate stream while the current batch is being used,
+            metrics of this stage can be
+            got by ``iter(loader).metrics``. On places without stream
+            support, e.g. CPU, batches are only buffered. Default 0, which
+            means loading batches to the target place directly.
+        worker_autoscaler(WorkerAutoScaler, optional): policy to adjust the
+            number of subprocesses and :attr:`prefetch_factor` between epochs
+            by measuring consumer waiting time and worker idle time, see
+            ``paddle.io.WorkerAutoScaler``. Only enabled in multi-process mode
+            with map-style dataset. Default None, which means the number of
+            subprocesses is fixed.
 
     Returns:
         DataLoader: an iterable object for data iterating, each elemnet of the generated data is a Tensor.
@@ -399,6 +422,8 @@ class DataLoader:
         timeout=0,
         worker_init_fn=None,
         persistent_workers=False,
+        device_prefetch=0,
+        worker_autoscaler=None,
     ):
         self.return_list = return_list
         self.collate_fn = collate_fn
@@ -422,6 +447,20 @@ class DataLoader:
             places = _get_paddle_place(places)
         self.places = _convert_places(places)
 
+        assert device_prefetch >= 0, "device_prefetch should be non-negative"
+        self._device_prefetch = device_prefetch if in_dynamic_mode() else 0
+        self._prefetch_place = None
+        if self._device_prefetch > 0:
+            assert (
+                len(self.places) == 1
+            ), "device_prefetch only supports single place"
+            self._prefetch_place = self.places[0]
+            if isinstance(self._prefetch_place, core.CUDAPlace):
+                # load batches on CPU, the device prefetch stage copies them
+                # into pinned buffers and then to GPU asynchronously, since
+                # the reader doesn't pin batches for CUDAPinnedPlace
+                self.places = [core.CPUPlace()]
+
         assert num_workers >= 0, "num_workers should be a non-negative value"
         if num_workers > 0 and (
             sys.platform == 'darwin' or sys.platform == 'win32'
@@ -495,6 +534,7 @@ class DataLoader:
             )
 
         self._persistent_workers = persistent_workers
+        self._worker_autoscaler = worker_autoscaler
         self._iterator = None
         self.num_workers = AuToTune(self).__call__()
 
@@ -509,15 +549,22 @@ class DataLoader:
 
     def __iter__(self):
         if self.num_workers == 0:
-            return _DataLoaderIterSingleProcess(self)
+            iterator = _DataLoaderIterSingleProcess(self)
         elif self._persistent_workers:
-            if self._iterator is None:
+            # recreate workers if they are shut down for exception
+            if self._iterator is None or self._iterator._shutdown:
                 self._iterator = _DataLoaderIterMultiProcess(self)
             else:
                 self._iterator._reset()
-            return self._iterator
+            iterator = self._iterator
         else:
-            return _DataLoaderIterMultiProcess(self)
+            iterator = _DataLoaderIterMultiProcess(self)
+
+        if self._device_prefetch > 0:
+            return _DevicePrefetcher(
+                iterator, self._prefetch_place, self._device_prefetch
+            )
+        return iterator
 
     def __call__(self):
         return self.__iter__()
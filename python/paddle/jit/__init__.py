@@ -21,6 +21,8 @@ from .api import ignore_module
 from .dy2static.program_translator import enable_to_static
 
 from .dy2static.logging_utils import set_code_level, set_verbosity
+from .dy2static.disk_cache import set_cache_dir
+from .dy2static.shape_bucket import ShapeBucket
 from .translated_layer import TranslatedLayer
 
 __all__ = [  # noqa
@@ -33,4 +35,6 @@ __all__ = [  # noqa
     'set_verbosity',
     'not_to_static',
     'enable_to_static',
+    'set_cache_dir',
+    'ShapeBucket',
 ]
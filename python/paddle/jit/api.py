@@ -255,7 +255,11 @@ def to_static(
             of the computational graph. For more information about build_strategy,
             please refer to :code:`paddle.static.BuildStrategy`. The default is None.
         backend(str, Optional): Specifies compilation backend, which can be `CINN` or None. When backend is `CINN`, CINN compiler will be used to speed up training and inference.
-        kwargs: Support keys including `property`, set `property` to True if the fucntion is python property.
+        kwargs: Support keys including `property`, `cache_size` and `shape_bucket`.
+            Set `property` to True if the fucntion is python property. `cache_size` is the max number
+            of traced programs kept for the function, the least recently used one is evicted when
+            exceeded, default None means no limit. `shape_bucket` is a :code:`paddle.jit.ShapeBucket`
+            to pad the variable-length inputs up to a few bucket sizes to reduce the traced programs.
 
 
     Returns:
@@ -284,6 +288,8 @@ def to_static(
 
     """
     property = kwargs.get("property", False)
+    cache_size = kwargs.get("cache_size", None)
+    shape_bucket = kwargs.get("shape_bucket", None)
 
     def decorated(python_func):
         """
@@ -315,6 +321,8 @@ def to_static(
                 build_strategy=build_strategy,
                 property=property,
                 backend=backend,
+                cache_size=cache_size,
+                shape_bucket=shape_bucket,
             ),
         )
 
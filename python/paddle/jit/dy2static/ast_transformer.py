@@ -21,7 +21,7 @@ import os
 
 from . import logging_utils
 from .assert_transformer import AssertTransformer
-from .base_transformer import BaseTransformer
+from .base_transformer import BaseTransformer, FusedTransformer
 from .basic_api_transformer import BasicApiTransformer, NameloadJstTransformer
 from .break_continue_transformer import (
     BreakContinueTransformer,
@@ -43,6 +43,16 @@ from .utils import ast_to_source_code
 
 __all__ = []
 
+# Transformers which rewrite a node after visiting its children and leave
+# the nodes created by each other unchanged, the consecutive ones of them are
+# fused into a single traversal of the AST.
+FUSIBLE_TRANSFORMERS = (
+    CallTransformer,
+    CastTransformer,
+    DecoratorTransformer,
+    TypeHintTransformer,
+)
+
 
 def apply_optimization(transformers):
     """
@@ -59,6 +69,24 @@ def apply_optimization(transformers):
         transformers.insert(3, BreakTransformOptimizer)
 
 
+def group_fusible_transformers(transformers):
+    """
+    Splits transformers into groups in order, each group is a list of
+    consecutive fusible transformers or a single transformer.
+    """
+    groups = []
+    for transformer in transformers:
+        if (
+            groups
+            and transformer in FUSIBLE_TRANSFORMERS
+            and groups[-1][-1] in FUSIBLE_TRANSFORMERS
+        ):
+            groups[-1].append(transformer)
+        else:
+            groups.append([transformer])
+    return groups
+
+
 class DygraphToStaticAst(BaseTransformer):
     """
     Main class to transform Dygraph to Static Graph
@@ -103,14 +131,25 @@ class DygraphToStaticAst(BaseTransformer):
             CallTransformer,  # transform call recursively
             CastTransformer,  # type casting statement
             DecoratorTransformer,  # transform decorators to function call
-            NameloadJstTransformer,
             TypeHintTransformer,  # remove all typehint in gast.Name
+            NameloadJstTransformer,
         ]
 
         apply_optimization(transformers)
 
-        for index, transformer in enumerate(transformers):
-            self._apply(transformer, node, log_level=index + 1)
+        log_level = 1
+        for group in group_fusible_transformers(transformers):
+            levels = range(log_level, log_level + len(group))
+            log_level += len(group)
+            # NOTE: Apply the transformers one by one if the code after some
+            # of them is required by `set_code_level`.
+            if len(group) > 1 and not any(
+                self.translator_logger.has_code_level(level) for level in levels
+            ):
+                FusedTransformer(node, group).transform()
+                continue
+            for transformer, level in zip(group, levels):
+                self._apply(transformer, node, log_level=level)
 
         self.translator_logger.log_transformed_code(
             logging_utils.LOG_AllTransformer, self.root, "All Transformers"
@@ -50,6 +50,60 @@ class BaseTransformer(gast.NodeTransformer):
         return result
 
 
+class FusedTransformer(BaseTransformer):
+    """
+    Runs several transformers in a single traversal of the AST.
+
+    Every node is rewritten by the transformers one by one in the given order
+    after its children have been visited. It produces the same AST as running
+    the transformers one after another only if every transformer rewrites a
+    node after visiting its children (or regardless of them), and the nodes
+    created by a transformer are left unchanged by the following ones. The
+    children are visited by FusedTransformer itself, so the `generic_visit`
+    of the fused transformers is disabled.
+    """
+
+    def __init__(self, root, transformers):
+        self.root = root
+        self.transformers = []
+        for transformer in transformers:
+            transformer = transformer(root)
+            transformer.generic_visit = lambda node: node
+            # the node types handled by the transformer, other nodes are
+            # skipped instead of dispatching to the disabled `generic_visit`
+            node_types = {
+                name[len('visit_') :]
+                for name in dir(type(transformer))
+                if name.startswith('visit_')
+                and getattr(type(transformer), name)
+                is not getattr(gast.NodeTransformer, name, None)
+            }
+            self.transformers.append((transformer, node_types))
+
+    def transform(self):
+        self.visit(self.root)
+
+    def visit(self, node):
+        self.generic_visit(node)
+        nodes = [node]
+        for transformer, node_types in self.transformers:
+            new_nodes = []
+            for node in nodes:
+                if node.__class__.__name__ not in node_types:
+                    new_nodes.append(node)
+                    continue
+                result = transformer.visit(node)
+                if isinstance(result, (list, tuple)):
+                    new_nodes.extend(result)
+                elif result is not None:
+                    new_nodes.append(result)
+            nodes = new_nodes
+
+        if not nodes:
+            return None
+        return nodes[0] if len(nodes) == 1 else nodes
+
+
 class RenameTransformer(BaseTransformer):
     def __init__(self, node):
         assert isinstance(
@@ -141,12 +141,35 @@ class NameloadJstTransformer(BaseTransformer):
         return self.root
 
     def _surround_with_ld(self, node):
-        node = (
-            gast.parse(f"_jst.Ld({utils.ast_to_source_code(node).strip()})")
-            .body[0]
-            .value
+        # NOTE: Build `_jst.Ld(node)` directly instead of parsing its source
+        # code, which is much faster for the large number of names.
+        return gast.Call(
+            func=gast.Attribute(
+                value=gast.Name(
+                    id='_jst',
+                    ctx=gast.Load(),
+                    annotation=None,
+                    type_comment=None,
+                ),
+                attr='Ld',
+                ctx=gast.Load(),
+            ),
+            args=[node],
+            keywords=[],
         )
-        return node
+
+    def _is_jst_attribute(self, node):
+        """
+        Returns whether the source code of node starts with `_jst.`.
+        """
+        while isinstance(node, (gast.Attribute, gast.Call, gast.Subscript)):
+            value = node.func if isinstance(node, gast.Call) else node.value
+            if isinstance(node, gast.Attribute) and isinstance(
+                value, gast.Name
+            ):
+                return value.id == '_jst'
+            node = value
+        return False
 
     def visit_Call(self, node):
         """
@@ -159,7 +182,7 @@ class NameloadJstTransformer(BaseTransformer):
     def visit_Attribute(self, node):
         assert isinstance(node, gast.Attribute)
         assert isinstance(node.attr, str)
-        if utils.ast_to_source_code(node).startswith("_jst."):  # skip _jst.xxx
+        if self._is_jst_attribute(node):  # skip _jst.xxx
             return node
         self.generic_visit(node)
         if isinstance(node.ctx, gast.Load):
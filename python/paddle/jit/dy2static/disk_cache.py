@@ -0,0 +1,197 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import threading
+
+from paddle.version import commit, full_version
+
+from . import logging_utils
+from .utils import unwrap
+
+__all__ = []
+
+CACHE_DIR_ENV_NAME = 'TRANSLATOR_CACHE_DIR'
+# NOTE: Increase it when the layout of cached entries is changed.
+CACHE_FORMAT_VERSION = 1
+
+_cache_dir = None
+_caches = {}
+_caches_lock = threading.Lock()
+_recorders = threading.local()
+
+
+class DiskCache:
+    """
+    Content-addressed cache of picklable objects in a directory, which can be
+    shared by processes. Entries are written to temporary files and renamed
+    atomically, so concurrent writers of the same key are safe.
+
+    Args:
+        cache_dir(str): The directory to save the entries.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _path(self, namespace, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, namespace, digest[:2], digest)
+
+    def get(self, namespace, key):
+        """
+        Returns the object saved with key, or None if not found or broken.
+        """
+        path = self._path(namespace, key)
+        try:
+            with open(path, 'rb') as f:
+                entry_key, value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging_utils.log(1, f"Failed to load dy2static cache {path}: {e}")
+            return None
+        # guard against hash collision
+        if entry_key != key:
+            return None
+        logging_utils.log(2, f"Hit dy2static cache {path}.")
+        return value
+
+    def put(self, namespace, key, value):
+        """
+        Saves value with key, returns whether it is saved. Unpicklable value
+        is not saved.
+        """
+        try:
+            data = pickle.dumps((key, value), protocol=4)
+        except Exception as e:
+            logging_utils.log(1, f"Skip saving dy2static cache: {e}")
+            return False
+        path = self._path(namespace, key)
+        dirname = os.path.dirname(path)
+        try:
+            os.makedirs(dirname, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            logging_utils.log(1, f"Failed to save dy2static cache {path}: {e}")
+            return False
+        return True
+
+
+def set_cache_dir(cache_dir):
+    """
+    Sets the directory to cache the transformed code and programs of
+    dygraph to static graph on disk. With the cache, restarted jobs and
+    other processes sharing the directory can skip the conversion of the
+    same functions and inputs.
+
+    There are two means to set the directory:
+
+    1. Call function `set_cache_dir`
+
+    2. Set environment variable `TRANSLATOR_CACHE_DIR`
+
+    **Note**:
+    `set_cache_dir` has a higher priority than the environment variable.
+    The cache is keyed on the source code of converted functions, the
+    input specs, the structure of the layer and the paddle version, so the
+    python states which change the traced program, such as global
+    variables, should be kept the same when sharing the cache.
+
+    Args:
+        cache_dir(str|None): The cache directory, None or empty string to
+            disable the cache.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> paddle.jit.set_cache_dir('./dy2static_cache')
+    """
+    global _cache_dir
+    _cache_dir = cache_dir or ''
+
+
+def get_disk_cache():
+    """
+    Returns the DiskCache of the configured directory, or None if disabled.
+    """
+    cache_dir = _cache_dir
+    if cache_dir is None:
+        cache_dir = os.getenv(CACHE_DIR_ENV_NAME, '')
+    if not cache_dir:
+        return None
+    with _caches_lock:
+        if cache_dir not in _caches:
+            _caches[cache_dir] = DiskCache(cache_dir)
+        return _caches[cache_dir]
+
+
+def make_key(*parts):
+    """
+    Makes a cache key of parts, which should have stable `repr`.
+    """
+    return repr((CACHE_FORMAT_VERSION, full_version, commit) + parts)
+
+
+@contextlib.contextmanager
+def record_sources():
+    """
+    Records the source files of functions converted in the context, the
+    recorded set contains None if the source file of some function is
+    unknown.
+    """
+    if not hasattr(_recorders, 'stack'):
+        _recorders.stack = []
+    sources = set()
+    _recorders.stack.append(sources)
+    try:
+        yield sources
+    finally:
+        _recorders.stack.pop()
+
+
+def record_source(func):
+    stack = getattr(_recorders, 'stack', None)
+    if not stack:
+        return
+    try:
+        path = inspect.getsourcefile(unwrap(func))
+    except TypeError:
+        path = None
+    for sources in stack:
+        sources.add(path)
+
+
+def hash_file(path):
+    """
+    Returns sha256 of the file, or None if failed to read it.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
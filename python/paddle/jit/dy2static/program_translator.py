@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import collections
+import concurrent.futures
 import inspect
 import os
 import textwrap
@@ -35,6 +36,13 @@ from paddle.utils import flatten, gast
 
 from . import error, logging_utils
 from .ast_transformer import DygraphToStaticAst
+from .disk_cache import (
+    get_disk_cache,
+    hash_file,
+    make_key,
+    record_source,
+    record_sources,
+)
 from .function_spec import (
     FunctionSpec,
     _hash_spec_names,
@@ -70,6 +78,10 @@ MAX_TRACED_PROGRAM_COUNT = 10
 
 CONVERSION_OPTIONS = "__jst_not_to_static"
 
+# The number of worker processes to transform the callees of converted
+# functions concurrently, 0 means transforming them one by one on demand.
+CONVERT_WORKERS_ENV_NAME = 'TRANSLATOR_CONVERT_WORKERS'
+
 
 def synchronized(func):
     func.__lock__ = threading.Lock()
@@ -91,12 +103,16 @@ class FunctionCache:
         self._converted_static_func_caches = weakref.WeakKeyDictionary()
         # Caches the converted ast node for same source code. {source_code: ast_root}
         self._code_to_ast_caches = {}
+        # Transformations running in worker processes. {source_code: future}
+        self._code_to_ast_futures = {}
+        self._executor = None
         self._dygraph_to_static = DygraphToStaticAst()
 
     def convert_with_cache(self, func):
         """
         Returns the cached static function or converts it when first encounters the function.
         """
+        record_source(func)
         # If hit cache, return it directly.
         static_func = self._converted_static_func_caches.get(func, None)
 
@@ -137,21 +153,202 @@ class FunctionCache:
         if source_code in self._code_to_ast_caches:
             root = self._code_to_ast_caches[source_code]
         else:
-            root = gast.parse(source_code)
-            root = attach_origin_info(root, func)
-            root = self._dygraph_to_static.get_static_ast(root)
+            root = self._transform(func, source_code)
             self._code_to_ast_caches[source_code] = root
 
         # Get static function from AST
         static_func, file_name = ast_to_func(root, func)
 
         create_and_update_origin_info_map(root, static_func)
+        # The callees will be converted when they are called, transform them
+        # in advance concurrently.
+        self.prefetch(_static_callees(root, func))
         return static_func
 
+    def _ast_cache_key(self, func, source_code):
+        # NOTE: origin info attached to AST depends on the location of func
+        code = getattr(func, '__code__', None)
+        return make_key(
+            source_code,
+            inspect.getsourcefile(func),
+            getattr(code, 'co_firstlineno', None),
+            os.environ.get('FLAGS_optim_transformation'),
+        )
+
+    def _transform(self, func, source_code):
+        """
+        Transforms the source code of func into static AST, the transformed
+        AST is loaded from and saved into the disk cache if enabled.
+        """
+        disk_cache = get_disk_cache()
+        if disk_cache is not None:
+            key = self._ast_cache_key(func, source_code)
+            root = disk_cache.get('ast', key)
+            if root is not None:
+                return root
+
+        root = self._get_prefetched(source_code)
+        if root is None:
+            root = gast.parse(source_code)
+            root = attach_origin_info(root, func)
+            root = self._dygraph_to_static.get_static_ast(root)
+        if disk_cache is not None:
+            disk_cache.put('ast', key, root)
+        return root
+
+    def _get_executor(self):
+        try:
+            workers = int(os.environ.get(CONVERT_WORKERS_ENV_NAME, 0))
+        except ValueError:
+            workers = 0
+        if workers <= 0:
+            return None
+        if self._executor is None:
+            # NOTE: Worker processes are created in the same way as the
+            # workers of DataLoader, which are forked on Linux.
+            self._executor = concurrent.futures.ProcessPoolExecutor(workers)
+        return self._executor
+
+    def prefetch(self, functions):
+        """
+        Transforms the functions concurrently in worker processes, and the
+        transformed AST is used when converting them later. It is enabled by
+        setting environment variable `TRANSLATOR_CONVERT_WORKERS` to the
+        number of worker processes, because the transformation is pure python
+        code and can not run concurrently in threads.
+        """
+        executor = self._get_executor()
+        if executor is None:
+            return
+        disk_cache = get_disk_cache()
+        for func in functions:
+            func = unwrap(func)
+            try:
+                source_code = func_to_source_code(func)
+                if (
+                    source_code in self._code_to_ast_caches
+                    or source_code in self._code_to_ast_futures
+                ):
+                    continue
+                if disk_cache is not None:
+                    key = self._ast_cache_key(func, source_code)
+                    root = disk_cache.get('ast', key)
+                    if root is not None:
+                        self._code_to_ast_caches[source_code] = root
+                        continue
+                root = gast.parse(source_code)
+                root = attach_origin_info(root, func)
+            except (OSError, TypeError, SyntaxError):
+                continue
+            self._code_to_ast_futures[source_code] = executor.submit(
+                _transform_in_worker, root
+            )
+
+    def _get_prefetched(self, source_code):
+        future = self._code_to_ast_futures.pop(source_code, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            # NOTE: Transform it again in this process, so that the error is
+            # raised with the original stack.
+            logging_utils.log(
+                1, f"Failed to transform in worker process, retry it: {e}"
+            )
+            return None
+
     def exist(self, func):
         return func in self._converted_static_func_caches
 
 
+def _transform_in_worker(root):
+    return DygraphToStaticAst().get_static_ast(root)
+
+
+def _need_prefetch(func):
+    from .convert_call_func import BUILTIN_LIKELY_MODULES
+
+    if not (inspect.isfunction(func) or inspect.ismethod(func)):
+        return False
+    if func.__name__ == '<lambda>' or inspect.isgeneratorfunction(func):
+        return False
+    options = getattr(func, CONVERSION_OPTIONS, None)
+    if options is not None and options.not_convert:
+        return False
+    module = getattr(func, '__module__', None) or ''
+    builtin_modules = {m.__name__ for m in BUILTIN_LIKELY_MODULES}
+    if module.split('.')[0] in builtin_modules:
+        return False
+    return not is_paddle_func(func)
+
+
+def _static_callees(root, func):
+    """
+    Yields the functions called in the transformed AST of func, which can be
+    found statically, i.e. `_jst.Call(name)` with name in the globals or
+    closure of func, and `_jst.Call(self.method)` of a bound method.
+    """
+    func = unwrap(func)
+    func_self = getattr(func, '__self__', None)
+    try:
+        closure_vars = inspect.getclosurevars(func)
+    except (TypeError, ValueError):
+        return
+    scope = {**closure_vars.globals, **closure_vars.nonlocals}
+
+    def is_jst_call(node, name):
+        # matches `_jst.name(x)`
+        return (
+            isinstance(node, gast.Call)
+            and len(node.args) == 1
+            and isinstance(node.func, gast.Attribute)
+            and node.func.attr == name
+            and isinstance(node.func.value, gast.Name)
+            and node.func.value.id == '_jst'
+        )
+
+    def unwrap_ld(node):
+        # `_jst.Ld(x)` is added to all the loaded names
+        while is_jst_call(node, 'Ld'):
+            node = node.args[0]
+        return node
+
+    for node in gast.walk(root):
+        if not is_jst_call(node, 'Call'):
+            continue
+        callee = unwrap_ld(node.args[0])
+        if isinstance(callee, gast.Name):
+            callee = scope.get(callee.id)
+        elif (
+            func_self is not None
+            and isinstance(callee, gast.Attribute)
+            and isinstance(unwrap_ld(callee.value), gast.Name)
+            and unwrap_ld(callee.value).id == 'self'
+        ):
+            # NOTE: Sublayers are not found by `getattr_static`, they are
+            # prefetched by `_sublayer_forwards` instead.
+            callee = inspect.getattr_static(func_self, callee.attr, None)
+            if isinstance(callee, staticmethod):
+                callee = callee.__func__
+        else:
+            continue
+        if isinstance(callee, layers.Layer):
+            callee = getattr(callee, 'forward', None)
+        if _need_prefetch(callee):
+            yield callee
+
+
+def _sublayer_forwards(layer):
+    """
+    Yields the forward functions of the sublayers of layer to convert.
+    """
+    for sublayer in layer.sublayers():
+        forward = getattr(sublayer, 'forward', None)
+        if _need_prefetch(forward):
+            yield forward
+
+
 _CACHE_LOCK = threading.Lock()
 _FUNCTION_CACHE = FunctionCache()
 
@@ -353,7 +550,8 @@ class StaticFunction:
 
         self._input_spec = input_spec
         self._function_spec = FunctionSpec(function, input_spec)
-        self._program_cache = ProgramCache()
+        self._program_cache = ProgramCache(kwargs.get("cache_size", None))
+        self._shape_bucket = kwargs.get("shape_bucket", None)
         self._descriptor_cache = weakref.WeakKeyDictionary()
         # Note: Hold a reference to ProgramTranslator for switching `enable_to_static`.
         self._program_trans = ProgramTranslator()
@@ -521,6 +719,9 @@ class StaticFunction:
     def get_traced_count(self):
         raise NotImplementedError("Not implemented yet.")
 
+    def get_cache_stats(self):
+        raise NotImplementedError("Not implemented yet.")
+
     @property
     def code(self):
         raise NotImplementedError("Not implemented yet.")
@@ -772,6 +973,11 @@ class ASTStaticFunction(StaticFunction):
     def _perform_call(self, *args, **kwargs):
         # 1. trace ops from dygraph layers and cache the generated program.
         args, kwargs = self._function_spec.unified_args_and_kwargs(args, kwargs)
+        padded = None
+        if self._shape_bucket is not None:
+            args, padded = self._shape_bucket.pad_inputs(
+                args, self._function_spec.args_name
+            )
 
         try:
             concrete_program, partial_program_layer = self.get_concrete_program(
@@ -790,7 +996,10 @@ class ASTStaticFunction(StaticFunction):
 
             # 3. return outputs.
             try:
-                return partial_program_layer(args)
+                outputs = partial_program_layer(args)
+                if padded:
+                    outputs = self._shape_bucket.slice_back(outputs, padded)
+                return outputs
             except Exception as e:
                 if not hasattr(e, error.ERROR_DATA):
                     # runtime error
@@ -884,6 +1093,13 @@ class ASTStaticFunction(StaticFunction):
         """
         return len(self._program_cache)
 
+    def get_cache_stats(self):
+        """
+        Returns the hit/miss/retrace statistics of the traced programs, see
+        `ProgramCache.stats`.
+        """
+        return self._program_cache.stats()
+
     @property
     def code(self):
         """
@@ -1174,6 +1390,9 @@ class ConcreteProgram:
 
         # Transforms dygraph function into static function and caches it.
         dygraph_function = func_spec.dygraph_function
+        if class_instance is not None:
+            with _CACHE_LOCK:
+                _FUNCTION_CACHE.prefetch(_sublayer_forwards(class_instance))
         static_func = convert_to_static(dygraph_function)
         # apply pre\post hook for outermost layer
         hook_helper = HookHelper(
@@ -1255,6 +1474,220 @@ class ConcreteProgram:
             **kwargs,
         )
 
+    def to_cache_entry(self, sources):
+        """
+        Returns a picklable entry to save the program into the disk cache,
+        or None if the program can not be cached.
+
+        Args:
+            sources(set): source files of the functions converted to build
+                the program, the entry is valid only if they are unchanged.
+        """
+        if None in sources:
+            return None
+        dependencies = {path: hash_file(path) for path in sources}
+        if None in dependencies.values():
+            return None
+        try:
+            inputs = _to_cache_skeleton(self.inputs)
+            outputs = _to_cache_skeleton(self.outputs)
+        except _NotCacheable:
+            return None
+        block = self.main_program.global_block()
+        return {
+            'dependencies': dependencies,
+            'main_program': self.main_program.desc.serialize_to_string(),
+            'data_vars': [
+                name for name, var in block.vars.items() if var.is_data
+            ],
+            'inputs': inputs,
+            'outputs': outputs,
+            'parameters': [param.name for param in self.parameters],
+            'name_generator': self.name_generator,
+        }
+
+    @staticmethod
+    @switch_to_static_graph
+    def from_cache_entry(entry, cache_key):
+        """
+        Restores the program saved by `to_cache_entry`, returns None if the
+        entry is outdated.
+        """
+        for path, digest in entry['dependencies'].items():
+            if hash_file(path) != digest:
+                return None
+        class_instance = cache_key.class_instance
+        tensors = dict(get_parameters(class_instance))
+        tensors.update(get_buffers(class_instance))
+        if any(name not in tensors for name in entry['parameters']):
+            return None
+        parameters = [tensors[name] for name in entry['parameters']]
+
+        main_program = framework.Program.parse_from_string(
+            entry['main_program']
+        )
+        startup_program = framework.Program()
+        main_program.random_seed = framework.default_main_program().random_seed
+        startup_program.random_seed = (
+            framework.default_startup_program().random_seed
+        )
+        block = main_program.global_block()
+        # NOTE: `is_data` is not serialized in program desc
+        for name in entry['data_vars']:
+            block.var(name).is_data = True
+        inputs = _from_cache_skeleton(entry['inputs'], block, class_instance)
+        outputs = _from_cache_skeleton(entry['outputs'], block, class_instance)
+
+        return ConcreteProgram(
+            inputs=inputs,
+            outputs=outputs,
+            parameters=parameters,
+            function=cache_key.function_spec.dygraph_function,
+            name_generator=entry['name_generator'],
+            main_program=main_program,
+            startup_program=startup_program,
+            **cache_key.kwargs,
+        )
+
+
+class _NotCacheable(Exception):
+    pass
+
+
+class _VarRef:
+    def __init__(self, name):
+        self.name = name
+
+
+class _InstanceRef:
+    pass
+
+
+def _to_cache_skeleton(obj):
+    """
+    Replaces Variables in inputs or outputs of program by their names, and
+    the layer instance by `_InstanceRef`.
+    """
+    if isinstance(obj, framework.Variable):
+        return _VarRef(obj.name)
+    elif isinstance(obj, layers.Layer):
+        return _InstanceRef()
+    elif isinstance(obj, core.eager.Tensor):
+        raise _NotCacheable()
+    elif isinstance(obj, (list, tuple)):
+        result = [_to_cache_skeleton(item) for item in obj]
+        return type(obj)(result) if isinstance(obj, tuple) else result
+    elif isinstance(obj, dict):
+        return type(obj)((k, _to_cache_skeleton(v)) for k, v in obj.items())
+    return obj
+
+
+def _from_cache_skeleton(skeleton, block, class_instance):
+    if isinstance(skeleton, _VarRef):
+        return block.var(skeleton.name)
+    elif isinstance(skeleton, _InstanceRef):
+        return class_instance
+    elif isinstance(skeleton, (list, tuple)):
+        result = [
+            _from_cache_skeleton(item, block, class_instance)
+            for item in skeleton
+        ]
+        return type(skeleton)(result) if isinstance(skeleton, tuple) else result
+    elif isinstance(skeleton, dict):
+        return type(skeleton)(
+            (k, _from_cache_skeleton(v, block, class_instance))
+            for k, v in skeleton.items()
+        )
+    return skeleton
+
+
+def _disk_cache_key(cache_key):
+    """
+    Returns the key of cache_key in the disk cache, or None if it can not be
+    cached across processes.
+    """
+    # NOTE: hooks are not part of the source code
+    if cache_key.kwargs.get('with_hook', False):
+        return None
+    class_instance = cache_key.class_instance
+    if class_instance is not None and not isinstance(
+        class_instance, layers.Layer
+    ):
+        return None
+    function = unwrap(cache_key.function_spec.dygraph_function)
+    try:
+        source_code = func_to_source_code(function)
+        source_file = inspect.getsourcefile(function)
+    except (OSError, TypeError):
+        return None
+    specs = repr(
+        (cache_key.input_args_with_spec, cache_key.input_kwargs_with_spec)
+    )
+    # repr of object like `<object at 0x7f...>` differs between processes
+    if ' at 0x' in specs:
+        return None
+
+    layer = None
+    if class_instance is not None:
+        layer = (
+            type(class_instance).__module__,
+            type(class_instance).__qualname__,
+            repr(class_instance),
+            [
+                (name, t.name, tuple(t.shape), str(t.dtype), t.stop_gradient)
+                for name, t in class_instance.state_dict().items()
+            ],
+        )
+    tracer = framework._dygraph_tracer()
+    amp = (tracer._amp_level, tracer._amp_dtype) if tracer else None
+    return make_key(
+        source_code,
+        source_file,
+        function.__qualname__,
+        specs,
+        layer,
+        cache_key.kwargs.get('is_train', False),
+        cache_key.kwargs.get('backend'),
+        cache_key._new_ir_flags,
+        os.environ.get('FLAGS_optim_transformation'),
+        core._is_fwd_prim_enabled(),
+        core._is_bwd_prim_enabled(),
+        amp,
+    )
+
+
+def _concrete_program_from_cache_key(cache_key):
+    """
+    Builds the concrete program of cache_key, the program is loaded from and
+    saved into the disk cache if enabled.
+    """
+    disk_cache = get_disk_cache()
+    disk_key = None
+    if disk_cache is not None:
+        disk_key = _disk_cache_key(cache_key)
+    if disk_key is not None:
+        entry = disk_cache.get('program', disk_key)
+        if entry is not None:
+            concrete_program = ConcreteProgram.from_cache_entry(
+                entry, cache_key
+            )
+            if concrete_program is not None:
+                return concrete_program
+
+    with record_sources() as sources:
+        concrete_program = ConcreteProgram.from_func_spec(
+            func_spec=cache_key.function_spec,
+            input_spec=cache_key.input_args_with_spec,
+            input_kwargs_spec=cache_key.input_kwargs_with_spec,
+            class_instance=cache_key.class_instance,
+            **cache_key.kwargs,
+        )
+    if disk_key is not None:
+        entry = concrete_program.to_cache_entry(sources)
+        if entry is not None:
+            disk_cache.put('program', disk_key, entry)
+    return concrete_program
+
 
 def _program_hash(program):
     """
@@ -1379,12 +1812,21 @@ class ProgramCache:
 
     dy2static_error_file = "to_static.error"
 
-    def __init__(self):
-        # {hash_id : (concrete_program, partial_layer)}
+    def __init__(self, max_size=None):
+        if max_size is not None and max_size < 1:
+            raise ValueError(
+                f"max_size of ProgramCache should be a positive integer or None, but received {max_size}."
+            )
+        # {hash_id : (concrete_program, partial_layer)}, in the order of
+        # least recently used to most recently used
         self._caches = collections.OrderedDict()
+        self._max_size = max_size
         # trace mostly recent used program
         self._recent_key = None
         self._recent_cache_key = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def _build_once(self, cache_key):
         # TODO(Aurelius84): Need a gloabl FLAGS to enable/disable to_prim
@@ -1393,13 +1835,7 @@ class ProgramCache:
         # NOTE(xiongkun): Need a global FLAGS to enable/disable fallback
         enable_fallback = enable_prim
         try:
-            concrete_program = ConcreteProgram.from_func_spec(
-                func_spec=cache_key.function_spec,
-                input_spec=cache_key.input_args_with_spec,
-                input_kwargs_spec=cache_key.input_kwargs_with_spec,
-                class_instance=cache_key.class_instance,
-                **cache_key.kwargs,
-            )
+            concrete_program = _concrete_program_from_cache_key(cache_key)
         except Exception as e:
             if enable_fallback:
                 warnings.warn(
@@ -1448,8 +1884,19 @@ class ProgramCache:
         item_id = hash(item)
         self._recent_cache_key = item
         self._recent_key = item_id
-        if item_id not in self._caches:
+        if item_id in self._caches:
+            self._hits += 1
+            self._caches.move_to_end(item_id)
+        else:
+            self._misses += 1
             self._caches[item_id] = self._build_once(item)
+            # evict the least recently used programs
+            while (
+                self._max_size is not None
+                and len(self._caches) > self._max_size
+            ):
+                self._caches.popitem(last=False)
+                self._evictions += 1
             # Note: raise warnings if number of traced program is more than `max_tracing_count`
             current_tracing_count = len(self._caches)
             if current_tracing_count > MAX_TRACED_PROGRAM_COUNT:
@@ -1491,6 +1938,26 @@ class ProgramCache:
     def concrete_programs(self):
         return [cp for key, (cp, _) in self._caches.items()]
 
+    def stats(self):
+        """
+        Returns the statistics of the cache, a dict with keys:
+
+        - hits: number of lookups which found the cached program.
+        - misses: number of lookups which traced a new program.
+        - retraces: number of traces after the first one, caused by new
+          input shapes/types or evicted programs.
+        - evictions: number of programs evicted by the max size.
+        - size/max_size: current number and max number of programs.
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'retraces': max(self._misses - 1, 0),
+            'evictions': self._evictions,
+            'size': len(self._caches),
+            'max_size': self._max_size,
+        }
+
     def clear(self):
         self._caches = collections.OrderedDict()
 
@@ -0,0 +1,183 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bisect
+
+import numpy as np
+
+import paddle
+from paddle.base import core
+
+__all__ = []
+
+
+class ShapeBucket:
+    """
+    Shape bucketing policy of the function decorated by
+    :code:`paddle.jit.to_static`.
+
+    Each program traced by :code:`to_static` is specialized to the shapes of
+    input tensors, so inputs with variable length, such as sentences, trigger
+    a new trace for every distinct length. With ShapeBucket, the given
+    dimensions of input tensors are padded up to a few bucket sizes before
+    calling the function, so a small fixed set of programs covers all the
+    shapes. The padded positions should be masked by the function, such as
+    padding the attention mask with 0, and the axes of outputs given by
+    ``output_axes`` are sliced back to the original size.
+
+    Args:
+        axes(dict): The dimensions to pad, a dict of argument name to an axis
+            or a list of axes.
+        buckets(list[int]|None, optional): The sizes to pad the dimensions up
+            to. None means padding up to the next power of two. Dimensions
+            larger than the largest bucket are not padded. Default: None.
+        pad_value(float|dict, optional): The value to pad with, or a dict of
+            argument name to the value. Default: 0.
+        output_axes(dict|None, optional): The axes of outputs to slice back
+            to the original size, a dict of the index of an output tensor in
+            the flattened outputs to an axis or a list of axes. All the
+            padded dimensions should have the same original size if it's
+            set. None means returning the padded outputs. Default: None.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+
+            >>> class Net(paddle.nn.Layer):
+            ...     def __init__(self):
+            ...         super().__init__()
+            ...         self.embedding = paddle.nn.Embedding(100, 8)
+            ...
+            ...     def forward(self, ids):
+            ...         return self.embedding(ids)
+
+            >>> bucket = paddle.jit.ShapeBucket(axes={'ids': 1}, output_axes={0: 1})
+            >>> net = paddle.jit.to_static(Net(), shape_bucket=bucket)
+            >>> for length in range(5, 9):
+            ...     out = net(paddle.randint(1, 100, [2, length]))
+            >>> print(out.shape)
+            [2, 8, 8]
+            >>> # all the lengths are padded to 8, so only one program is traced
+            >>> print(net.forward.get_traced_count())
+            1
+    """
+
+    def __init__(self, axes, buckets=None, pad_value=0, output_axes=None):
+        if not isinstance(axes, dict):
+            raise TypeError(
+                f"axes of ShapeBucket should be a dict of argument name to axes, but received {type(axes).__name__}."
+            )
+        self.axes = {
+            name: [axis] if isinstance(axis, int) else list(axis)
+            for name, axis in axes.items()
+        }
+        if buckets is not None:
+            buckets = sorted(buckets)
+            if not buckets or buckets[0] <= 0:
+                raise ValueError(
+                    f"buckets of ShapeBucket should be positive integers, but received {buckets}."
+                )
+        self.buckets = buckets
+        self.pad_value = pad_value
+        if output_axes is not None and not isinstance(output_axes, dict):
+            raise TypeError(
+                f"output_axes of ShapeBucket should be a dict of output index to axes, but received {type(output_axes).__name__}."
+            )
+        self.output_axes = {
+            index: [axis] if isinstance(axis, int) else list(axis)
+            for index, axis in (output_axes or {}).items()
+        }
+
+    def bucket_size(self, size):
+        """
+        Returns the size which a dimension of size is padded up to.
+        """
+        if size <= 0:
+            return size
+        if self.buckets is None:
+            return 1 << (size - 1).bit_length()
+        index = bisect.bisect_left(self.buckets, size)
+        return self.buckets[index] if index < len(self.buckets) else size
+
+    def _pad_value(self, name):
+        if isinstance(self.pad_value, dict):
+            return self.pad_value.get(name, 0)
+        return self.pad_value
+
+    def _pad(self, value, name, padded):
+        is_tensor = isinstance(value, core.eager.Tensor)
+        if not is_tensor and not isinstance(value, np.ndarray):
+            return value
+        ndim = len(value.shape)
+        for axis in self.axes[name]:
+            axis = axis + ndim if axis < 0 else axis
+            if axis < 0 or axis >= ndim:
+                raise ValueError(
+                    f"Can not pad axis {axis} of argument `{name}` with shape {list(value.shape)}."
+                )
+            size = value.shape[axis]
+            target = self.bucket_size(size)
+            if target == size:
+                continue
+            pad_shape = list(value.shape)
+            pad_shape[axis] = target - size
+            if is_tensor:
+                pad = paddle.full(pad_shape, self._pad_value(name), value.dtype)
+                value = paddle.concat([value, pad], axis=axis)
+            else:
+                pad = np.full(pad_shape, self._pad_value(name), value.dtype)
+                value = np.concatenate([value, pad], axis=axis)
+            padded.append((axis, target, size))
+        return value
+
+    def pad_inputs(self, args, arg_names):
+        """
+        Pads the arguments in args, which are in the order of arg_names.
+
+        Returns:
+            tuple: (padded args, list of (axis, padded size, original size)).
+        """
+        padded = []
+        args = list(args)
+        for i, name in enumerate(arg_names[: len(args)]):
+            if name in self.axes:
+                args[i] = self._pad(args[i], name, padded)
+        return tuple(args), padded
+
+    def slice_back(self, outputs, padded):
+        """
+        Slices the axes of the output tensors given by ``output_axes`` back to
+        the original size.
+        """
+        if not self.output_axes or not padded:
+            return outputs
+        sizes = {size for _, _, size in padded}
+        if len(sizes) > 1:
+            raise ValueError(
+                f"output_axes of ShapeBucket requires the padded dimensions to have the same size, but received sizes {sorted(sizes)}."
+            )
+        size = sizes.pop()
+
+        flat_outputs = paddle.utils.flatten(outputs)
+        for index, axes in self.output_axes.items():
+            value = flat_outputs[index]
+            if not isinstance(value, core.eager.Tensor):
+                continue
+            ndim = len(value.shape)
+            axes = [axis + ndim if axis < 0 else axis for axis in axes]
+            flat_outputs[index] = paddle.slice(
+                value, axes, [0] * len(axes), [size] * len(axes)
+            )
+        return paddle.utils.pack_sequence_as(outputs, flat_outputs)
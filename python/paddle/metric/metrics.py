@@ -31,6 +31,18 @@ def _is_numpy_(var):
     return isinstance(var, (np.ndarray, np.generic))
 
 
+def _is_tensor_(var):
+    return isinstance(var, (paddle.Tensor, paddle.base.core.eager.Tensor))
+
+
+def _to_numpy_(var, name):
+    if _is_tensor_(var):
+        return np.array(var)
+    elif not _is_numpy_(var):
+        raise ValueError(f"The '{name}' must be a numpy ndarray or Tensor.")
+    return var
+
+
 class Metric(metaclass=abc.ABCMeta):
     r"""
     Base class for metric, encapsulates metric logic and APIs
@@ -186,6 +198,32 @@ class Metric(metaclass=abc.ABCMeta):
         """
         return args
 
+    def get_state(self):
+        """
+        Get the mergeable states of the metric, which is a dict of numpy
+        arrays (counts, histograms, sums) that can be summed elementwise over
+        metric instances, e.g. instances on different ranks, to get the
+        states of all the updated data.
+
+        Returns:
+            dict|None: the states, None if states of this metric cannot be
+            merged by summation, which is the default.
+        """
+        return None
+
+    def merge_state(self, state):
+        """
+        Merge states returned by :code:`get_state` of another instance into
+        this metric, as if this metric is updated with the data of the
+        other instance too.
+
+        Args:
+            state (dict): states returned by :code:`get_state`.
+        """
+        raise NotImplementedError(
+            f"function 'merge_state' not implemented in {self.__class__.__name__}."
+        )
+
 
 class Accuracy(Metric):
     """
@@ -312,6 +350,30 @@ class Accuracy(Metric):
         self.total = [0.0] * len(self.topk)
         self.count = [0] * len(self.topk)
 
+    def get_state(self):
+        """
+        Get the correct counts and total counts of each top-k.
+
+        Returns:
+            dict: {'total': numpy.ndarray, 'count': numpy.ndarray}, both in
+            the shape of [len(topk)].
+        """
+        return {
+            'total': np.array(self.total, dtype='float64'),
+            'count': np.array(self.count, dtype='int64'),
+        }
+
+    def merge_state(self, state):
+        """
+        Add the counts returned by :code:`get_state` to the states.
+
+        Args:
+            state (dict): states returned by :code:`get_state`.
+        """
+        for i, (t, c) in enumerate(zip(state['total'], state['count'])):
+            self.total[i] += float(t)
+            self.count[i] += int(c)
+
     def accumulate(self):
         """
         Computes and returns the accumulated metric.
@@ -349,6 +411,10 @@ class Precision(Metric):
     Args:
         name (str, optional): String name of the metric instance.
             Default is `precision`.
+        on_device (bool, optional): Whether to count true and false positives
+            by Paddle OPs in :code:`compute`, so only the counts are fetched
+            from device instead of the predictions and labels. Default is
+            False.
 
     Examples:
         .. code-block:: python
@@ -402,45 +468,74 @@ class Precision(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
-    def __init__(self, name='precision', *args, **kwargs):
+    def __init__(self, name='precision', on_device=False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.tp = 0  # true positive
         self.fp = 0  # false positive
         self._name = name
+        self._on_device = on_device
+
+    def compute(self, preds, labels, *args):
+        """
+        Count true and false positives by Paddle OPs if `on_device` is True,
+        otherwise pass the inputs to :code:`update`.
+
+        Args:
+            preds (Tensor): The prediction result, usually the output of
+                two-class sigmoid function.
+            labels (Tensor): The ground truth (labels), the shape should keep
+                the same as preds.
+
+        Return:
+            Tensor: the counts [true positive, false positive] with shape
+            [2] if `on_device` is True, otherwise `preds` and `labels`.
+        """
+        if not self._on_device:
+            return (preds, labels, *args)
+        return self._count(preds, labels)
 
-    def update(self, preds, labels):
+    @staticmethod
+    def _count(preds, labels):
+        # a prediction is positive if floor(pred + 0.5) == 1
+        preds = paddle.reshape(preds, [-1])
+        pred_pos = paddle.logical_and(preds >= 0.5, preds < 1.5)
+        label_pos = paddle.reshape(labels, [-1]) == 1
+        tp = paddle.sum(
+            paddle.cast(paddle.logical_and(pred_pos, label_pos), 'int64')
+        )
+        fp = paddle.sum(paddle.cast(pred_pos, 'int64')) - tp
+        return paddle.stack([tp, fp])
+
+    def update(self, preds, labels=None):
         """
         Update the states based on the current mini-batch prediction results.
 
         Args:
-            preds (numpy.ndarray): The prediction result, usually the output
-                of two-class sigmoid function. It should be a vector (column
-                vector or row vector) with data type: 'float64' or 'float32'.
-            labels (numpy.ndarray): The ground truth (labels),
+            preds (numpy.ndarray|Tensor): The prediction result, usually the
+                output of two-class sigmoid function. It should be a vector
+                (column vector or row vector) with data type: 'float64' or
+                'float32'. If `labels` is None, it is the counts returned by
+                :code:`compute` with `on_device` as True.
+            labels (numpy.ndarray|Tensor, optional): The ground truth (labels),
                 the shape should keep the same as preds.
                 The data type is 'int32' or 'int64'.
         """
-        if isinstance(preds, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            preds = np.array(preds)
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        if isinstance(labels, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            labels = np.array(labels)
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
+        if labels is None:
+            tp, fp = _to_numpy_(preds, 'preds').reshape([-1]).tolist()
+        elif _is_tensor_(preds) and _is_tensor_(labels):
+            # count on the device of the tensors, only fetch the counts
+            tp, fp = np.array(self._count(preds, labels)).tolist()
+        else:
+            preds = _to_numpy_(preds, 'preds')
+            labels = _to_numpy_(labels, 'labels')
 
-        sample_num = labels.shape[0]
-        preds = np.floor(preds + 0.5).astype("int32")
+            preds = np.floor(preds + 0.5).astype("int32").reshape([-1])
+            pred_pos = preds == 1
+            tp = int(np.count_nonzero(pred_pos & (labels.reshape([-1]) == 1)))
+            fp = int(np.count_nonzero(pred_pos)) - tp
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+        self.tp += tp
+        self.fp += fp
 
     def reset(self):
         """
@@ -449,6 +544,25 @@ class Precision(Metric):
         self.tp = 0
         self.fp = 0
 
+    def get_state(self):
+        """
+        Get the counts of true positives and false positives.
+
+        Returns:
+            dict: {'tp': numpy.ndarray, 'fp': numpy.ndarray}
+        """
+        return {'tp': np.array(self.tp), 'fp': np.array(self.fp)}
+
+    def merge_state(self, state):
+        """
+        Add the counts returned by :code:`get_state` to the states.
+
+        Args:
+            state (dict): states returned by :code:`get_state`.
+        """
+        self.tp += int(state['tp'])
+        self.fp += int(state['fp'])
+
     def accumulate(self):
         """
         Calculate the final precision.
@@ -481,6 +595,10 @@ class Recall(Metric):
     Args:
         name (str, optional): String name of the metric instance.
             Default is `recall`.
+        on_device (bool, optional): Whether to count true positives and false
+            negatives by Paddle OPs in :code:`compute`, so only the counts are
+            fetched from device instead of the predictions and labels.
+            Default is False.
 
     Examples:
         .. code-block:: python
@@ -534,45 +652,75 @@ class Recall(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
-    def __init__(self, name='recall', *args, **kwargs):
+    def __init__(self, name='recall', on_device=False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.tp = 0  # true positive
         self.fn = 0  # false negative
         self._name = name
+        self._on_device = on_device
+
+    def compute(self, preds, labels, *args):
+        """
+        Count true positives and false negatives by Paddle OPs if `on_device`
+        is True, otherwise pass the inputs to :code:`update`.
+
+        Args:
+            preds (Tensor): prediction results of current mini-batch, the
+                output of two-class sigmoid function.
+            labels (Tensor): ground truth (labels) of current mini-batch, the
+                shape should keep the same as preds.
+
+        Return:
+            Tensor: the counts [true positive, false negative] with shape
+            [2] if `on_device` is True, otherwise `preds` and `labels`.
+        """
+        if not self._on_device:
+            return (preds, labels, *args)
+        return self._count(preds, labels)
 
-    def update(self, preds, labels):
+    @staticmethod
+    def _count(preds, labels):
+        # a prediction is positive if rint(pred) == 1, rint rounds half to
+        # even, so 0.5 is negative and 1.5 is 2
+        preds = paddle.reshape(preds, [-1])
+        pred_pos = paddle.logical_and(preds > 0.5, preds < 1.5)
+        label_pos = paddle.reshape(labels, [-1]) == 1
+        tp = paddle.sum(
+            paddle.cast(paddle.logical_and(pred_pos, label_pos), 'int64')
+        )
+        fn = paddle.sum(paddle.cast(label_pos, 'int64')) - tp
+        return paddle.stack([tp, fn])
+
+    def update(self, preds, labels=None):
         """
         Update the states based on the current mini-batch prediction results.
 
         Args:
-            preds(numpy.array): prediction results of current mini-batch,
-                the output of two-class sigmoid function.
+            preds(numpy.array|Tensor): prediction results of current
+                mini-batch, the output of two-class sigmoid function.
                 Shape: [batch_size, 1]. Dtype: 'float64' or 'float32'.
-            labels(numpy.array): ground truth (labels) of current mini-batch,
-                the shape should keep the same as preds.
+                If `labels` is None, it is the counts returned by
+                :code:`compute` with `on_device` as True.
+            labels(numpy.array|Tensor, optional): ground truth (labels) of
+                current mini-batch, the shape should keep the same as preds.
                 Shape: [batch_size, 1], Dtype: 'int32' or 'int64'.
         """
-        if isinstance(preds, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            preds = np.array(preds)
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        if isinstance(labels, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            labels = np.array(labels)
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
+        if labels is None:
+            tp, fn = _to_numpy_(preds, 'preds').reshape([-1]).tolist()
+        elif _is_tensor_(preds) and _is_tensor_(labels):
+            # count on the device of the tensors, only fetch the counts
+            tp, fn = np.array(self._count(preds, labels)).tolist()
+        else:
+            preds = _to_numpy_(preds, 'preds')
+            labels = _to_numpy_(labels, 'labels')
 
-        sample_num = labels.shape[0]
-        preds = np.rint(preds).astype("int32")
+            preds = np.rint(preds).astype("int32").reshape([-1])
+            label_pos = labels.reshape([-1]) == 1
+            tp = int(np.count_nonzero(label_pos & (preds == 1)))
+            fn = int(np.count_nonzero(label_pos)) - tp
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
+        self.tp += tp
+        self.fn += fn
 
     def accumulate(self):
         """
@@ -591,6 +739,25 @@ class Recall(Metric):
         self.tp = 0
         self.fn = 0
 
+    def get_state(self):
+        """
+        Get the counts of true positives and false negatives.
+
+        Returns:
+            dict: {'tp': numpy.ndarray, 'fn': numpy.ndarray}
+        """
+        return {'tp': np.array(self.tp), 'fn': np.array(self.fn)}
+
+    def merge_state(self, state):
+        """
+        Add the counts returned by :code:`get_state` to the states.
+
+        Args:
+            state (dict): states returned by :code:`get_state`.
+        """
+        self.tp += int(state['tp'])
+        self.fn += int(state['fn'])
+
     def name(self):
         """
         Returns metric name
@@ -602,7 +769,6 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
 
     The `auc` function creates four local variables, `true_positives`,
     `true_negatives`, `false_positives` and `false_negatives` that are used to
@@ -620,6 +786,11 @@ class Auc(Metric):
             'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         name (str, optional): String name of the metric instance. Default
             is `auc`.
+        on_device (bool, optional): Whether to compute the histograms of
+            predictions by Paddle OPs in :code:`compute`, so only the
+            histograms with shape [2, num_thresholds + 1] are fetched from
+            device instead of the predictions and labels, which is faster for
+            large batch size. Default is False.
 
     "NOTE: only implement the ROC curve type via Python now."
 
@@ -680,47 +851,89 @@ class Auc(Metric):
     """
 
     def __init__(
-        self, curve='ROC', num_thresholds=4095, name='auc', *args, **kwargs
+        self,
+        curve='ROC',
+        num_thresholds=4095,
+        name='auc',
+        on_device=False,
+        *args,
+        **kwargs,
     ):
         super().__init__(*args, **kwargs)
         self._curve = curve
         self._num_thresholds = num_thresholds
+        self._on_device = on_device
 
         _num_pred_buckets = num_thresholds + 1
         self._stat_pos = np.zeros(_num_pred_buckets)
         self._stat_neg = np.zeros(_num_pred_buckets)
         self._name = name
 
-    def update(self, preds, labels):
+    def compute(self, preds, labels, *args):
+        """
+        Compute the histograms of predictions of positive and negative
+        instances by Paddle OPs if `on_device` is True, otherwise pass the
+        inputs to :code:`update`.
+
+        Args:
+            preds (Tensor): A tensor in the shape of (batch_size, 2),
+                preds[i][j] denotes the probability of classifying the
+                instance i into the class j.
+            labels (Tensor): A tensor in the shape of (batch_size, 1),
+                labels[i] is either o or 1, representing the label of the
+                instance i.
+
+        Return:
+            Tensor: the histograms with shape [2, num_thresholds + 1] if
+            `on_device` is True, otherwise `preds` and `labels`.
+        """
+        if not self._on_device:
+            return (preds, labels, *args)
+        return self._histogram(preds, labels)
+
+    def _histogram(self, preds, labels):
+        bin_idx = paddle.cast(preds[:, 1] * self._num_thresholds, 'int64')
+        labels = paddle.cast(paddle.reshape(labels, [-1]) != 0, 'int64')
+        num_buckets = self._num_thresholds + 1
+        total = paddle.bincount(bin_idx, minlength=num_buckets)
+        pos = paddle.bincount(bin_idx, weights=labels, minlength=num_buckets)
+        return paddle.stack([pos, total - pos])
+
+    def update(self, preds, labels=None):
         """
         Update the auc curve with the given predictions and labels.
 
         Args:
-            preds (numpy.array): An numpy array in the shape of
+            preds (numpy.array|Tensor): An numpy array in the shape of
                 (batch_size, 2), preds[i][j] denotes the probability of
-                classifying the instance i into the class j.
-            labels (numpy.array): an numpy array in the shape of
-                (batch_size, 1), labels[i] is either o or 1,
+                classifying the instance i into the class j. If `labels` is
+                None, it is the histograms returned by :code:`compute` with
+                `on_device` as True.
+            labels (numpy.array|Tensor, optional): an numpy array in the
+                shape of (batch_size, 1), labels[i] is either o or 1,
                 representing the label of the instance i.
         """
-        if isinstance(labels, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            labels = np.array(labels)
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
-
-        if isinstance(preds, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            preds = np.array(preds)
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
+        num_buckets = self._num_thresholds + 1
+        if labels is None or (_is_tensor_(preds) and _is_tensor_(labels)):
+            if labels is None:
+                hist = _to_numpy_(preds, 'preds')
             else:
-                self._stat_neg[bin_idx] += 1.0
+                # compute histograms on the device of the tensors
+                hist = np.array(self._histogram(preds, labels))
+            # bincount gives more buckets if any prediction is larger than 1
+            assert hist.shape == (2, num_buckets)
+            self._stat_pos += hist[0]
+            self._stat_neg += hist[1]
+            return
+
+        labels = _to_numpy_(labels, 'labels')
+        preds = _to_numpy_(preds, 'preds')
+
+        bin_idx = (preds[:, 1] * self._num_thresholds).astype('int64')
+        assert np.all(bin_idx >= 0) and np.all(bin_idx <= self._num_thresholds)
+        labels = labels.reshape([len(labels), -1])[:, 0] != 0
+        self._stat_pos += np.bincount(bin_idx[labels], minlength=num_buckets)
+        self._stat_neg += np.bincount(bin_idx[~labels], minlength=num_buckets)
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
@@ -733,21 +946,21 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(
-                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
+        # accumulate from the highest threshold to the lowest
+        tot_pos = np.cumsum(self._stat_pos[::-1])
+        tot_neg = np.cumsum(self._stat_neg[::-1])
+        tot_pos_prev = np.concatenate([[0.0], tot_pos[:-1]])
+        tot_neg_prev = np.concatenate([[0.0], tot_neg[:-1]])
+        auc = float(
+            np.sum(
+                self.trapezoid_area(
+                    tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
+                )
             )
-            idx -= 1
+        )
 
+        tot_pos = float(tot_pos[-1])
+        tot_neg = float(tot_neg[-1])
         return (
             auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
         )
@@ -760,6 +973,29 @@ class Auc(Metric):
         self._stat_pos = np.zeros(_num_pred_buckets)
         self._stat_neg = np.zeros(_num_pred_buckets)
 
+    def get_state(self):
+        """
+        Get the histograms of predictions of positive and negative instances.
+
+        Returns:
+            dict: {'stat_pos': numpy.ndarray, 'stat_neg': numpy.ndarray},
+            both in the shape of [num_thresholds + 1].
+        """
+        return {
+            'stat_pos': self._stat_pos.copy(),
+            'stat_neg': self._stat_neg.copy(),
+        }
+
+    def merge_state(self, state):
+        """
+        Add the histograms returned by :code:`get_state` to the states.
+
+        Args:
+            state (dict): states returned by :code:`get_state`.
+        """
+        self._stat_pos += np.asarray(state['stat_pos'])
+        self._stat_neg += np.asarray(state['stat_neg'])
+
     def name(self):
         """
         Returns metric name
@@ -49,6 +49,10 @@ from paddle.utils import deprecated
 
 __all__ = []
 
+# The max size in bytes of the flat buffers which the parameters and buffers
+# are coalesced into by Layer.to, 0 means transforming them one by one.
+_BULK_TRANSFORM_BUFFER_SIZE = 256 * 1024 * 1024
+
 _first_cap_re = re.compile('(.)([A-Z][a-z]+)')
 _all_cap_re = re.compile('([a-z])([A-Z])')
 
@@ -2183,6 +2187,86 @@ class Layer:
 
         return t
 
+    def _bulk_transform(self, tensors, device, dtype, blocking):
+        """
+        Coalesces the tensors of the same place and dtype into a few flat
+        buffers, casts and copies each buffer in one shot, and shares the
+        slices of the buffers to the tensors.
+
+        Returns:
+            set: The ids of the transformed tensors, the others are left to
+            be transformed one by one.
+        """
+        if dtype is not None and type(dtype) is not VarDesc.VarType:
+            dtype = convert_np_dtype_to_dtype_(dtype)
+
+        groups = collections.OrderedDict()
+        for t in tensors:
+            if (
+                not t.is_dense()
+                or not t._is_initialized()
+                or t._numel() == 0
+                or (
+                    (dtype is None or dtype == t.dtype)
+                    and (device is None or t.place._equals(device))
+                )
+            ):
+                continue
+            groups.setdefault((str(t.place), t.dtype), []).append(t)
+
+        transformed = set()
+        for group in groups.values():
+            chunk, chunk_size = [], 0
+            size_dtype = core.size_of_dtype(group[0].dtype)
+            for t in group + [None]:
+                size = 0 if t is None else t._numel() * size_dtype
+                if chunk and (
+                    t is None or chunk_size + size > _BULK_TRANSFORM_BUFFER_SIZE
+                ):
+                    if len(chunk) > 1 and self._transform_flat(
+                        chunk, chunk_size, device, dtype, blocking
+                    ):
+                        transformed.update(id(t) for t in chunk)
+                    chunk, chunk_size = [], 0
+                if t is not None:
+                    chunk.append(t)
+                    chunk_size += size
+        return transformed
+
+    def _transform_flat(self, tensors, nbytes, device, dtype, blocking):
+        place = tensors[0].place
+        if dtype is None:
+            dtype = tensors[0].dtype
+        if place.is_gpu_place():
+            # the flat buffer and the casted one are allocated before the
+            # tensors are released, so fall back to transform one by one if
+            # the gpu memory is not enough.
+            cast_nbytes = (
+                nbytes
+                // core.size_of_dtype(tensors[0].dtype)
+                * core.size_of_dtype(dtype)
+            )
+            if core.gpu_memory_available() < (nbytes + cast_nbytes) * 1.2:
+                return False
+
+        with paddle.base.framework._dygraph_place_guard(place=place):
+            flat = paddle.concat([t.reshape([-1]) for t in tensors])
+            if dtype != flat.dtype:
+                flat = flat.cast(dtype=dtype)
+        if device is not None and not flat.place._equals(device):
+            flat = flat._copy_to(device, blocking)
+
+        offset = 0
+        for t in tensors:
+            shape, numel = t.shape, t._numel()
+            dst_tensor = t.value().get_tensor()
+            dst_tensor._share_data_with(
+                flat.get_tensor()._slice(offset, offset + numel)
+            )
+            dst_tensor._set_dims(shape)
+            offset += numel
+        return True
+
     def _to_impl(
         self,
         device=None,
@@ -2242,13 +2326,44 @@ class Layer:
                 blocking, bool
             ), "blocking value error, must be the True, False or None"
 
+        def need_transform(t):
+            return not floating_only or paddle.is_floating_point(t)
+
         def transform(t, device, dtype, blocking):
-            if floating_only and (not paddle.is_floating_point(t)):
+            if not need_transform(t) or id(t) in transformed:
                 return t
             return self._transform(t, device, dtype, blocking)
 
+        layers = (
+            self.sublayers(include_self=True) if include_sublayers else [self]
+        )
+        # gradients are coalesced apart from parameters, otherwise clearing
+        # the gradients would not release their memory.
+        tensors, grads = collections.OrderedDict(), collections.OrderedDict()
+        for layer in layers:
+            for param in layer._parameters.values():
+                if param is None:
+                    continue
+                tensors[id(param)] = param
+                if param.grad is not None:
+                    grad = param._grad_ivar()
+                    grads[id(grad)] = grad
+            for buf in layer._buffers.values():
+                if buf is not None:
+                    tensors[id(buf)] = buf
+
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", category=UserWarning)
+            transformed = set()
+            if _BULK_TRANSFORM_BUFFER_SIZE > 0:
+                with no_grad():
+                    for group in [tensors, grads]:
+                        transformed |= self._bulk_transform(
+                            [t for t in group.values() if need_transform(t)],
+                            device,
+                            dtype,
+                            blocking,
+                        )
             self._apply(transform, device, dtype, blocking, include_sublayers)
 
         self._dtype = dtype
@@ -19,6 +19,7 @@ from .profiler import SummaryView
 from .profiler import TracerEventType
 from .utils import RecordEvent, load_profiler_result
 from .profiler_statistic import SortedKeys
+from .sampler import SamplingProfiler
 
 __all__ = [
     'ProfilerState',
@@ -31,4 +32,5 @@ __all__ = [
     'load_profiler_result',
     'SortedKeys',
     'SummaryView',
+    'SamplingProfiler',
 ]
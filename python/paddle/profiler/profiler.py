@@ -346,6 +346,45 @@ def _get_supported_targets() -> Iterable[ProfilerTarget]:
     return [ProfilerTarget.CPU, ProfilerTarget.CUSTOM_DEVICE]
 
 
+def _create_profiler(
+    targets: Optional[Iterable[ProfilerTarget]] = None,
+    custom_device_types: Optional[list] = None,
+):
+    r"""
+    Create the native profiler for the supported ones of targets.
+
+    Returns:
+        tuple: (set of the supported targets, the native profiler).
+    """
+    supported_targets = _get_supported_targets()
+    if targets:
+        targets_set = set(targets)
+        for target in targets:
+            if target not in supported_targets:
+                targets_set.remove(target)
+                warn(
+                    "Profiling {} is not supported in current context.".format(
+                        target
+                    )
+                )
+    else:
+        targets_set = supported_targets
+    profileoption = ProfilerOptions()
+    if ProfilerTarget.CPU in targets_set:
+        profileoption.trace_switch |= 1
+    if ProfilerTarget.GPU in targets_set:
+        profileoption.trace_switch |= 1 << 1
+    if ProfilerTarget.XPU in targets_set:
+        profileoption.trace_switch |= 1 << 2
+    if ProfilerTarget.CUSTOM_DEVICE in targets_set:
+        profileoption.trace_switch |= 1 << 3
+        if not custom_device_types:
+            custom_device_types = paddle.device.get_all_custom_device_type()
+    return targets_set, _Profiler.create(
+        profileoption, custom_device_types or []
+    )
+
+
 class Profiler:
     r"""
     Profiler context manager, user interface to manage profiling process to start, stop, export profiling data and print summary table.
@@ -486,32 +525,10 @@ class Profiler:
         custom_device_types: Optional[list] = [],
         with_flops: Optional[bool] = False,
     ):
-        supported_targets = _get_supported_targets()
-        if targets:
-            self.targets = set(targets)
-            for target in targets:
-                if target not in supported_targets:
-                    self.targets.remove(target)
-                    warn(
-                        "Profiling {} is not supported in current context.".format(
-                            target
-                        )
-                    )
-        else:
-            self.targets = supported_targets
-        profileoption = ProfilerOptions()
-        if ProfilerTarget.CPU in self.targets:
-            profileoption.trace_switch |= 1
-        if ProfilerTarget.GPU in self.targets:
-            profileoption.trace_switch |= 1 << 1
-        if ProfilerTarget.XPU in self.targets:
-            profileoption.trace_switch |= 1 << 2
-        if ProfilerTarget.CUSTOM_DEVICE in self.targets:
-            profileoption.trace_switch |= 1 << 3
-            if not custom_device_types:
-                custom_device_types = paddle.device.get_all_custom_device_type()
+        self.targets, self.profiler = _create_profiler(
+            targets, custom_device_types
+        )
         wrap_optimizers()
-        self.profiler = _Profiler.create(profileoption, custom_device_types)
         if callable(scheduler):
             self.scheduler = scheduler
         elif isinstance(scheduler, (tuple, list)):
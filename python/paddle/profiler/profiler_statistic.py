@@ -11,17 +11,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import array
 import collections
 import re
 from enum import Enum
 
+import numpy as np
+
 from paddle.base.core import TracerEventType, TracerMemEventType
 from paddle.utils.flops import flops
 
 from .statistic_helper import (
-    intersection_ranges,
-    merge_ranges,
-    merge_self_ranges,
+    _intersect_ranges,
+    _merge_ranges,
+    _union_ranges,
     sum_ranges,
 )
 
@@ -168,6 +171,182 @@ def traverse_tree(nodetrees):
     return results
 
 
+class EventTable:
+    r"""
+    Columnar table of the host, runtime and device events in node trees,
+    each event is a row of a numpy structured array with fields:
+
+    - kind: HOST, RUNTIME or DEVICE.
+    - type/name/thread: index of the event type in `types`, name in
+      `names` and thread id of the node tree in `threads`.
+    - device/stream: device id and stream id of device events, -1 for others.
+    - start/end: time range in ns.
+    - host: row of the host event which the runtime or device event belongs
+      to, or row of the parent host event for host events, -1 for the host
+      events under root.
+    - subtree_end: host events only, rows [row, subtree_end) are the host
+      event and all the events under it.
+
+    Root nodes of the node trees are not included.
+    """
+
+    HOST = 0
+    RUNTIME = 1
+    DEVICE = 2
+
+    dtype = np.dtype(
+        [
+            ('kind', np.int8),
+            ('type', np.int32),
+            ('name', np.int32),
+            ('thread', np.int64),
+            ('device', np.int64),
+            ('stream', np.int64),
+            ('start', np.int64),
+            ('end', np.int64),
+            ('host', np.int64),
+            ('subtree_end', np.int64),
+        ]
+    )
+
+    def __init__(self, events, types, names, threads):
+        self.events = events
+        self.types = types
+        self.names = names
+        self.threads = threads
+
+    @classmethod
+    def from_nodetrees(cls, nodetrees):
+        columns = {name: array.array('q') for name in cls.dtype.names}
+        types, type_index = [], {}
+        names, name_index = [], {}
+        threads = list(nodetrees.keys())
+
+        def index(value, values, value_index):
+            i = value_index.get(value)
+            if i is None:
+                i = value_index[value] = len(values)
+                values.append(value)
+            return i
+
+        def add(kind, node, thread, host, device=-1, stream=-1):
+            columns['kind'].append(kind)
+            columns['type'].append(index(node.type, types, type_index))
+            columns['name'].append(index(node.name, names, name_index))
+            columns['thread'].append(thread)
+            columns['device'].append(device)
+            columns['stream'].append(stream)
+            columns['start'].append(node.start_ns)
+            columns['end'].append(node.end_ns)
+            columns['host'].append(host)
+            columns['subtree_end'].append(-1)
+            return len(columns['kind']) - 1
+
+        for thread, rootnode in enumerate(nodetrees.values()):
+            # node is None marks the end of the subtree of host event row
+            stack = [(child, -1) for child in rootnode.children_node]
+            while stack:
+                node, row = stack.pop()
+                if node is None:
+                    columns['subtree_end'][row] = len(columns['kind'])
+                    continue
+                row = add(cls.HOST, node, thread, row)
+                stack.append((None, row))
+                for runtimenode in node.runtime_node:
+                    add(cls.RUNTIME, runtimenode, thread, row)
+                    for devicenode in runtimenode.device_node:
+                        add(
+                            cls.DEVICE,
+                            devicenode,
+                            thread,
+                            row,
+                            devicenode.device_id,
+                            devicenode.stream_id,
+                        )
+                for childnode in node.children_node:
+                    stack.append((childnode, row))
+
+        events = np.empty([len(columns['kind'])], dtype=cls.dtype)
+        for name, column in columns.items():
+            events[name] = np.frombuffer(column, dtype=np.int64)
+        return cls(events, types, names, threads)
+
+    def __len__(self):
+        return len(self.events)
+
+    def type_mask(self, event_type):
+        if event_type not in self.types:
+            return np.zeros([len(self.events)], dtype=bool)
+        return self.events['type'] == self.types.index(event_type)
+
+    def name_mask(self, predicate):
+        # evaluate predicate once for each distinct name
+        matched = np.array([predicate(name) for name in self.names] or [False])
+        return matched[self.events['name']]
+
+    def ranges(self, mask=None):
+        events = self.events if mask is None else self.events[mask]
+        return np.stack([events['start'], events['end']], axis=1)
+
+    def group_ranges(self, mask, *keys):
+        """
+        Group events selected by mask by the given fields, and union time
+        ranges in each group.
+
+        Returns:
+            dict: key tuple -> union of time ranges, in shape of [N, 2].
+        """
+        events = self.events[mask]
+        if len(events) == 0:
+            return {}
+        # combine the fields into one key to sort by key and start at once
+        key = np.zeros([len(events)], dtype=np.int64)
+        uniques = []
+        for k in keys:
+            values, inverse = np.unique(events[k], return_inverse=True)
+            key = key * len(values) + inverse
+            uniques.append(values)
+        starts = np.ascontiguousarray(events['start'])
+        order = np.lexsort([starts, key])
+        key = key[order]
+        ranges = np.stack([starts[order], events['end'][order]], axis=1)
+
+        boundary = np.nonzero(key[1:] != key[:-1])[0] + 1
+        begins = np.concatenate([[0], boundary])
+        ends = np.concatenate([boundary, [len(key)]])
+        result = {}
+        for begin, end in zip(begins.tolist(), ends.tolist()):
+            group_key = []
+            code = int(key[begin])
+            for values in uniques[::-1]:
+                code, index = divmod(code, len(values))
+                group_key.append(values[index].item())
+            result[tuple(group_key[::-1])] = _union_ranges(
+                ranges[begin:end], is_sorted=True
+            )
+        return result
+
+    def count_types(self, mask=None):
+        events = self.events if mask is None else self.events[mask]
+        counts = np.bincount(events['type'], minlength=len(self.types))
+        return {
+            self.types[i]: int(count)
+            for i, count in enumerate(counts)
+            if count > 0
+        }
+
+    def subtree_mask(self, host_mask):
+        """
+        Mask of events under the host events selected by host_mask,
+        including themselves.
+        """
+        rows = np.nonzero(host_mask)[0]
+        cover = np.zeros([len(self.events) + 1], dtype=np.int64)
+        np.add.at(cover, rows, 1)
+        np.add.at(cover, self.events['subtree_end'][rows], -1)
+        return np.cumsum(cover[:-1]) > 0
+
+
 def get_device_nodes(hostnode):
     '''
     Get all device nodes called in the time range of hostnode.
@@ -351,50 +530,24 @@ class TimeRangeSummary:
         )
         self.call_times = collections.defaultdict(int)
 
-    def parse(self, nodetrees):
+    def parse(self, nodetrees, event_table=None):
         r"""
         Analysis node trees in profiler result, and get time range for different tracer event type.
         """
-        thread2hostnodes = traverse_tree(nodetrees)
-        for threadid, hostnodes in thread2hostnodes.items():
-            CPUTimeRange = collections.defaultdict(list)
-            GPUTimeRange = collections.defaultdict(
-                lambda: collections.defaultdict(
-                    lambda: collections.defaultdict(list)
-                )
-            )  # device_id/type/stream_id
-            for hostnode in hostnodes[1:]:  # skip root node
-                CPUTimeRange[hostnode.type].append(
-                    (hostnode.start_ns, hostnode.end_ns)
-                )
-                self.call_times[hostnode.type] += 1
-                for runtimenode in hostnode.runtime_node:
-                    CPUTimeRange[runtimenode.type].append(
-                        (runtimenode.start_ns, runtimenode.end_ns)
-                    )
-                    self.call_times[runtimenode.type] += 1
-                    for devicenode in runtimenode.device_node:
-                        GPUTimeRange[devicenode.device_id][devicenode.type][
-                            devicenode.stream_id
-                        ].append((devicenode.start_ns, devicenode.end_ns))
-                        self.call_times[devicenode.type] += 1
-
-            for event_type, time_ranges in CPUTimeRange.items():
-                time_ranges = merge_self_ranges(time_ranges, is_sorted=False)
-                self.CPUTimeRange[event_type] = merge_ranges(
-                    self.CPUTimeRange[event_type], time_ranges, is_sorted=True
-                )
-            for device_id, device_time_ranges in GPUTimeRange.items():
-                for event_type, event_time_ranges in device_time_ranges.items():
-                    for stream_id, time_ranges in event_time_ranges.items():
-                        time_ranges = merge_self_ranges(
-                            time_ranges, is_sorted=False
-                        )
-                        self.GPUTimeRange[device_id][event_type] = merge_ranges(
-                            self.GPUTimeRange[device_id][event_type],
-                            time_ranges,
-                            is_sorted=True,
-                        )
+        if event_table is None:
+            event_table = EventTable.from_nodetrees(nodetrees)
+        kind = event_table.events['kind']
+        types = event_table.types
+
+        cpu_ranges = event_table.group_ranges(kind != EventTable.DEVICE, 'type')
+        for (type_index,), time_ranges in cpu_ranges.items():
+            self.CPUTimeRange[types[type_index]] = time_ranges
+        gpu_ranges = event_table.group_ranges(
+            kind == EventTable.DEVICE, 'device', 'type'
+        )
+        for (device_id, type_index), time_ranges in gpu_ranges.items():
+            self.GPUTimeRange[device_id][types[type_index]] = time_ranges
+        self.call_times.update(event_table.count_types())
 
         for event_type, time_ranges in self.CPUTimeRange.items():
             self.CPUTimeRangeSum[event_type] = sum_ranges(time_ranges)
@@ -414,6 +567,13 @@ class TimeRangeSummary:
         return self.CPUTimeRangeSum[event_type]
 
 
+def _count_distinct_ranges(ranges):
+    if len(ranges) == 0:
+        return 0
+    ranges = ranges[np.lexsort([ranges[:, 1], ranges[:, 0]])]
+    return 1 + int(np.count_nonzero(np.any(ranges[1:] != ranges[:-1], axis=1)))
+
+
 class DistributedSummary:
     r"""
     Analysis communication and computation time range, and their overlap.
@@ -429,75 +589,64 @@ class DistributedSummary:
         self.cpu_calls = 0
         self.gpu_calls = 0
 
-    def parse(self, nodetrees):
+    def parse(self, nodetrees, event_table=None):
         '''
         Collect all communication and computation time ranges.
         '''
-        thread2hostnodes = traverse_tree(nodetrees)
-        for threadid, hostnodes in thread2hostnodes.items():
-            for hostnode in hostnodes[1:]:  # skip root node
-                # case 1: TracerEventType is Communication
-                if hostnode.type == TracerEventType.Communication:
-                    self.cpu_communication_range.append(
-                        (hostnode.start_ns, hostnode.end_ns)
-                    )
-                    device_nodes = get_device_nodes(hostnode)
-                    for device_node in device_nodes:
-                        if device_node.type == TracerEventType.Kernel:
-                            self.gpu_communication_range.append(
-                                (device_node.start_ns, device_node.end_ns)
-                            )
-
-                # case 2: TracerEventType is Operator but is communication op
-                elif hostnode.type == TracerEventType.Operator and any(
-                    name in hostnode.name.lower()
-                    for name in _CommunicationOpName
-                ):
-                    self.cpu_communication_range.append(
-                        (hostnode.start_ns, hostnode.end_ns)
+        if event_table is None:
+            event_table = EventTable.from_nodetrees(nodetrees)
+        kind = event_table.events['kind']
+        is_host = kind == EventTable.HOST
+        is_kernel = (kind == EventTable.DEVICE) & event_table.type_mask(
+            TracerEventType.Kernel
+        )
+
+        # case 1: TracerEventType is Communication
+        # case 2: TracerEventType is Operator but is communication op
+        communication_host = is_host & (
+            event_table.type_mask(TracerEventType.Communication)
+            | (
+                event_table.type_mask(TracerEventType.Operator)
+                & event_table.name_mask(
+                    lambda name: any(
+                        op_name in name.lower()
+                        for op_name in _CommunicationOpName
                     )
-                    device_nodes = get_device_nodes(hostnode)
-                    for device_node in device_nodes:
-                        if device_node.type == TracerEventType.Kernel:
-                            self.gpu_communication_range.append(
-                                (device_node.start_ns, device_node.end_ns)
-                            )
-
-                # case 3: Others, filter kernels named with nccl
-                else:
-                    for runtimenode in hostnode.runtime_node:
-                        for devicenode in runtimenode.device_node:
-                            if devicenode.type == TracerEventType.Kernel:
-                                kernel_name = devicenode.name.lower()
-                                if (
-                                    'nccl' in kernel_name
-                                    or 'xccl' in kernel_name
-                                ):
-                                    self.gpu_communication_range.append(
-                                        (devicenode.start_ns, devicenode.end_ns)
-                                    )
-                                else:
-                                    self.computation_range.append(
-                                        (devicenode.start_ns, devicenode.end_ns)
-                                    )
-        self.cpu_calls = len(set(self.cpu_communication_range))
-        self.gpu_calls = len(set(self.gpu_communication_range))
-        self.cpu_communication_range = merge_self_ranges(
-            self.cpu_communication_range, is_sorted=False
+                )
+            )
+        )
+        # kernels called in the time range of communication events
+        communication_kernel = is_kernel & event_table.subtree_mask(
+            communication_host
+        )
+        # case 3: Others, filter kernels named with nccl
+        other_kernel = (
+            is_kernel
+            & ~communication_host[np.maximum(event_table.events['host'], 0)]
         )
-        self.gpu_communication_range = merge_self_ranges(
-            self.gpu_communication_range, is_sorted=False
+        nccl_kernel = event_table.name_mask(
+            lambda name: 'nccl' in name.lower() or 'xccl' in name.lower()
+        )
+
+        cpu_communication_range = event_table.ranges(communication_host)
+        gpu_communication_range = np.concatenate(
+            [
+                event_table.ranges(communication_kernel),
+                event_table.ranges(other_kernel & nccl_kernel),
+            ]
         )
-        self.communication_range = merge_ranges(
-            self.cpu_communication_range,
-            self.gpu_communication_range,
-            is_sorted=True,
+        self.cpu_calls = _count_distinct_ranges(cpu_communication_range)
+        self.gpu_calls = _count_distinct_ranges(gpu_communication_range)
+        self.cpu_communication_range = _union_ranges(cpu_communication_range)
+        self.gpu_communication_range = _union_ranges(gpu_communication_range)
+        self.communication_range = _merge_ranges(
+            self.cpu_communication_range, self.gpu_communication_range
         )
-        self.computation_range = merge_self_ranges(
-            self.computation_range, is_sorted=False
+        self.computation_range = _union_ranges(
+            event_table.ranges(other_kernel & ~nccl_kernel)
         )
-        self.overlap_range = intersection_ranges(
-            self.communication_range, self.computation_range, is_sorted=True
+        self.overlap_range = _intersect_ranges(
+            self.communication_range, self.computation_range
         )
 
 
@@ -866,9 +1015,11 @@ class StatisticData:
         self.event_summary = EventSummary()
         self.distributed_summary = DistributedSummary()
         self.memory_summary = MemorySummary()
-        self.time_range_summary.parse(node_trees)
+        # events for time range analysis are shared by summaries
+        event_table = EventTable.from_nodetrees(node_trees)
+        self.time_range_summary.parse(node_trees, event_table)
         self.event_summary.parse(node_trees)
-        self.distributed_summary.parse(node_trees)
+        self.distributed_summary.parse(node_trees, event_table)
         self.memory_summary.parse(node_trees)
 
 
@@ -1025,7 +1176,7 @@ def _build_table(
         ) in statistic_data.time_range_summary.CPUTimeRangeSum.items():
             if event_type != TracerEventType.Communication:
                 cpu_type_time[event_type] = value
-        if statistic_data.distributed_summary.cpu_communication_range:
+        if len(statistic_data.distributed_summary.cpu_communication_range):
             cpu_type_time[TracerEventType.Communication] = sum_ranges(
                 statistic_data.distributed_summary.cpu_communication_range
             )
@@ -1062,12 +1213,12 @@ def _build_table(
             device_time_ranges,
         ) in statistic_data.time_range_summary.GPUTimeRange.items():
             for event_type, time_range in device_time_ranges.items():
-                gpu_time_range[event_type] = merge_ranges(
-                    gpu_time_range[event_type], time_range, is_sorted=True
+                gpu_time_range[event_type] = _merge_ranges(
+                    gpu_time_range[event_type], time_range
                 )
         for event_type, time_range in gpu_time_range.items():
             gpu_type_time[event_type] = sum_ranges(time_range)
-        if statistic_data.distributed_summary.gpu_communication_range:
+        if len(statistic_data.distributed_summary.gpu_communication_range):
             gpu_type_time[TracerEventType.Communication] = sum_ranges(
                 statistic_data.distributed_summary.gpu_communication_range
             )
@@ -1247,7 +1398,7 @@ def _build_table(
 
     if views is None or SummaryView.DistributedView in views:
         # ----- Print Distribution Summary Report ----- #
-        if statistic_data.distributed_summary.communication_range:
+        if len(statistic_data.distributed_summary.communication_range):
             headers = [
                 'Name',
                 'Total Time',
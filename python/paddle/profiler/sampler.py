@@ -0,0 +1,401 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable, Optional
+
+import numpy as np
+
+from paddle.base.core import TracerEventType
+from paddle.profiler import utils
+
+from .profiler import ProfilerTarget, _create_profiler
+from .profiler_statistic import EventTable
+from .timer import Hook, benchmark
+from .utils import wrap_optimizers
+
+__all__ = []
+
+
+class _RingBuffer:
+    """
+    Fixed-size buffer of the latest `capacity` samples.
+    """
+
+    def __init__(self, capacity):
+        self._values = np.zeros([capacity], dtype=np.float64)
+        # number of samples ever recorded
+        self.count = 0
+
+    def append(self, value):
+        self._values[self.count % len(self._values)] = value
+        self.count += 1
+
+    def extend(self, values):
+        capacity = len(self._values)
+        total = len(values)
+        values = values[-capacity:]
+        start = self.count + total - len(values)
+        self._values[(start + np.arange(len(values))) % capacity] = values
+        self.count += total
+
+    def values(self):
+        return self._values[: min(self.count, len(self._values))]
+
+    def summary(self, quantiles):
+        values = self.values()
+        result = {'count': self.count}
+        if len(values) == 0:
+            return result
+        result['mean'] = float(values.mean())
+        result['max'] = float(values.max())
+        for q, value in zip(quantiles, np.percentile(values, quantiles)):
+            result[f'p{q:g}'] = float(value)
+        return result
+
+
+class _ReaderHook(Hook):
+    """
+    Record the reader cost of every batch, `before_reader` and
+    `after_reader` are called by the DataLoader.
+    """
+
+    def __init__(self, sampler):
+        self.sampler = sampler
+        self.reader_start = None
+
+    def before_reader(self, benchmark):
+        self.reader_start = time.perf_counter()
+
+    def after_reader(self, benchmark):
+        if self.reader_start is None:
+            return
+        self.sampler._record_reader(time.perf_counter() - self.reader_start)
+        self.reader_start = None
+
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class SamplingProfiler:
+    r"""
+    Low-overhead profiler which can be kept on for the whole training.
+
+    The step time and the reader cost of DataLoader are recorded for every
+    step, and one step in every ``interval`` steps is profiled to record the
+    latency of operators, kernels and layers. Only the latest ``capacity``
+    samples of each of them are kept, from which the percentiles are
+    computed by :code:`summary`, and can be scraped from a local HTTP
+    endpoint started by :code:`serve`.
+
+    The cost of profiling is paid in the sampled steps only, which are not
+    included in the step time, so the overhead can be controlled by
+    ``interval``.
+
+    Args:
+        interval (int, optional): Profile one step in every ``interval``
+            steps. Default: 100.
+        capacity (int, optional): Number of the latest samples kept for each
+            of the step time, reader cost, operators, kernels and layers.
+            Default: 1024.
+        targets (list, optional): Devices to profile, see
+            :code:`paddle.profiler.Profiler`. Default: all the supported ones.
+        quantiles (list, optional): Percentiles reported in the summary.
+            Default: [50, 90, 99].
+        custom_device_types (list, optional): Custom device types to
+            profile. Default: all the custom devices.
+
+    Note:
+        All the time is in seconds. The latency of layers is the host time
+        of their `forward`.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> import paddle.profiler as profiler
+
+            >>> linear = paddle.nn.Linear(4, 4)
+            >>> sampler = profiler.SamplingProfiler(interval=10)
+            >>> sampler.start()
+            >>> address = sampler.serve(port=0)
+            >>> for step in range(50):
+            ...     out = linear(paddle.randn([8, 4]))
+            ...     sampler.step()
+            >>> summary = sampler.summary()
+            >>> print(sorted(summary['step_time'].keys()))
+            ['count', 'max', 'mean', 'p50', 'p90', 'p99']
+            >>> sampler.stop()
+    """
+
+    def __init__(
+        self,
+        interval: int = 100,
+        capacity: int = 1024,
+        targets: Optional[Iterable[ProfilerTarget]] = None,
+        quantiles: Iterable[float] = (50, 90, 99),
+        custom_device_types: Optional[list] = None,
+    ):
+        if interval < 1:
+            raise ValueError(
+                f"interval should be a positive integer, but got {interval}."
+            )
+        if capacity < 1:
+            raise ValueError(
+                f"capacity should be a positive integer, but got {capacity}."
+            )
+        self.interval = interval
+        self.capacity = capacity
+        self.quantiles = list(quantiles)
+        self.targets, self.profiler = _create_profiler(
+            targets, custom_device_types
+        )
+        wrap_optimizers()
+
+        self.step_num = 0
+        self.sampled_steps = 0
+        self._lock = threading.Lock()
+        self._step_time = _RingBuffer(capacity)
+        self._reader_cost = _RingBuffer(capacity)
+        self._latencies = {'op': {}, 'kernel': {}, 'layer': {}}
+        self._hook = _ReaderHook(self)
+        self._hook_key = f'sampling_profiler_{id(self)}'
+        self._running = False
+        self._sampling = False
+        self._step_start = None
+        self._start_time = None
+        self._overhead = 0.0
+        self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        r"""
+        Start recording, the first sampled step is the ``interval``-th step.
+        """
+        if self._running:
+            return
+        benchmark().hooks[self._hook_key] = self._hook
+        self._running = True
+        self._start_time = self._step_start = time.perf_counter()
+
+    def stop(self):
+        r"""
+        Stop recording and the HTTP endpoint, the recorded samples are kept.
+        """
+        if self._sampling:
+            self._stop_sampling()
+        benchmark().hooks.pop(self._hook_key, None)
+        self._running = False
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def step(self):
+        r"""
+        Signal that the next step has started, it should be called at the end
+        of every step.
+        """
+        if not self._running:
+            return
+        now = time.perf_counter()
+        if self._sampling:
+            self._stop_sampling()
+        else:
+            with self._lock:
+                self._step_time.append(now - self._step_start)
+        self.step_num += 1
+        # do not interfere with the profiler started by user
+        if self.step_num % self.interval == 0 and not utils._is_profiler_used:
+            self._start_sampling()
+        self._step_start = time.perf_counter()
+        self._overhead += self._step_start - now
+
+    def _start_sampling(self):
+        self.profiler.prepare()
+        self.profiler.start()
+        utils._is_profiler_used = True
+        self._sampling = True
+
+    def _stop_sampling(self):
+        result = self.profiler.stop()
+        utils._is_profiler_used = False
+        self._sampling = False
+        self._collect(EventTable.from_nodetrees(result.get_data()))
+
+    def _collect(self, table):
+        events = table.events
+        durations = (events['end'] - events['start']) / 1e9
+        host = events['kind'] == EventTable.HOST
+        device = events['kind'] == EventTable.DEVICE
+        masks = {
+            'op': host & table.type_mask(TracerEventType.Operator),
+            'kernel': device & table.type_mask(TracerEventType.Kernel),
+            'layer': host & table.type_mask(TracerEventType.Forward),
+        }
+        with self._lock:
+            for category, mask in masks.items():
+                names = events['name'][mask]
+                if len(names) == 0:
+                    continue
+                order = np.argsort(names, kind='stable')
+                names = names[order]
+                values = durations[mask][order]
+                uniques, starts = np.unique(names, return_index=True)
+                buffers = self._latencies[category]
+                for name, group in zip(
+                    uniques.tolist(), np.split(values, starts[1:])
+                ):
+                    name = table.names[name]
+                    if name not in buffers:
+                        buffers[name] = _RingBuffer(self.capacity)
+                    buffers[name].extend(group)
+            self.sampled_steps += 1
+
+    def _record_reader(self, cost):
+        with self._lock:
+            self._reader_cost.append(cost)
+
+    def summary(self):
+        r"""
+        Get the statistics of the recorded samples.
+
+        Returns:
+            dict: with keys
+
+            - steps/sampled_steps: number of the steps and the sampled steps.
+            - overhead: ratio of the time spent by the sampler in
+              :code:`step` to the total time since :code:`start`.
+            - step_time/reader_cost: statistics of the step time and the
+              reader cost, a dict of `count`, `mean`, `max` and the
+              percentiles like `p50`, `p99`.
+            - op/kernel/layer: dict of the name to the statistics of its
+              latency.
+        """
+        with self._lock:
+            elapsed = (
+                time.perf_counter() - self._start_time
+                if self._start_time is not None
+                else 0.0
+            )
+            result = {
+                'steps': self.step_num,
+                'sampled_steps': self.sampled_steps,
+                'overhead': self._overhead / elapsed if elapsed > 0 else 0.0,
+                'step_time': self._step_time.summary(self.quantiles),
+                'reader_cost': self._reader_cost.summary(self.quantiles),
+            }
+            for category, buffers in self._latencies.items():
+                result[category] = {
+                    name: buffer.summary(self.quantiles)
+                    for name, buffer in buffers.items()
+                }
+        return result
+
+    def export_prometheus(self):
+        r"""
+        Get the summary in the Prometheus text format.
+
+        Returns:
+            str: the metrics text.
+        """
+        summary = self.summary()
+        lines = []
+
+        def add_summary(metric, stats, labels=''):
+            for key, value in stats.items():
+                if key.startswith('p'):
+                    quantile = float(key[1:]) / 100
+                    lines.append(
+                        f'{metric}{{{labels}quantile="{quantile:g}"}} {value!r}'
+                    )
+            suffix = f'{{{labels.rstrip(",")}}}' if labels else ''
+            lines.append(f'{metric}_count{suffix} {stats["count"]}')
+
+        for name in ['steps', 'sampled_steps']:
+            lines.append(f'# TYPE paddle_profiler_{name} counter')
+            lines.append(f'paddle_profiler_{name} {summary[name]}')
+        lines.append('# TYPE paddle_profiler_overhead gauge')
+        lines.append(f'paddle_profiler_overhead {summary["overhead"]!r}')
+        for name in ['step_time', 'reader_cost']:
+            metric = f'paddle_profiler_{name}_seconds'
+            lines.append(f'# TYPE {metric} summary')
+            add_summary(metric, summary[name])
+        for category in ['op', 'kernel', 'layer']:
+            metric = f'paddle_profiler_{category}_latency_seconds'
+            lines.append(f'# TYPE {metric} summary')
+            for name, stats in sorted(summary[category].items()):
+                add_summary(metric, stats, f'name="{_escape_label(name)}",')
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int = 0, host: str = '127.0.0.1'):
+        r"""
+        Serve the summary by HTTP in a daemon thread, `/metrics` returns it
+        in the Prometheus text format, and `/json` returns it as json. The
+        server is shut down by :code:`stop`.
+
+        Args:
+            port (int, optional): The port to listen on, 0 to pick a free
+                one. Default: 0.
+            host (str, optional): The address to listen on. Default:
+                '127.0.0.1'.
+
+        Returns:
+            tuple: (host, port) the server listens on.
+        """
+        if self._server is not None:
+            return self._server.server_address[:2]
+        sampler = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                if path == '/metrics':
+                    body = sampler.export_prometheus()
+                    content_type = 'text/plain; version=0.0.4'
+                elif path in ['/', '/json']:
+                    body = json.dumps(sampler.summary())
+                    content_type = 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                body = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        thread = threading.Thread(
+            target=self._server.serve_forever,
+            name='paddle_sampling_profiler',
+            daemon=True,
+        )
+        thread.start()
+        return self._server.server_address[:2]
@@ -13,216 +13,124 @@
 # limitations under the License.
 
 
+# Time ranges are (start_ns, end_ns) pairs. The kernels below work on int64
+# arrays in the shape of [N, 2], the public functions accept lists of tuples
+# or such arrays, and return lists of tuples for compatibility.
+
+import numpy as np
+
+_MIN_NS = np.iinfo(np.int64).min
+_MAX_NS = np.iinfo(np.int64).max
+
+
+def _as_ranges(ranges):
+    if (
+        isinstance(ranges, np.ndarray)
+        and ranges.dtype == np.int64
+        and ranges.ndim == 2
+    ):
+        return ranges
+    return np.asarray(ranges, dtype=np.int64).reshape([-1, 2])
+
+
+def _to_list(ranges):
+    return [tuple(r) for r in ranges.tolist()]
+
+
+def _union_ranges(ranges, is_sorted=False):
+    """
+    Union of ranges, the result is sorted and disjoint.
+    """
+    ranges = _as_ranges(ranges)
+    if len(ranges) == 0:
+        return ranges
+    if not is_sorted:
+        ranges = ranges[np.argsort(ranges[:, 0], kind='stable')]
+    starts = ranges[:, 0]
+    max_ends = np.maximum.accumulate(ranges[:, 1])
+    # a range begins a new merged range if it starts after all the ranges
+    # before it end
+    first = np.empty([len(ranges)], dtype=bool)
+    first[0] = True
+    np.greater(starts[1:], max_ends[:-1], out=first[1:])
+    last = np.empty([len(ranges)], dtype=bool)
+    last[:-1] = first[1:]
+    last[-1] = True
+    return np.stack([starts[first], max_ends[last]], axis=1)
+
+
+def _merge_ranges(range_list1, range_list2):
+    return _union_ranges(
+        np.concatenate([_as_ranges(range_list1), _as_ranges(range_list2)])
+    )
+
+
+def _intersect_ranges(range_list1, range_list2):
+    """
+    Intersection of two lists of sorted and disjoint ranges.
+    """
+    range_list1 = _as_ranges(range_list1)
+    range_list2 = _as_ranges(range_list2)
+    if len(range_list1) == 0 or len(range_list2) == 0:
+        return np.empty([0, 2], dtype=np.int64)
+    # ranges of list2 overlapped with range i of list1 are [lo[i], hi[i]),
+    # ends are sorted as ranges are disjoint
+    lo = np.searchsorted(range_list2[:, 1], range_list1[:, 0], side='right')
+    hi = np.searchsorted(range_list2[:, 0], range_list1[:, 1], side='left')
+    counts = np.maximum(hi - lo, 0)
+    index1 = np.repeat(np.arange(len(range_list1)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    index2 = np.repeat(lo, counts) + offsets
+    return np.stack(
+        [
+            np.maximum(range_list1[index1, 0], range_list2[index2, 0]),
+            np.minimum(range_list1[index1, 1], range_list2[index2, 1]),
+        ],
+        axis=1,
+    )
+
+
+def _subtract_ranges(range_list1, range_list2):
+    """
+    Subtract list2 from list1, both are sorted and disjoint.
+    """
+    range_list1 = _as_ranges(range_list1)
+    range_list2 = _as_ranges(range_list2)
+    if len(range_list1) == 0 or len(range_list2) == 0:
+        return range_list1
+    # intersect with the gaps of list2
+    gaps = np.empty([len(range_list2) + 1, 2], dtype=np.int64)
+    gaps[0, 0] = _MIN_NS
+    gaps[1:, 0] = range_list2[:, 1]
+    gaps[:-1, 1] = range_list2[:, 0]
+    gaps[-1, 1] = _MAX_NS
+    return _intersect_ranges(range_list1, gaps[gaps[:, 1] > gaps[:, 0]])
+
+
 def sum_ranges(ranges):
-    result = 0
-    for time_range in ranges:
-        result += time_range[1] - time_range[0]
-    return result
+    ranges = _as_ranges(ranges)
+    return int(np.sum(ranges[:, 1] - ranges[:, 0]))
 
 
 def merge_self_ranges(src_ranges, is_sorted=False):
-    merged_ranges = []
-    if len(src_ranges) > 0:
-        if not is_sorted:
-            src_ranges.sort(key=lambda x: x[0])
-        cur_indx = 0
-        merged_ranges.append((src_ranges[cur_indx][0], src_ranges[cur_indx][1]))
-        for cur_indx in range(1, len(src_ranges)):
-            if src_ranges[cur_indx][1] > merged_ranges[-1][1]:
-                if src_ranges[cur_indx][0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (
-                        merged_ranges[-1][0],
-                        src_ranges[cur_indx][1],
-                    )
-                else:
-                    merged_ranges.append(
-                        (src_ranges[cur_indx][0], src_ranges[cur_indx][1])
-                    )
-    return merged_ranges
+    return _to_list(_union_ranges(src_ranges, is_sorted))
 
 
 def merge_ranges(range_list1, range_list2, is_sorted=False):
-    merged_ranges = []
-    if not is_sorted:
-        range_list1 = merge_self_ranges(range_list1)
-        range_list2 = merge_self_ranges(range_list2)
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    if len1 == 0 and len2 == 0:
-        return merged_ranges
-    elif len1 == 0:
-        return range_list2
-    elif len2 == 0:
-        return range_list1
-    else:
-        indx1 = 0
-        indx2 = 0
-        range1 = range_list1[indx1]
-        range2 = range_list2[indx2]
-        if range1[0] < range2[0]:
-            merged_ranges.append(range1)
-            indx1 += 1
-        else:
-            merged_ranges.append(range2)
-            indx2 += 1
-        while indx1 < len1 and indx2 < len2:
-            range1 = range_list1[indx1]
-            range2 = range_list2[indx2]
-            if range1[0] < range2[0]:
-                if range1[1] > merged_ranges[-1][1]:
-                    if range1[0] <= merged_ranges[-1][1]:
-                        merged_ranges[-1] = (merged_ranges[-1][0], range1[1])
-                    else:
-                        merged_ranges.append((range1[0], range1[1]))
-                    indx1 += 1
-                else:
-                    indx1 += 1
-            else:
-                if range2[1] > merged_ranges[-1][1]:
-                    if range2[0] <= merged_ranges[-1][1]:
-                        merged_ranges[-1] = (merged_ranges[-1][0], range2[1])
-                    else:
-                        merged_ranges.append((range2[0], range2[1]))
-                    indx2 += 1
-                else:
-                    indx2 += 1
-
-        while indx1 < len1:
-            range1 = range_list1[indx1]
-            if range1[1] > merged_ranges[-1][1]:
-                if range1[0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (merged_ranges[-1][0], range1[1])
-                else:
-                    merged_ranges.append((range1[0], range1[1]))
-                indx1 += 1
-            else:
-                indx1 += 1
-        while indx2 < len2:
-            range2 = range_list2[indx2]
-            if range2[1] > merged_ranges[-1][1]:
-                if range2[0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (merged_ranges[-1][0], range2[1])
-                else:
-                    merged_ranges.append((range2[0], range2[1]))
-                indx2 += 1
-            else:
-                indx2 += 1
-    return merged_ranges
+    return _to_list(_merge_ranges(range_list1, range_list2))
 
 
 def intersection_ranges(range_list1, range_list2, is_sorted=False):
-    result_range = []
-    if len(range_list1) == 0 or len(range_list2) == 0:
-        return result_range
     if not is_sorted:
-        range_list1 = merge_self_ranges(range_list1)
-        range_list2 = merge_self_ranges(range_list2)
-
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    indx1 = 0
-    indx2 = 0
-    range1 = range_list1[indx1]
-    range2 = range_list2[indx2]
-    while indx1 < len1 and indx2 < len2:
-        if range2[1] <= range1[0]:
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] <= range1[0] and range2[1] < range1[1]:
-            assert range2[1] > range1[0]
-            result_range.append((range1[0], range2[1]))
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] <= range1[0]:
-            assert range2[1] >= range1[1]
-            result_range.append(range1)
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-
-        elif range2[1] < range1[1]:
-            assert range2[0] > range1[0]
-            result_range.append(range2)
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] < range1[1]:
-            assert range2[1] >= range1[1]
-            result_range.append((range2[0], range1[1]))
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-
-        else:
-            assert range2[0] >= range1[1]
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-    return result_range
+        range_list1 = _union_ranges(range_list1)
+        range_list2 = _union_ranges(range_list2)
+    return _to_list(_intersect_ranges(range_list1, range_list2))
 
 
 def subtract_ranges(range_list1, range_list2, is_sorted=False):
-    result_range = []
     if not is_sorted:
-        range_list1 = merge_self_ranges(range_list1)
-        range_list2 = merge_self_ranges(range_list2)
-    if len(range_list1) == 0:
-        return result_range
-    if len(range_list2) == 0:
-        return range_list1
-
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    indx1 = 0
-    indx2 = 0
-    range1 = range_list1[indx1]
-    range2 = range_list2[indx2]
-
-    while indx1 < len(range_list1):
-        if indx2 == len(range_list2):
-            result_range.append(range1)
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-        elif range2[1] <= range1[0]:
-            indx2 += 1
-            if indx2 != len2:
-                range2 = range_list2[indx2]
-        elif range2[0] <= range1[0] and range2[1] < range1[1]:
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 != len2:
-                range2 = range_list2[indx2]
-        elif range2[0] <= range1[0]:
-            assert range2[1] >= range1[1]
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 != len1:
-                range1 = range_list1[indx1]
-        elif range2[0] < range1[1]:
-            assert range2[0] > range1[0]
-            result_range.append((range1[0], range2[0]))
-            range1 = (range2[0], range1[1])
-        else:
-            assert range2[0] >= range1[1]
-            result_range.append(range1)
-            indx1 += 1
-            if indx1 != len1:
-                range1 = range_list1[indx1]
-    return result_range
+        range_list1 = _union_ranges(range_list1)
+        range_list2 = _union_ranges(range_list2)
+    return _to_list(_subtract_ranges(range_list1, range_list2))
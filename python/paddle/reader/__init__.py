@@ -65,6 +65,7 @@ An example implementation for multiple item data reader creator:
 
 from paddle.reader.decorator import map_readers  # noqa: F401
 from paddle.reader.decorator import shuffle  # noqa: F401
+from paddle.reader.decorator import stream_shuffle  # noqa: F401
 from paddle.reader.decorator import xmap_readers  # noqa: F401
 from paddle.reader.decorator import firstn  # noqa: F401
 from paddle.reader.decorator import buffered  # noqa: F401
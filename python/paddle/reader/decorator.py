@@ -15,12 +15,16 @@
 import itertools
 import logging
 import multiprocessing
+import pickle
 import random
 import sys
+import traceback
 import warnings
 from itertools import zip_longest
 from queue import Queue
-from threading import Thread
+from threading import Semaphore, Thread
+
+import numpy as np
 
 from paddle.base.reader import QUEUE_GET_TIMEOUT
 
@@ -172,6 +176,214 @@ def shuffle(reader, buf_size):
     return data_reader
 
 
+class _SampleArena:
+    """
+    Stores the samples of a shuffle window in preallocated numpy arrays, one
+    array of shape [num_slots, *field_shape] for each field of the samples.
+    All the samples should have the same structure, shapes and dtypes as the
+    first one.
+    """
+
+    def __init__(self, num_slots, sample, use_shared_memory=False):
+        self._is_tuple = isinstance(sample, (tuple, list))
+        fields = sample if self._is_tuple else (sample,)
+        self._sample_type = type(sample)
+        self._scalar_types = []
+        arrays = []
+        for field in fields:
+            self._scalar_types.append(
+                type(field) if isinstance(field, (bool, int, float)) else None
+            )
+            arrays.append(np.asarray(field))
+        self._shm = None
+        nbytes = [num_slots * a.nbytes for a in arrays]
+        if use_shared_memory:
+            from multiprocessing import shared_memory
+
+            from paddle.io.multiprocess_utils import shared_memory_set
+
+            self._shm = shared_memory.SharedMemory(
+                create=True, size=max(sum(nbytes), 1)
+            )
+            shared_memory_set.add(self._shm)
+        self._fields = []
+        offset = 0
+        for a, size in zip(arrays, nbytes):
+            shape = (num_slots,) + a.shape
+            if self._shm is None:
+                self._fields.append(np.empty(shape, dtype=a.dtype))
+            else:
+                self._fields.append(
+                    np.ndarray(
+                        shape,
+                        dtype=a.dtype,
+                        buffer=self._shm.buf,
+                        offset=offset,
+                    )
+                )
+            offset += size
+
+    def put(self, slot, sample):
+        fields = sample if self._is_tuple else (sample,)
+        if len(fields) != len(self._fields):
+            raise ValueError(
+                f"The samples stored in the arena of stream_shuffle should have {len(self._fields)} fields, but received {len(fields)}."
+            )
+        for i, field in enumerate(fields):
+            array = self._fields[i]
+            field = np.asarray(field)
+            if field.shape != array.shape[1:] or field.dtype != array.dtype:
+                raise ValueError(
+                    f"The samples stored in the arena of stream_shuffle should have the same shapes and dtypes, but field {i} has shape {list(field.shape)} and dtype {field.dtype}, expected shape {list(array.shape[1:])} and dtype {array.dtype}."
+                )
+            array[slot] = field
+
+    def get(self, slot):
+        fields = []
+        for array, scalar_type in zip(self._fields, self._scalar_types):
+            if scalar_type is not None:
+                fields.append(scalar_type(array[slot]))
+            else:
+                fields.append(array[slot].copy())
+        if not self._is_tuple:
+            return fields[0]
+        if hasattr(self._sample_type, '_fields'):
+            # namedtuple takes the fields as positional arguments
+            return self._sample_type(*fields)
+        return self._sample_type(fields)
+
+    def release(self):
+        if self._shm is not None:
+            from paddle.io.multiprocess_utils import shared_memory_set
+
+            self._fields = []
+            self._shm.close()
+            if self._shm in shared_memory_set:
+                self._shm.unlink()
+                shared_memory_set.discard(self._shm)
+            self._shm = None
+
+
+def stream_shuffle(reader, buf_size, cycle_length=None, arena=None, seed=None):
+    """
+    This API creates a decorated reader that outputs the shuffled data by a
+    sliding window.
+
+    Unlike ``paddle.reader.shuffle``, which shuffles and flushes the whole
+    buffer every ``buf_size`` samples, the window is refilled continuously:
+    once it holds ``buf_size`` samples, every new sample replaces a randomly
+    chosen one in the window, which is yielded. So the output is not
+    correlated by blocks, and a sample may move far from its original
+    position.
+
+    If ``reader`` is a list of readers, such as the readers of the shards of
+    a dataset, the readers are opened in a random order, and ``cycle_length``
+    of them are read at the same time, each sample is read from one of the
+    opened readers chosen randomly.
+
+    Args:
+        reader(callable|list(callable)): the original reader or the list of
+            readers whose data will be shuffled.
+        buf_size(int): the size of the shuffle window.
+        cycle_length(int|None, optional): only useful when ``reader`` is a
+            list, the number of readers read at the same time. None means
+            reading all of them. Default None.
+        arena(str|None, optional): None means storing the samples of the
+            window in a list. ``'numpy'`` means storing them in preallocated
+            numpy arrays, and ``'shared_memory'`` means storing them in a
+            shared memory segment, which take much less memory than the python
+            objects of the samples, but all samples should have the same
+            structure, shapes and dtypes. The samples are yielded as copies,
+            with python scalars converted back. ``'shared_memory'`` requires
+            Python 3.8 or later. Default None.
+        seed(int|None, optional): the seed of the random order, None means
+            using the global random generator of python. Default None.
+
+    Returns:
+        callable: a decorated reader.
+
+    Examples:
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('outputs are 0~9 unordered arrangement')
+            >>> import paddle
+            >>> def shard(start):
+            ...     def reader():
+            ...         for i in range(start, start + 5):
+            ...             yield i
+            ...     return reader
+            >>> shuffled_reader = paddle.reader.stream_shuffle(
+            ...     [shard(0), shard(5)], buf_size=4, arena='numpy'
+            ... )
+            >>> for e in shuffled_reader():
+            ...     print(e)
+            >>> # outputs are 0~9 unordered arrangement
+    """
+    assert buf_size > 0, "buf_size of stream_shuffle should be positive."
+    assert arena in (
+        None,
+        'numpy',
+        'shared_memory',
+    ), f"arena of stream_shuffle should be None, 'numpy' or 'shared_memory', but received {arena}."
+    if arena == 'shared_memory' and sys.version_info < (3, 8):
+        raise NotImplementedError(
+            "The shared_memory arena of stream_shuffle requires Python 3.8 or later."
+        )
+    readers = list(reader) if isinstance(reader, (list, tuple)) else None
+
+    def interleave(rng):
+        order = list(readers)
+        rng.shuffle(order)
+        num_opened = len(order) if cycle_length is None else cycle_length
+        opened = [r() for r in order[:num_opened]]
+        pending = order[num_opened:]
+        while opened:
+            i = rng.randrange(len(opened))
+            try:
+                yield next(opened[i])
+            except StopIteration:
+                if pending:
+                    opened[i] = pending.pop(0)()
+                else:
+                    opened[i] = opened[-1]
+                    opened.pop()
+
+    def data_reader():
+        rng = random if seed is None else random.Random(seed)
+        samples = interleave(rng) if readers is not None else reader()
+        store = None
+        window = []
+        size = 0
+        try:
+            for e in samples:
+                if arena is not None and store is None:
+                    store = _SampleArena(buf_size, e, arena == 'shared_memory')
+                if size < buf_size:
+                    if store is None:
+                        window.append(e)
+                    else:
+                        store.put(size, e)
+                    size += 1
+                    continue
+                slot = rng.randrange(buf_size)
+                if store is None:
+                    yield window[slot]
+                    window[slot] = e
+                else:
+                    yield store.get(slot)
+                    store.put(slot, e)
+
+            slots = list(range(size))
+            rng.shuffle(slots)
+            for slot in slots:
+                yield window[slot] if store is None else store.get(slot)
+        finally:
+            if store is not None:
+                store.release()
+
+    return data_reader
+
+
 def chain(*readers):
     """
     Use the input data readers to create a chained data reader. The new created reader
@@ -404,103 +616,174 @@ class XmapEndSignal:
     pass
 
 
-def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
+def xmap_readers(
+    mapper,
+    reader,
+    process_num,
+    buffer_size,
+    order=False,
+    use_process=False,
+    chunk_size=1,
+):
     """
-    Use multi-threads to map samples from reader by a mapper defined by user.
+    Use multi-threads or multi-processes to map samples from reader by a
+    mapper defined by user.
+
+    With ``order`` True, the mapped samples are put into a reorder buffer
+    and yielded by their order in the reader, the workers keep mapping the
+    following samples meanwhile, as long as the buffer is not full.
 
     Args:
         mapper (callable): a function to map the data from reader.
         reader (callable): a data reader which yields the data.
-        process_num (int): thread number to handle original sample.
-        buffer_size (int): size of the queue to read data in.
+        process_num (int): thread or process number to handle original sample.
+        buffer_size (int): max number of samples waiting to be mapped or
+            yielded, besides the ones being mapped.
         order (bool): whether to keep the data order from original reader.
             Default False.
+        use_process (bool, optional): whether to map samples in processes
+            instead of threads, which makes CPU bound mappers run in parallel.
+            The samples and the mapped ones are sent between processes by
+            pickle. Default False.
+        chunk_size (int, optional): number of samples sent to a worker as one
+            task, larger chunks reduce the overhead of communication for cheap
+            mappers. Default 1.
 
     Returns:
         callable: a decorated reader with data mapping.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+
+            >>> def reader():
+            ...     for i in range(5):
+            ...         yield i
+            ...
+            >>> def mapper(x):
+            ...     return x * 2
+            ...
+            >>> xreader = paddle.reader.xmap_readers(
+            ...     mapper, reader, 2, 4, order=True, chunk_size=2
+            ... )
+            >>> print(list(xreader()))
+            [0, 2, 4, 6, 8]
     """
+    assert process_num > 0, "process_num of xmap_readers should be positive."
+    assert chunk_size > 0, "chunk_size of xmap_readers should be positive."
     end = XmapEndSignal()
-
-    # define a worker to read samples from reader to in_queue
-    def read_worker(reader, in_queue):
-        for i in reader():
-            in_queue.put(i)
-        in_queue.put(end)
-
-    # define a worker to read samples from reader to in_queue with order flag
-    def order_read_worker(reader, in_queue):
-        in_order = 0
-        for i in reader():
-            in_queue.put((in_order, i))
-            in_order += 1
-        in_queue.put(end)
-
-    # define a worker to handle samples from in_queue by mapper
-    # and put mapped samples into out_queue
+    # tasks being mapped, waiting to be mapped or waiting to be yielded
+    max_tasks = process_num + max(1, -(-buffer_size // chunk_size))
+
+    # define a worker to read samples from reader, and to put the chunks of
+    # samples with their order into in_queue
+    def read_worker(reader, in_queue, task_slots, num_workers):
+        chunk = []
+        index = 0
+        for sample in reader():
+            chunk.append(sample)
+            if len(chunk) == chunk_size:
+                task_slots.acquire()
+                in_queue.put((index, chunk))
+                index += 1
+                chunk = []
+        if chunk:
+            task_slots.acquire()
+            in_queue.put((index, chunk))
+        for _ in range(num_workers):
+            in_queue.put(end)
+
+    # define a worker to handle the chunks from in_queue by mapper, and to put
+    # the mapped chunks into out_queue
     def handle_worker(in_queue, out_queue, mapper):
-        sample = in_queue.get()
-        while not isinstance(sample, XmapEndSignal):
-            r = mapper(sample)
-            out_queue.put(r)
-            sample = in_queue.get()
-        in_queue.put(end)
-        out_queue.put(end)
-
-    # define a worker to handle samples from in_queue by mapper
-    # and put mapped samples into out_queue by order
-    def order_handle_worker(in_queue, out_queue, mapper, out_order):
-        ins = in_queue.get()
-        while not isinstance(ins, XmapEndSignal):
-            order, sample = ins
-            r = mapper(sample)
-            while order != out_order[0]:
-                pass
-            out_queue.put(r)
-            out_order[0] += 1
-            ins = in_queue.get()
-        in_queue.put(end)
+        task = in_queue.get()
+        while not isinstance(task, XmapEndSignal):
+            index, chunk = task
+            try:
+                out_queue.put((index, [mapper(sample) for sample in chunk]))
+            except Exception as e:
+                if use_process:
+                    # the exception may not be pickled to the main process
+                    e = RuntimeError(
+                        f"mapper of xmap_readers failed in process:\n{traceback.format_exc()}"
+                    )
+                out_queue.put((index, e))
+            task = in_queue.get()
         out_queue.put(end)
 
     def xreader():
-        in_queue = Queue(buffer_size)
-        out_queue = Queue(buffer_size)
-        out_order = [0]
-        # start a read worker in a thread
-        target = order_read_worker if order else read_worker
-        t = Thread(target=target, args=(reader, in_queue))
+        if use_process:
+            in_queue = fork_context.Queue()
+            out_queue = fork_context.Queue()
+        else:
+            in_queue = Queue()
+            out_queue = Queue()
+        # the reader blocks when max_tasks tasks are in flight, and a slot is
+        # released after the mapped chunk is yielded
+        task_slots = Semaphore(max_tasks)
+        t = Thread(
+            target=read_worker,
+            args=(reader, in_queue, task_slots, process_num),
+        )
         t.daemon = True
         t.start()
-        # start several handle_workers
-        target = order_handle_worker if order else handle_worker
-        args = (
-            (in_queue, out_queue, mapper, out_order)
-            if order
-            else (in_queue, out_queue, mapper)
-        )
+
         workers = []
         for i in range(process_num):
-            worker = Thread(target=target, args=args)
+            if use_process:
+                worker = fork_context.Process(
+                    target=handle_worker, args=(in_queue, out_queue, mapper)
+                )
+            else:
+                worker = Thread(
+                    target=handle_worker, args=(in_queue, out_queue, mapper)
+                )
             worker.daemon = True
             workers.append(worker)
         for w in workers:
             w.start()
 
-        sample = out_queue.get()
-        while not isinstance(sample, XmapEndSignal):
-            yield sample
-            sample = out_queue.get()
-        finish = 1
-        while finish < process_num:
-            sample = out_queue.get()
-            if isinstance(sample, XmapEndSignal):
-                finish += 1
-            else:
-                yield sample
+        # the reorder buffer of the mapped chunks by their order
+        pending = {}
+        next_index = 0
+        finish = 0
+        try:
+            while finish < process_num:
+                task = out_queue.get()
+                if isinstance(task, XmapEndSignal):
+                    finish += 1
+                    continue
+                index, result = task
+                if isinstance(result, Exception):
+                    raise result
+                if not order:
+                    task_slots.release()
+                    yield from result
+                    continue
+                pending[index] = result
+                while next_index in pending:
+                    result = pending.pop(next_index)
+                    next_index += 1
+                    task_slots.release()
+                    yield from result
+        finally:
+            if use_process:
+                for w in workers:
+                    if w.is_alive():
+                        w.terminate()
+                    w.join()
 
     return xreader
 
 
-def multiprocess_reader(readers, use_pipe=True, queue_size=1000):
+def multiprocess_reader(
+    readers,
+    use_pipe=True,
+    queue_size=1000,
+    use_shared_memory=False,
+    shared_memory_size=16 * 1024 * 1024,
+):
     """
     This API use python ``multiprocessing`` to read data from ``readers`` parallelly,
     and then ``multiprocess.Queue`` or ``multiprocess.Pipe`` is used to merge
@@ -520,6 +803,14 @@ def multiprocess_reader(readers, use_pipe=True, queue_size=1000):
        queue_size (int, optional): only useful when ``use_pipe`` is False - ``multiprocess.Queue``
            is used, default 1000. Increase this value can speed up the data reading, and more memory
            will be consumed.
+       use_shared_memory (bool, optional): whether to send the samples through a ring of shared
+           memory segments of each reader, and only the descriptors of them through ``multiprocess.Pipe``.
+           The numpy arrays in samples are copied into the segments without pickling, which is much
+           faster than ``use_pipe`` for large samples such as images, and the samples keep their types
+           instead of being converted by json. ``use_pipe`` is ignored if it is True, default False.
+       shared_memory_size (int, optional): only useful when ``use_shared_memory`` is True - the total
+           size in bytes of the shared memory segments of each reader, default 16MB. The samples larger
+           than a segment are sent by ``multiprocess.Pipe``. Shared memory requires Python 3.8 or later.
 
     Returns:
         ``generator``: a new reader which can be run parallelly
@@ -584,6 +875,11 @@ def multiprocess_reader(readers, use_pipe=True, queue_size=1000):
             "The multiprocess_reader method is not supported on windows."
         )
 
+    if use_shared_memory and sys.version_info < (3, 8):
+        raise NotImplementedError(
+            "The use_shared_memory of multiprocess_reader requires Python 3.8 or later."
+        )
+
     # ujson is ultra fast json encoder and decoder written in pure C with bindings for Python 3.6+.
     try:
         import ujson as json
@@ -682,7 +978,144 @@ def multiprocess_reader(readers, use_pipe=True, queue_size=1000):
                 else:
                     yield sample
 
-    if use_pipe:
+    # the number of shared memory segments of each reader, the child process
+    # fills a segment while the main process copies samples out of another
+    num_segments = 4
+    segment_size = max(shared_memory_size // num_segments, 1)
+    # the max number of samples in a segment, so small samples are not delayed
+    # too long by batching
+    max_segment_samples = 256
+
+    def _align(offset):
+        return (offset + 63) // 64 * 64
+
+    def _read_into_shared_memory(reader, conn, segments):
+        free_segments = list(range(len(segments)))
+        segment, offset, records = None, 0, []
+
+        def _flush():
+            nonlocal segment, offset, records
+            if records:
+                conn.send(('shm', segment, records))
+                segment, offset, records = None, 0, []
+
+        try:
+            for sample in reader():
+                if sample is None:
+                    raise ValueError("sample has None!")
+                buffers = []
+                payload = pickle.dumps(
+                    sample, protocol=5, buffer_callback=buffers.append
+                )
+                views = [buffer.raw() for buffer in buffers]
+                nbytes = sum(_align(view.nbytes) for view in views)
+                if nbytes > segment_size:
+                    _flush()
+                    conn.send(('sample', sample))
+                    continue
+                if segment is not None and (
+                    _align(offset) + nbytes > segment_size
+                    or len(records) >= max_segment_samples
+                ):
+                    _flush()
+                if segment is None:
+                    if not free_segments:
+                        # wait for the main process to release a segment
+                        free_segments.append(conn.recv())
+                    segment = free_segments.pop()
+                locations = []
+                for view in views:
+                    offset = _align(offset)
+                    segments[segment].buf[offset : offset + view.nbytes] = view
+                    locations.append((offset, view.nbytes))
+                    offset += view.nbytes
+                records.append((payload, locations))
+            _flush()
+            # the segments are unlinked by the main process after all of them
+            # are released
+            while len(free_segments) < len(segments):
+                free_segments.append(conn.recv())
+            conn.send(('end',))
+            conn.close()
+        except Exception as e:
+            conn.send(('error', traceback.format_exc()))
+            conn.close()
+            raise e
+
+    def shared_memory_reader():
+        from multiprocessing import connection, shared_memory
+
+        from paddle.io.multiprocess_utils import shared_memory_set
+
+        conn_segments = {}
+        processes = []
+        try:
+            for reader in readers:
+                segments = []
+                for _ in range(num_segments):
+                    shm = shared_memory.SharedMemory(
+                        create=True, size=segment_size
+                    )
+                    shared_memory_set.add(shm)
+                    segments.append(shm)
+                parent_conn, child_conn = fork_context.Pipe()
+                conn_segments[parent_conn] = segments
+                p = fork_context.Process(
+                    target=_read_into_shared_memory,
+                    args=(reader, child_conn, segments),
+                )
+                p.daemon = True
+                p.start()
+                processes.append(p)
+                child_conn.close()
+
+            conns = list(conn_segments)
+            while conns:
+                for conn in connection.wait(conns):
+                    message = conn.recv()
+                    if message[0] == 'shm':
+                        _, segment, records = message
+                        buf = conn_segments[conn][segment].buf
+                        samples = [
+                            pickle.loads(
+                                payload,
+                                buffers=[
+                                    bytearray(buf[offset : offset + nbytes])
+                                    for offset, nbytes in locations
+                                ],
+                            )
+                            for payload, locations in records
+                        ]
+                        del buf
+                        conn.send(segment)
+                        yield from samples
+                    elif message[0] == 'sample':
+                        yield message[1]
+                    elif message[0] == 'end':
+                        conn.close()
+                        conns.remove(conn)
+                    else:
+                        raise ValueError(
+                            f"multiprocess_reader failed to read data into the shared memory:\n{message[1]}"
+                        )
+            for p in processes:
+                p.join()
+        finally:
+            # the reader may be stopped before the child processes finish
+            for p in processes:
+                if p.is_alive():
+                    p.terminate()
+            for conn, segments in conn_segments.items():
+                conn.close()
+                for shm in segments:
+                    shm.close()
+                    if shm in shared_memory_set:
+                        shm.unlink()
+                        shared_memory_set.discard(shm)
+
+    if use_shared_memory:
+        return shared_memory_reader
+    elif use_pipe:
         return pipe_reader
     else:
         return queue_reader
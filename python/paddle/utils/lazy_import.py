@@ -14,6 +14,7 @@
 """Lazy imports for heavy dependencies."""
 
 import importlib
+import sys
 
 __all__ = []
 
@@ -39,3 +40,50 @@ def try_import(module_name, err_msg=None):
                 "manually installed (usually with `pip install {}`). "
             ).format(module_name, install_name)
         raise ImportError(err_msg)
+
+
+def lazy_attributes(package_name, submodules=(), attributes=None):
+    """
+    Creates the module level ``__getattr__`` and ``__dir__`` of a package,
+    which import the submodules and the attributes of submodules on first
+    access instead of importing them with the package.
+
+    Args:
+        package_name(str): The name of the package, usually ``__name__``.
+        submodules(list[str]): The names of submodules relative to the
+            package. A dotted name is imported together with its top level
+            submodule, e.g. ``distributed.fleet`` with ``distributed``.
+        attributes(dict, optional): The names of attributes to the names of
+            the submodules which define them. Default: None.
+
+    Returns:
+        tuple: ``(__getattr__, __dir__)`` to be assigned in the package.
+    """
+    attributes = dict(attributes or {})
+    top_level = {}
+    for submodule in submodules:
+        top_level.setdefault(submodule.split('.')[0], []).append(submodule)
+
+    def __getattr__(name):
+        if name in top_level:
+            for submodule in top_level[name]:
+                importlib.import_module(f'{package_name}.{submodule}')
+            # importing a submodule sets it as an attribute of the package,
+            # so __getattr__ is not called for it again.
+            return sys.modules[f'{package_name}.{name}']
+        if name in attributes:
+            module = importlib.import_module(
+                f'{package_name}.{attributes[name]}'
+            )
+            value = getattr(module, name)
+            setattr(sys.modules[package_name], name, value)
+            return value
+        raise AttributeError(
+            f"module '{package_name}' has no attribute '{name}'"
+        )
+
+    def __dir__():
+        names = set(vars(sys.modules[package_name]))
+        return sorted(names | set(top_level) | set(attributes))
+
+    return __getattr__, __dir__
@@ -19,7 +19,10 @@ import numpy as np
 from PIL import Image
 
 import paddle
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import (
+    _check_exists_and_download,
+    _load_cached_arrays,
+)
 from paddle.io import Dataset
 
 __all__ = []
@@ -53,6 +56,10 @@ class Cifar10(Dataset):
             PIL.Image or numpy.ndarray. Should be one of {'pil', 'cv2'}.
             If this option is not set, will get backend from :ref:`paddle.vision.get_image_backend <api_vision_image_get_image_backend>`,
             default backend is 'pil'. Default: None.
+        use_cache (bool, optional): Whether to convert the dataset into a numpy array
+            cache under ~/.cache/paddle/dataset/cifar/cache once, and read samples
+            from memory mapped cache files, which starts instantly after the first
+            run and shares memory among DataLoader worker processes. Default: False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of Cifar10 dataset.
@@ -110,6 +117,7 @@ class Cifar10(Dataset):
         transform=None,
         download=True,
         backend=None,
+        use_cache=False,
     ):
         assert mode.lower() in [
             'train',
@@ -140,8 +148,8 @@ class Cifar10(Dataset):
 
         self.transform = transform
 
-        # read dataset into memory
-        self._load_data()
+        # read dataset into memory, or map cached dataset into memory
+        self._load_data(use_cache)
 
         self.dtype = paddle.get_default_dtype()
 
@@ -150,8 +158,21 @@ class Cifar10(Dataset):
         self.data_md5 = CIFAR10_MD5
         self.flag = MODE_FLAG_MAP[self.mode + '10']
 
-    def _load_data(self):
-        self.data = []
+    def _load_data(self, use_cache=False):
+        if use_cache:
+            data = _load_cached_arrays(
+                'cifar', [self.data_file], self.flag, self._read_data
+            )
+        else:
+            data = self._read_data()
+        # NOTE: images and labels are stored as contiguous arrays in shape
+        #       [N, 3072] and [N], which can be read in batch by fancy
+        #       indexing, see __getitems__
+        self.images = data['images']
+        self.labels = data['labels']
+
+    def _read_data(self):
+        images, labels = [], []
         with tarfile.open(self.data_file, mode='r') as f:
             names = (
                 each_item.name for each_item in f if self.flag in each_item.name
@@ -163,13 +184,17 @@ class Cifar10(Dataset):
                 batch = pickle.load(f.extractfile(name), encoding='bytes')
 
                 data = batch[b'data']
-                labels = batch.get(b'labels', batch.get(b'fine_labels', None))
-                assert labels is not None
-                for sample, label in zip(data, labels):
-                    self.data.append((sample, label))
+                label = batch.get(b'labels', batch.get(b'fine_labels', None))
+                assert label is not None
+                images.append(data)
+                labels.append(np.array(label, dtype='int64'))
 
-    def __getitem__(self, idx):
-        image, label = self.data[idx]
+        return {
+            'images': np.concatenate(images),
+            'labels': np.concatenate(labels),
+        }
+
+    def _process(self, image, label):
         image = np.reshape(image, [3, 32, 32])
         image = image.transpose([1, 2, 0])
 
@@ -183,8 +208,17 @@ class Cifar10(Dataset):
 
         return image.astype(self.dtype), np.array(label).astype('int64')
 
+    def __getitem__(self, idx):
+        return self._process(self.images[idx], self.labels[idx])
+
+    def __getitems__(self, indices):
+        images, labels = self.images[indices], self.labels[indices]
+        return [
+            self._process(image, label) for image, label in zip(images, labels)
+        ]
+
     def __len__(self):
-        return len(self.data)
+        return len(self.labels)
 
 
 class Cifar100(Cifar10):
@@ -202,6 +236,10 @@ class Cifar100(Cifar10):
             PIL.Image or numpy.ndarray. Should be one of {'pil', 'cv2'}.
             If this option is not set, will get backend from :ref:`paddle.vision.get_image_backend <api_vision_image_get_image_backend>`,
             default backend is 'pil'. Default: None.
+        use_cache (bool, optional): Whether to convert the dataset into a numpy array
+            cache under ~/.cache/paddle/dataset/cifar/cache once, and read samples
+            from memory mapped cache files, which starts instantly after the first
+            run and shares memory among DataLoader worker processes. Default: False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of Cifar100 dataset.
@@ -260,8 +298,11 @@ class Cifar100(Cifar10):
         transform=None,
         download=True,
         backend=None,
+        use_cache=False,
     ):
-        super().__init__(data_file, mode, transform, download, backend)
+        super().__init__(
+            data_file, mode, transform, download, backend, use_cache
+        )
 
     def _init_url_md5_flag(self):
         self.data_url = CIFAR100_URL
@@ -12,11 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import os
+import pickle
+import tempfile
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 from PIL import Image
 
 import paddle
+from paddle.dataset.common import DATA_HOME
 from paddle.io import Dataset
 from paddle.utils import try_import
 
@@ -40,26 +46,160 @@ def has_valid_extension(filename, extensions):
     return filename.lower().endswith(extensions)
 
 
-def make_dataset(dir, class_to_idx, extensions, is_valid_file=None):
-    images = []
+def _scan_dir(path):
+    fnames, subdirs = [], []
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    subdirs.append(entry.path)
+                else:
+                    fnames.append(entry.name)
+    except OSError:
+        # same as os.walk, skip directories cannot be scanned
+        mtime = None
+    return mtime, fnames, subdirs
+
+
+def _walk_dirs(tops, num_workers=None):
+    """
+    Walk directories :attr:`tops` following symlinks with a thread pool,
+    directories of each level are scanned concurrently by os.scandir.
+
+    Args:
+        tops (list[str]): top directories to walk.
+        num_workers (int, optional): thread number to scan directories,
+            None for the default of concurrent.futures.ThreadPoolExecutor.
+            Default: None.
+
+    Returns:
+        tuple: (walks, mtimes), walks is a list of (root, fnames) for each
+            top in same order as sorted(os.walk(top, followlinks=True)),
+            and mtimes is a dict of modification time of each directory.
+    """
+    walks = [[] for _ in tops]
+    mtimes = {}
+    frontier = list(enumerate(tops))
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        while len(frontier) > 0:
+            results = executor.map(_scan_dir, [path for _, path in frontier])
+            next_frontier = []
+            for (i, path), (mtime, fnames, subdirs) in zip(frontier, results):
+                if mtime is None:
+                    continue
+                mtimes[path] = mtime
+                walks[i].append((path, fnames))
+                next_frontier.extend((i, subdir) for subdir in subdirs)
+            frontier = next_frontier
+
+    for walk in walks:
+        walk.sort()
+    return walks, mtimes
+
+
+def _index_cache_file(root, key):
+    root = os.path.abspath(os.path.expanduser(root))
+    md5 = hashlib.md5(f"{root}:{key}".encode()).hexdigest()
+    return os.path.join(DATA_HOME, 'folder_index', md5 + '.pkl')
+
+
+def _load_index_cache(cache_file, num_workers=None):
+    """
+    Load samples from index cache file, return None if the cache file does
+    not exist, or any directory scanned has been modified since the cache
+    was built, note that adding or removing a file or directory changes the
+    modification time of its parent directory.
+    """
+    try:
+        with open(cache_file, 'rb') as f:
+            index = pickle.load(f)
+    except Exception:
+        return None
+
+    def modified(item):
+        path, mtime = item
+        try:
+            return os.stat(path).st_mtime_ns != mtime
+        except OSError:
+            return True
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        if any(executor.map(modified, index['mtimes'].items())):
+            return None
+    return index['samples']
+
+
+def _save_index_cache(cache_file, samples, mtimes):
+    cache_dir = os.path.dirname(cache_file)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # NOTE: write into a temporary file and rename it as the cache file,
+        #       so other processes never read an incomplete cache file
+        fd, tmp_file = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(
+                {'samples': samples, 'mtimes': mtimes},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        warnings.warn(f"Failed to save index cache {cache_file}: {e}")
+
+
+def make_dataset(
+    dir,
+    class_to_idx,
+    extensions,
+    is_valid_file=None,
+    num_workers=None,
+    use_cache=False,
+):
     dir = os.path.expanduser(dir)
 
+    # NOTE: samples filtered by a user defined is_valid_file cannot be
+    #       identified by a cache key, only cache samples filtered by
+    #       extensions
+    use_cache = use_cache and extensions is not None
+    if use_cache:
+        cache_file = _index_cache_file(
+            dir, f"DatasetFolder:{sorted(class_to_idx.items())}:{extensions}"
+        )
+        images = _load_index_cache(cache_file, num_workers)
+        if images is not None:
+            return images
+
     if extensions is not None:
 
         def is_valid_file(x):
             return has_valid_extension(x, extensions)
 
-    for target in sorted(class_to_idx.keys()):
-        d = os.path.join(dir, target)
-        if not os.path.isdir(d):
-            continue
-        for root, _, fnames in sorted(os.walk(d, followlinks=True)):
+    targets = [
+        target
+        for target in sorted(class_to_idx.keys())
+        if os.path.isdir(os.path.join(dir, target))
+    ]
+    walks, mtimes = _walk_dirs(
+        [os.path.join(dir, target) for target in targets], num_workers
+    )
+
+    images = []
+    for target, walk in zip(targets, walks):
+        for root, fnames in walk:
             for fname in sorted(fnames):
                 path = os.path.join(root, fname)
                 if is_valid_file(path):
                     item = (path, class_to_idx[target])
                     images.append(item)
 
+    if use_cache:
+        mtimes[dir] = os.stat(dir).st_mtime_ns
+        _save_index_cache(cache_file, images, mtimes)
     return images
 
 
@@ -88,6 +228,13 @@ class DatasetFolder(Dataset):
         is_valid_file (Callable, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        num_workers (int, optional): Number of threads to scan directories concurrently,
+            None for the default thread number of ``concurrent.futures.ThreadPoolExecutor``.
+            Default: None.
+        use_cache (bool, optional): Whether to cache the list of samples in an index file
+            under ~/.cache/paddle/dataset/folder_index, which is loaded instead of scanning
+            directories if none of the directories is modified since the cache was built.
+            Default: False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of DatasetFolder.
@@ -211,6 +358,8 @@ class DatasetFolder(Dataset):
         extensions=None,
         transform=None,
         is_valid_file=None,
+        num_workers=None,
+        use_cache=False,
     ):
         self.root = root
         self.transform = transform
@@ -218,7 +367,12 @@ class DatasetFolder(Dataset):
             extensions = IMG_EXTENSIONS
         classes, class_to_idx = self._find_classes(self.root)
         samples = make_dataset(
-            self.root, class_to_idx, extensions, is_valid_file
+            self.root,
+            class_to_idx,
+            extensions,
+            is_valid_file,
+            num_workers=num_workers,
+            use_cache=use_cache,
         )
         if len(samples) == 0:
             raise (
@@ -328,6 +482,13 @@ class ImageFolder(Dataset):
         is_valid_file (Callable, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        num_workers (int, optional): Number of threads to scan directories concurrently,
+            None for the default thread number of ``concurrent.futures.ThreadPoolExecutor``.
+            Default: None.
+        use_cache (bool, optional): Whether to cache the list of samples in an index file
+            under ~/.cache/paddle/dataset/folder_index, which is loaded instead of scanning
+            directories if none of the directories is modified since the cache was built.
+            Default: False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of ImageFolder.
@@ -438,24 +599,24 @@ class ImageFolder(Dataset):
         extensions=None,
         transform=None,
         is_valid_file=None,
+        num_workers=None,
+        use_cache=False,
     ):
         self.root = root
         if extensions is None:
             extensions = IMG_EXTENSIONS
 
-        samples = []
         path = os.path.expanduser(root)
+        if use_cache:
+            cache_file = _index_cache_file(path, f"ImageFolder:{extensions}")
+            samples = _load_index_cache(cache_file, num_workers)
+        else:
+            samples = None
 
-        if extensions is not None:
-
-            def is_valid_file(x):
-                return has_valid_extension(x, extensions)
-
-        for root, _, fnames in sorted(os.walk(path, followlinks=True)):
-            for fname in sorted(fnames):
-                f = os.path.join(root, fname)
-                if is_valid_file(f):
-                    samples.append(f)
+        if samples is None:
+            samples, mtimes = self._make_samples(path, extensions, num_workers)
+            if use_cache:
+                _save_index_cache(cache_file, samples, mtimes)
 
         if len(samples) == 0:
             raise (
@@ -470,6 +631,19 @@ class ImageFolder(Dataset):
         self.samples = samples
         self.transform = transform
 
+    def _make_samples(self, path, extensions, num_workers=None):
+        def is_valid_file(x):
+            return has_valid_extension(x, extensions)
+
+        (walk,), mtimes = _walk_dirs([path], num_workers)
+        samples = []
+        for root, fnames in walk:
+            for fname in sorted(fnames):
+                f = os.path.join(root, fname)
+                if is_valid_file(f):
+                    samples.append(f)
+        return samples, mtimes
+
     def __getitem__(self, index):
         """
         Args:
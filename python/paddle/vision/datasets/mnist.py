@@ -19,7 +19,10 @@ import numpy as np
 from PIL import Image
 
 import paddle
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import (
+    _check_exists_and_download,
+    _load_cached_arrays,
+)
 from paddle.io import Dataset
 
 __all__ = []
@@ -42,6 +45,10 @@ class MNIST(Dataset):
             PIL.Image or numpy.ndarray. Should be one of {'pil', 'cv2'}.
             If this option is not set, will get backend from :ref:`paddle.vision.get_image_backend <api_vision_image_get_image_backend>`,
             default backend is 'pil'. Default: None.
+        use_cache (bool, optional): Whether to convert the dataset into a numpy array
+            cache under ~/.cache/paddle/dataset/mnist/cache once, and read samples
+            from memory mapped cache files, which starts instantly after the first
+            run and shares memory among DataLoader worker processes. Default: False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of MNIST dataset.
@@ -109,6 +116,7 @@ class MNIST(Dataset):
         transform=None,
         download=True,
         backend=None,
+        use_cache=False,
     ):
         assert mode.lower() in [
             'train',
@@ -162,63 +170,67 @@ class MNIST(Dataset):
 
         self.transform = transform
 
-        # read dataset into memory
-        self._parse_dataset()
+        # read dataset into memory, or map cached dataset into memory
+        self._parse_dataset(use_cache)
 
         self.dtype = paddle.get_default_dtype()
 
-    def _parse_dataset(self, buffer_size=100):
-        self.images = []
-        self.labels = []
+    def _parse_dataset(self, use_cache=False):
+        if use_cache:
+            data = _load_cached_arrays(
+                self.NAME,
+                [self.image_path, self.label_path],
+                self.mode,
+                self._read_dataset,
+            )
+        else:
+            data = self._read_dataset()
+        # NOTE: images and labels are stored as contiguous arrays in
+        #       shape [N, rows * cols] and [N, 1], which can be read
+        #       in batch by fancy indexing, see __getitems__
+        self.images = data['images']
+        self.labels = data['labels']
+
+    def _read_dataset(self):
         with gzip.GzipFile(self.image_path, 'rb') as image_file:
             img_buf = image_file.read()
-            with gzip.GzipFile(self.label_path, 'rb') as label_file:
-                lab_buf = label_file.read()
-
-                step_label = 0
-                offset_img = 0
-                # read from Big-endian
-                # get file info from magic byte
-                # image file : 16B
-                magic_byte_img = '>IIII'
-                magic_img, image_num, rows, cols = struct.unpack_from(
-                    magic_byte_img, img_buf, offset_img
-                )
-                offset_img += struct.calcsize(magic_byte_img)
-
-                offset_lab = 0
-                # label file : 8B
-                magic_byte_lab = '>II'
-                magic_lab, label_num = struct.unpack_from(
-                    magic_byte_lab, lab_buf, offset_lab
-                )
-                offset_lab += struct.calcsize(magic_byte_lab)
-
-                while True:
-                    if step_label >= label_num:
-                        break
-                    fmt_label = '>' + str(buffer_size) + 'B'
-                    labels = struct.unpack_from(fmt_label, lab_buf, offset_lab)
-                    offset_lab += struct.calcsize(fmt_label)
-                    step_label += buffer_size
-
-                    fmt_images = '>' + str(buffer_size * rows * cols) + 'B'
-                    images_temp = struct.unpack_from(
-                        fmt_images, img_buf, offset_img
-                    )
-                    images = np.reshape(
-                        images_temp, (buffer_size, rows * cols)
-                    ).astype('float32')
-                    offset_img += struct.calcsize(fmt_images)
-
-                    for i in range(buffer_size):
-                        self.images.append(images[i, :])
-                        self.labels.append(
-                            np.array([labels[i]]).astype('int64')
-                        )
+        with gzip.GzipFile(self.label_path, 'rb') as label_file:
+            lab_buf = label_file.read()
+
+        # read from Big-endian
+        # get file info from magic byte
+        # image file : 16B
+        magic_byte_img = '>IIII'
+        magic_img, image_num, rows, cols = struct.unpack_from(
+            magic_byte_img, img_buf, 0
+        )
+        offset_img = struct.calcsize(magic_byte_img)
+
+        # label file : 8B
+        magic_byte_lab = '>II'
+        magic_lab, label_num = struct.unpack_from(magic_byte_lab, lab_buf, 0)
+        offset_lab = struct.calcsize(magic_byte_lab)
+
+        images = (
+            np.frombuffer(
+                img_buf,
+                dtype=np.uint8,
+                count=label_num * rows * cols,
+                offset=offset_img,
+            )
+            .reshape([label_num, rows * cols])
+            .astype('float32')
+        )
+        labels = (
+            np.frombuffer(
+                lab_buf, dtype=np.uint8, count=label_num, offset=offset_lab
+            )
+            .reshape([label_num, 1])
+            .astype('int64')
+        )
+        return {'images': images, 'labels': labels}
 
-    def __getitem__(self, idx):
-        image, label = self.images[idx], self.labels[idx]
+    def _process(self, image, label):
         image = np.reshape(image, [28, 28])
 
         if self.backend == 'pil':
@@ -232,6 +244,15 @@ class MNIST(Dataset):
 
         return image.astype(self.dtype), label.astype('int64')
 
+    def __getitem__(self, idx):
+        return self._process(self.images[idx], self.labels[idx])
+
+    def __getitems__(self, indices):
+        images, labels = self.images[indices], self.labels[indices]
+        return [
+            self._process(image, label) for image, label in zip(images, labels)
+        ]
+
     def __len__(self):
         return len(self.labels)
 
@@ -253,6 +274,10 @@ class FashionMNIST(MNIST):
             PIL.Image or numpy.ndarray. Should be one of {'pil', 'cv2'}.
             If this option is not set, will get backend from :ref:`paddle.vision.get_image_backend <api_vision_image_get_image_backend>`,
             default backend is 'pil'. Default: None.
+        use_cache (bool, optional): Whether to convert the dataset into a numpy array
+            cache under ~/.cache/paddle/dataset/fashion-mnist/cache once, and read samples
+            from memory mapped cache files, which starts instantly after the first
+            run and shares memory among DataLoader worker processes. Default: False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of FashionMNIST dataset.
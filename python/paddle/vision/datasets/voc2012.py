@@ -19,7 +19,11 @@ import numpy as np
 from PIL import Image
 
 import paddle
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import (
+    _check_exists_and_download,
+    _load_cached_arrays,
+    _pack_bytes,
+)
 from paddle.io import Dataset
 
 __all__ = []
@@ -50,6 +54,11 @@ class VOC2012(Dataset):
             PIL.Image or numpy.ndarray. Should be one of {'pil', 'cv2'}.
             If this option is not set, will get backend from :ref:`paddle.vision.get_image_backend <api_vision_image_get_image_backend>`,
             default backend is 'pil'. Default: None.
+        use_cache (bool, optional): Whether to convert encoded images and labels of the
+            dataset into a numpy array cache under ~/.cache/paddle/dataset/voc2012/cache
+            once, and read samples from memory mapped cache files instead of the tar file,
+            which starts instantly after the first run and shares memory among DataLoader
+            worker processes. Default: False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of VOC2012 dataset.
@@ -111,6 +120,7 @@ class VOC2012(Dataset):
         transform=None,
         download=True,
         backend=None,
+        use_cache=False,
     ):
         assert mode.lower() in [
             'train',
@@ -140,8 +150,18 @@ class VOC2012(Dataset):
             )
         self.transform = transform
 
-        # read dataset into memory
-        self._load_anno()
+        if use_cache:
+            # NOTE: encoded images and labels are cached, sample idx is
+            #       data[data_offsets[idx]:data_offsets[idx + 1]] and
+            #       label[label_offsets[idx]:label_offsets[idx + 1]]
+            self.data_tar = None
+            self._cache = _load_cached_arrays(
+                CACHE_DIR, [self.data_file], self.flag, self._read_samples
+            )
+        else:
+            # read dataset into memory
+            self._load_anno()
+            self._cache = None
 
         self.dtype = paddle.get_default_dtype()
 
@@ -164,12 +184,42 @@ class VOC2012(Dataset):
             self.data.append(data)
             self.labels.append(label)
 
-    def __getitem__(self, idx):
-        data_file = self.data[idx]
-        label_file = self.labels[idx]
+    def _read_samples(self):
+        self._load_anno()
+        data = [
+            self.data_tar.extractfile(self.name2mem[data_file]).read()
+            for data_file in self.data
+        ]
+        label = [
+            self.data_tar.extractfile(self.name2mem[label_file]).read()
+            for label_file in self.labels
+        ]
+        self.data_tar.close()
+        self.data_tar = None
+
+        data, data_offsets = _pack_bytes(data)
+        label, label_offsets = _pack_bytes(label)
+        return {
+            'data': data,
+            'data_offsets': data_offsets,
+            'label': label,
+            'label_offsets': label_offsets,
+        }
+
+    def _read_cache(self, name, idx):
+        offsets = self._cache[name + '_offsets']
+        return self._cache[name][offsets[idx] : offsets[idx + 1]]
 
-        data = self.data_tar.extractfile(self.name2mem[data_file]).read()
-        label = self.data_tar.extractfile(self.name2mem[label_file]).read()
+    def __getitem__(self, idx):
+        if self._cache is None:
+            data_file = self.data[idx]
+            label_file = self.labels[idx]
+
+            data = self.data_tar.extractfile(self.name2mem[data_file]).read()
+            label = self.data_tar.extractfile(self.name2mem[label_file]).read()
+        else:
+            data = self._read_cache('data', idx)
+            label = self._read_cache('label', idx)
         data = Image.open(io.BytesIO(data))
         label = Image.open(io.BytesIO(label))
 
@@ -186,7 +236,9 @@ class VOC2012(Dataset):
         return data, label
 
     def __len__(self):
-        return len(self.data)
+        if self._cache is None:
+            return len(self.data)
+        return len(self._cache['data_offsets']) - 1
 
     def __del__(self):
         if self.data_tar:
@@ -0,0 +1,130 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Benchmark of the dygraph to static conversion time of paddle.vision.models,
+# compares transforming the AST pass by pass with the fused passes and the
+# concurrent transformation of callees in worker processes, usage:
+#   python benchmark_conversion.py --models resnet50 mobilenet_v2 vgg16
+#
+# Every conversion runs in a new process to start with empty caches. The
+# models are converted as user code, since the layers defined in paddle are
+# skipped by dygraph to static.
+
+import argparse
+import inspect
+import json
+import os
+import subprocess
+import sys
+import time
+
+MODES = ['sequential', 'fused', 'fused+workers']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark of dygraph to static conversion time"
+    )
+    parser.add_argument(
+        '--models',
+        nargs='+',
+        default=['resnet50', 'mobilenet_v1', 'mobilenet_v2', 'vgg16'],
+    )
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--run', default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--mode', default=None, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def convert(model_name, mode):
+    import paddle
+    from paddle.jit.dy2static import ast_transformer, program_translator
+    from paddle.jit.dy2static.utils import as_not_paddle_func
+    from paddle.static import InputSpec
+
+    if mode == 'sequential':
+        ast_transformer.FUSIBLE_TRANSFORMERS = ()
+
+    transform_time = [0.0]
+    transform = program_translator.FunctionCache._transform
+
+    def timed_transform(self, func, source_code):
+        start = time.perf_counter()
+        try:
+            return transform(self, func, source_code)
+        finally:
+            transform_time[0] += time.perf_counter() - start
+
+    program_translator.FunctionCache._transform = timed_transform
+
+    model = getattr(paddle.vision.models, model_name)()
+    model.eval()
+    for layer in [model] + model.sublayers():
+        module = inspect.getmodule(type(layer)).__name__
+        if module.startswith('paddle.vision.models'):
+            as_not_paddle_func(f'{module}.{type(layer).__name__}')
+            as_not_paddle_func(f'{module}.forward')
+
+    static_model = paddle.jit.to_static(
+        model, input_spec=[InputSpec([None, 3, 224, 224], 'float32')]
+    )
+    start = time.perf_counter()
+    program = static_model.forward.concrete_program.main_program
+    total_time = time.perf_counter() - start
+    return {
+        'transform': transform_time[0],
+        'total': total_time,
+        'ops': len(program.global_block().ops),
+    }
+
+
+def run_in_subprocess(model_name, mode, workers):
+    env = dict(os.environ)
+    env.pop('TRANSLATOR_CACHE_DIR', None)
+    env['TRANSLATOR_CONVERT_WORKERS'] = (
+        str(workers) if mode == 'fused+workers' else '0'
+    )
+    output = subprocess.check_output(
+        [sys.executable, __file__, '--run', model_name, '--mode', mode],
+        env=env,
+    ).decode()
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    args = parse_args()
+    if args.run is not None:
+        print(json.dumps(convert(args.run, args.mode)))
+        return
+
+    print(
+        f"{'model':<16}{'mode':<16}{'ops':>8}{'transform(ms)':>16}{'total(ms)':>12}"
+    )
+    for model_name in args.models:
+        for mode in MODES:
+            results = [
+                run_in_subprocess(model_name, mode, args.workers)
+                for _ in range(args.repeat)
+            ]
+            transform_time = min(r['transform'] for r in results) * 1000
+            total_time = min(r['total'] for r in results) * 1000
+            num_ops = results[0]['ops']
+            print(
+                f"{model_name:<16}{mode:<16}{num_ops:>8}{transform_time:>16.1f}{total_time:>12.1f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+import numpy as np
+
+from paddle.jit.dy2static.disk_cache import DiskCache, make_key
+
+SCRIPT = textwrap.dedent(
+    '''
+    import sys
+
+    import numpy as np
+
+    import paddle
+    from paddle.jit.dy2static import program_translator
+
+    built = []
+    from_func_spec = program_translator.ConcreteProgram.from_func_spec
+
+
+    def counted_from_func_spec(*args, **kwargs):
+        built.append(1)
+        return from_func_spec(*args, **kwargs)
+
+
+    program_translator.ConcreteProgram.from_func_spec = staticmethod(
+        counted_from_func_spec
+    )
+
+
+    def scale(x):
+        if x.shape[0] > 1:
+            x = x * 2
+        return x
+
+
+    class Net(paddle.nn.Layer):
+        def __init__(self):
+            super().__init__()
+            self.linear = paddle.nn.Linear(4, 3)
+
+        @paddle.jit.to_static
+        def forward(self, x):
+            return paddle.nn.functional.relu(scale(self.linear(x)))
+
+
+    paddle.seed(2023)
+    net = Net()
+    x = paddle.to_tensor(np.arange(8, dtype='float32').reshape([2, 4]))
+    out = net(x)
+    out.sum().backward()
+    np.save(sys.argv[1], np.concatenate([
+        out.numpy().reshape([-1]), net.linear.weight.grad.numpy().reshape([-1])
+    ]))
+    print('BUILT', len(built))
+    '''
+)
+
+
+class TestDiskCache(unittest.TestCase):
+    def test_get_put(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DiskCache(cache_dir)
+            key = make_key('source', (1, 2))
+            self.assertIsNone(cache.get('ast', key))
+            self.assertTrue(cache.put('ast', key, {'a': [1, 2]}))
+            self.assertEqual(cache.get('ast', key), {'a': [1, 2]})
+            self.assertIsNone(cache.get('program', key))
+            self.assertIsNone(cache.get('ast', make_key('source', (1, 3))))
+            # unpicklable value is not saved
+            self.assertFalse(cache.put('ast', key, lambda: None))
+            self.assertEqual(cache.get('ast', key), {'a': [1, 2]})
+
+
+class TestProgramDiskCache(unittest.TestCase):
+    def run_script(self, script_path, cache_dir, out_path):
+        env = dict(os.environ, TRANSLATOR_CACHE_DIR=cache_dir)
+        output = subprocess.check_output(
+            [sys.executable, script_path, out_path], env=env
+        ).decode()
+        built = [
+            line for line in output.splitlines() if line.startswith('BUILT')
+        ]
+        return int(built[-1].split()[1]), np.load(out_path)
+
+    def test_warm_start(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script_path = os.path.join(temp_dir, 'net.py')
+            with open(script_path, 'w') as f:
+                f.write(SCRIPT)
+            cache_dir = os.path.join(temp_dir, 'cache')
+            out_path = os.path.join(temp_dir, 'out.npy')
+
+            built, cold = self.run_script(script_path, cache_dir, out_path)
+            self.assertEqual(built, 1)
+            self.assertTrue(os.listdir(os.path.join(cache_dir, 'program')))
+            built, warm = self.run_script(script_path, cache_dir, out_path)
+            self.assertEqual(built, 0)
+            np.testing.assert_allclose(cold, warm)
+
+            # modified source invalidates the cache
+            with open(script_path, 'a') as f:
+                f.write('\n# modified\n')
+            built, _ = self.run_script(script_path, cache_dir, out_path)
+            self.assertEqual(built, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import paddle
+from paddle.base import unique_name
+from paddle.jit.dy2static import DygraphToStaticAst, ast_transformer
+from paddle.jit.dy2static import program_translator
+from paddle.jit.dy2static.cast_transformer import CastTransformer
+from paddle.jit.dy2static.call_transformer import CallTransformer
+from paddle.jit.dy2static.logical_transformer import LogicalTransformer
+from paddle.jit.dy2static.utils import ast_to_source_code, func_to_source_code
+from paddle.utils import gast
+
+
+def scale(x, factor=2):
+    if x.mean() > 0:
+        x = x * factor
+    return x
+
+
+def cast_and_assert(x: paddle.Tensor) -> paddle.Tensor:
+    assert x.shape[0] > 0, "x should not be empty"
+    n = int(x.shape[0])
+    y = float(n) * scale(x, factor=int(bool(n)))
+    for i in range(n):
+        if i > 1 and not bool(i % 2):
+            break
+        y = y + i
+    return y
+
+
+def decorated(x):
+    @paddle.jit.not_to_static
+    def inner(y: int):
+        return scale(y)
+
+    return inner(x) + len([int(v) for v in range(3)])
+
+
+class Block(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.linear = paddle.nn.Linear(4, 4)
+
+    def forward(self, x):
+        return scale(self.linear(x))
+
+
+class Net(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.blocks = paddle.nn.Sequential(Block(), Block())
+
+    def forward(self, x):
+        return self.blocks(x).sum(axis=-1)
+
+
+class TestFusedTransformer(unittest.TestCase):
+    def transform(self, func):
+        with unique_name.guard():
+            root = gast.parse(func_to_source_code(func))
+            root = DygraphToStaticAst().get_static_ast(root)
+            return ast_to_source_code(root)
+
+    def test_same_as_sequential(self):
+        for func in [scale, cast_and_assert, decorated, Block.forward]:
+            fused_code = self.transform(func)
+            with mock.patch.object(ast_transformer, 'FUSIBLE_TRANSFORMERS', ()):
+                sequential_code = self.transform(func)
+            self.assertEqual(fused_code, sequential_code)
+
+    def test_group(self):
+        groups = ast_transformer.group_fusible_transformers(
+            [LogicalTransformer, CallTransformer, CastTransformer]
+        )
+        self.assertEqual(
+            groups, [[LogicalTransformer], [CallTransformer, CastTransformer]]
+        )
+
+
+class TestConvertWorkers(unittest.TestCase):
+    def test_prefetch(self):
+        paddle.disable_static()
+        paddle.seed(2023)
+        net = Net()
+        x = paddle.randn([2, 4])
+        expected = net(x).numpy()
+
+        cache = program_translator.FunctionCache()
+        with mock.patch.dict(
+            os.environ, {program_translator.CONVERT_WORKERS_ENV_NAME: '2'}
+        ), mock.patch.object(program_translator, '_FUNCTION_CACHE', cache):
+            static_net = paddle.jit.to_static(net)
+            out = static_net(x)
+            np.testing.assert_allclose(out.numpy(), expected, rtol=1e-5)
+            # Block.forward is prefetched as a sublayer, and scale is
+            # prefetched as a callee of Block.forward
+            self.assertIsNotNone(cache._executor)
+            self.assertEqual(cache._code_to_ast_futures, {})
+            for func in [Block.forward, scale]:
+                self.assertIn(
+                    func_to_source_code(func), cache._code_to_ast_caches
+                )
+        cache._executor.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
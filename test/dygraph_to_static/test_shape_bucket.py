@@ -0,0 +1,115 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+
+
+class SeqNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.linear = paddle.nn.Linear(4, 4)
+
+    def forward(self, x, mask):
+        out = self.linear(x) * mask.unsqueeze(-1)
+        return out, out.sum(axis=1)
+
+
+class TestProgramCacheSize(unittest.TestCase):
+    def test_lru(self):
+        paddle.disable_static()
+
+        def func(x):
+            return x + 1
+
+        static_func = paddle.jit.to_static(func, cache_size=2)
+        for length in [1, 2, 1, 3, 1, 2]:
+            out = static_func(paddle.ones([length]))
+            np.testing.assert_allclose(out.numpy(), np.full([length], 2.0))
+        stats = static_func.get_cache_stats()
+        # 1, 2 traced, 1 hit, 3 traced and evicts 2, 1 hit, 2 traced again
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 4)
+        self.assertEqual(stats['retraces'], 3)
+        self.assertEqual(stats['evictions'], 2)
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(static_func.get_traced_count(), 2)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            paddle.jit.to_static(lambda x: x, cache_size=0)
+
+
+class TestShapeBucket(unittest.TestCase):
+    def test_bucket_size(self):
+        bucket = paddle.jit.ShapeBucket(axes={'x': 1})
+        self.assertEqual(
+            [bucket.bucket_size(i) for i in [1, 2, 3, 5, 8, 9]],
+            [1, 2, 4, 8, 8, 16],
+        )
+        bucket = paddle.jit.ShapeBucket(axes={'x': 1}, buckets=[16, 4])
+        self.assertEqual(
+            [bucket.bucket_size(i) for i in [1, 4, 5, 16, 17]],
+            [4, 4, 16, 16, 17],
+        )
+
+    def test_bucketed_forward(self):
+        paddle.disable_static()
+        paddle.seed(2023)
+        net = SeqNet()
+        # only out is sliced back, the hidden size of total equals to the
+        # bucket size 4 of length 3
+        bucket = paddle.jit.ShapeBucket(
+            axes={'x': 1, 'mask': 1}, output_axes={0: 1}
+        )
+        static_net = paddle.jit.to_static(SeqNet(), shape_bucket=bucket)
+        static_net.set_state_dict(net.state_dict())
+
+        for length in range(3, 10):
+            x = paddle.randn([2, length, 4])
+            mask = paddle.ones([2, length])
+            out, total = net(x, mask)
+            static_out, static_total = static_net(x, mask)
+            self.assertEqual(static_out.shape, [2, length, 4])
+            self.assertEqual(static_total.shape, [2, 4])
+            np.testing.assert_allclose(
+                out.numpy(), static_out.numpy(), rtol=1e-5, atol=1e-6
+            )
+            np.testing.assert_allclose(
+                total.numpy(), static_total.numpy(), rtol=1e-5, atol=1e-6
+            )
+        # length 3 is padded to 4, lengths 5~8 are padded to 8, and 9 is
+        # padded to 16
+        self.assertEqual(static_net.forward.get_traced_count(), 3)
+        self.assertEqual(static_net.forward.get_cache_stats()['hits'], 4)
+
+    def test_padded_outputs(self):
+        paddle.disable_static()
+        bucket = paddle.jit.ShapeBucket(axes={'x': 1, 'mask': 1})
+        static_net = paddle.jit.to_static(SeqNet(), shape_bucket=bucket)
+        out, total = static_net(paddle.randn([2, 3, 4]), paddle.ones([2, 3]))
+        # outputs are not sliced without output_axes
+        self.assertEqual(out.shape, [2, 4, 4])
+        self.assertEqual(total.shape, [2, 4])
+
+    def test_invalid_output_axes(self):
+        with self.assertRaises(TypeError):
+            paddle.jit.ShapeBucket(axes={'x': 1}, output_axes=[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
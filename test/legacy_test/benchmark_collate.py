@@ -0,0 +1,70 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Throughput benchmark of batch collating functions for paddle.io.DataLoader,
+# compares default_collate_fn with SchemaCollateFn, usage:
+#   python benchmark_collate.py --batch_size 512 --iters 20
+
+import argparse
+import time
+
+import numpy as np
+
+from paddle.io import SchemaCollateFn
+from paddle.io.dataloader.collate import default_collate_fn
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark of batch collating functions"
+    )
+    parser.add_argument('--batch_size', type=int, default=512)
+    parser.add_argument(
+        '--image_shape', type=int, nargs='+', default=[3, 224, 224]
+    )
+    parser.add_argument('--iters', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=2)
+    return parser.parse_args()
+
+
+def samples_per_sec(collate_fn, batch, iters, warmup):
+    for _ in range(warmup):
+        collate_fn(batch)
+    start = time.time()
+    for _ in range(iters):
+        collate_fn(batch)
+    return iters * len(batch) / (time.time() - start)
+
+
+def main():
+    args = parse_args()
+    batch = [
+        {
+            'image': np.random.random(args.image_shape).astype('float32'),
+            'label': np.random.randint(0, 1000, (1,)).astype('int64'),
+        }
+        for _ in range(args.batch_size)
+    ]
+    collate_fns = [
+        ('default_collate_fn', default_collate_fn),
+        ('SchemaCollateFn(num_buffers=0)', SchemaCollateFn()),
+        ('SchemaCollateFn(num_buffers=2)', SchemaCollateFn(num_buffers=2)),
+    ]
+    for name, collate_fn in collate_fns:
+        speed = samples_per_sec(collate_fn, batch, args.iters, args.warmup)
+        print(f"{name:<32} {speed:>12.1f} samples/sec")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Benchmark of the import time of paddle, parses the output of
+# `python -X importtime`, usage:
+#   python benchmark_import.py --repeat 5 --top 20
+#   python benchmark_import.py --code "import paddle; paddle.vision"
+#
+# Reports the total cumulative import time of the statement, the number of
+# imported modules, the peak resident memory of the process and the slowest
+# top level paddle subpackages.
+
+import argparse
+import json
+import subprocess
+import sys
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark of import paddle")
+    parser.add_argument('--code', default='import paddle')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--json', action='store_true')
+    return parser.parse_args()
+
+
+def parse_importtime(stderr):
+    """
+    Returns a list of (module, self time, cumulative time, depth), the times
+    are in microseconds.
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:') :].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append((name.strip(), int(self_time), int(cumulative), depth))
+    return records
+
+
+def run_importtime(code):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout, parse_importtime(result.stderr)
+
+
+def run_once(code, startup):
+    # ru_maxrss is in kilobytes on linux
+    _, records = run_importtime(code)
+    stdout, _ = run_importtime(
+        f"{code}\n"
+        "import resource\n"
+        "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+    )
+    # the modules imported at interpreter startup are excluded
+    records = [r for r in records if r[0] not in startup]
+    return {
+        'total': sum(r[2] for r in records if r[3] == 0),
+        'modules': len(records),
+        'maxrss': int(stdout.strip().splitlines()[-1]),
+        'records': records,
+    }
+
+
+def main():
+    args = parse_args()
+    startup = {r[0] for r in run_importtime('pass')[1]}
+    results = [run_once(args.code, startup) for _ in range(args.repeat)]
+    best = min(results, key=lambda r: r['total'])
+    paddle_modules = sorted(
+        (
+            r
+            for r in best['records']
+            if r[0].startswith('paddle.') and r[0].count('.') == 1
+        ),
+        key=lambda r: r[2],
+        reverse=True,
+    )
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    'code': args.code,
+                    'total_ms': best['total'] / 1000,
+                    'modules': best['modules'],
+                    'maxrss_mb': best['maxrss'] / 1024,
+                }
+            )
+        )
+        return
+
+    print(f"statement:  {args.code}")
+    print(f"total(ms):  {best['total'] / 1000:.1f}")
+    print(f"modules:    {best['modules']}")
+    print(f"maxrss(MB): {best['maxrss'] / 1024:.1f}")
+    print(f"{'subpackage':<40}{'self(ms)':>12}{'cumulative(ms)':>16}")
+    for name, self_time, cumulative, _ in paddle_modules[: args.top]:
+        print(f"{name:<40}{self_time / 1000:>12.1f}{cumulative / 1000:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
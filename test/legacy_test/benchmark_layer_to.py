@@ -0,0 +1,94 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Throughput benchmark of paddle.nn.Layer.to, compares transforming the
+# parameters one by one with coalescing them into flat buffers, usage:
+#   python benchmark_layer_to.py --num_layers 1000 --hidden_size 256
+#   python benchmark_layer_to.py --device gpu:0
+#
+# The model casts between float32 and float16 on cpu by default. With
+# --device, it moves between cpu and the device in float32 instead.
+
+import argparse
+import time
+from unittest import mock
+
+import paddle
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark of paddle.nn.Layer.to"
+    )
+    parser.add_argument('--num_layers', type=int, default=1000)
+    parser.add_argument('--hidden_size', type=int, default=256)
+    parser.add_argument('--device', default=None)
+    parser.add_argument('--iters', type=int, default=10)
+    parser.add_argument('--warmup', type=int, default=1)
+    return parser.parse_args()
+
+
+def nbytes(model):
+    return sum(
+        p._numel() * paddle.base.core.size_of_dtype(p.dtype)
+        for p in model.parameters()
+    )
+
+
+def gb_per_sec(model, targets, iters, warmup):
+    # the bytes of the parameters read by one round of targets
+    round_bytes = 0
+    for _ in range(max(warmup, 1)):
+        round_bytes = 0
+        for target in targets:
+            round_bytes += nbytes(model)
+            model.to(**target)
+    start = time.time()
+    for _ in range(iters):
+        for target in targets:
+            model.to(**target)
+    return iters * round_bytes / (time.time() - start) / 1e9
+
+
+def main():
+    args = parse_args()
+    paddle.set_device('cpu')
+    model = paddle.nn.Sequential(
+        *[
+            paddle.nn.Linear(args.hidden_size, args.hidden_size)
+            for _ in range(args.num_layers)
+        ]
+    )
+    if args.device is None:
+        targets = [{'dtype': 'float16'}, {'dtype': 'float32'}]
+    else:
+        targets = [{'device': args.device}, {'device': 'cpu'}]
+
+    num_params = sum(p._numel() for p in model.parameters())
+    print(
+        f"{len(model.parameters())} parameters, {num_params / 1e6:.1f}M elements"
+    )
+    for name, buffer_size in [
+        ('one by one', 0),
+        ('flat buffers', 256 * 1024 * 1024),
+    ]:
+        with mock.patch(
+            'paddle.nn.layer.layers._BULK_TRANSFORM_BUFFER_SIZE', buffer_size
+        ):
+            speed = gb_per_sec(model, targets, args.iters, args.warmup)
+        print(f"{name:<16} {speed:>8.2f} GB/s")
+
+
+if __name__ == '__main__':
+    main()
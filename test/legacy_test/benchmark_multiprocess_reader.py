@@ -0,0 +1,81 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Throughput benchmark of paddle.reader.multiprocess_reader, compares the
+# pipe, queue and shared memory transports with image samples, usage:
+#   python benchmark_multiprocess_reader.py --num_readers 4 --image_size 224
+#
+# The pipe transport encodes samples by json, so its readers yield lists
+# instead of numpy arrays.
+
+import argparse
+import functools
+import time
+
+import numpy as np
+
+import paddle
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark of paddle.reader.multiprocess_reader"
+    )
+    parser.add_argument('--num_readers', type=int, default=2)
+    parser.add_argument('--num_samples', type=int, default=4000)
+    parser.add_argument('--image_size', type=int, default=224)
+    parser.add_argument(
+        '--modes', nargs='+', default=['pipe', 'queue', 'shared_memory']
+    )
+    return parser.parse_args()
+
+
+def image_reader(num_samples, image_size, to_list):
+    image = np.random.randint(
+        0, 256, (3, image_size, image_size), dtype='uint8'
+    )
+    sample = (image.tolist(), 0) if to_list else (image, 0)
+    for i in range(num_samples):
+        yield sample
+
+
+def main():
+    args = parse_args()
+    sample_bytes = 3 * args.image_size * args.image_size
+    print(f"{'mode':<16}{'samples/sec':>14}{'MB/s':>10}")
+    for mode in args.modes:
+        readers = [
+            functools.partial(
+                image_reader,
+                args.num_samples // args.num_readers,
+                args.image_size,
+                mode == 'pipe',
+            )
+            for _ in range(args.num_readers)
+        ]
+        reader = paddle.reader.multiprocess_reader(
+            readers,
+            use_pipe=mode == 'pipe',
+            use_shared_memory=mode == 'shared_memory',
+        )
+        start = time.time()
+        num_samples = 0
+        for _ in reader():
+            num_samples += 1
+        speed = num_samples / (time.time() - start)
+        print(f"{mode:<16}{speed:>14.1f}{speed * sample_bytes / 1e6:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Throughput benchmark of paddle.reader.xmap_readers with a CPU bound mapper
+# which augments images, compares the thread and process backends with
+# different worker numbers, usage:
+#   python benchmark_xmap.py --workers 1 2 4 8 --chunk_size 4
+
+import argparse
+import time
+
+import numpy as np
+
+import paddle
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark of paddle.reader.xmap_readers"
+    )
+    parser.add_argument('--num_samples', type=int, default=512)
+    parser.add_argument('--image_size', type=int, default=128)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--chunk_size', type=int, default=1)
+    parser.add_argument('--buffer_size', type=int, default=64)
+    parser.add_argument('--unordered', action='store_true')
+    return parser.parse_args()
+
+
+def augment(image):
+    # histogram equalization in pure python, which holds the GIL like the
+    # decoders and augmentations written in python
+    hist = [0] * 256
+    for value in image[..., 0].ravel().tolist():
+        hist[value] += 1
+    lut, total = [], 0
+    for count in hist:
+        total += count
+        lut.append(total * 255 // image[..., 0].size)
+    return np.array(lut, dtype='uint8')[image[:, ::-1]]
+
+
+def main():
+    args = parse_args()
+    image = np.random.randint(
+        0, 256, (args.image_size, args.image_size, 3), dtype='uint8'
+    )
+
+    def reader():
+        for _ in range(args.num_samples):
+            yield image
+
+    print(f"{'backend':<10}{'workers':>8}{'samples/sec':>14}{'speedup':>10}")
+    for use_process in (False, True):
+        base_speed = None
+        for workers in args.workers:
+            xreader = paddle.reader.xmap_readers(
+                augment,
+                reader,
+                workers,
+                args.buffer_size,
+                order=not args.unordered,
+                use_process=use_process,
+                chunk_size=args.chunk_size,
+            )
+            start = time.time()
+            for _ in xreader():
+                pass
+            speed = args.num_samples / (time.time() - start)
+            base_speed = base_speed or speed
+            backend = 'process' if use_process else 'thread'
+            print(
+                f"{backend:<10}{workers:>8}{speed:>14.1f}{speed / base_speed:>10.2f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
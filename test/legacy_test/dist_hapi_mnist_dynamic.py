@@ -93,6 +93,18 @@ class TestDistTraining(unittest.TestCase):
 
         np.testing.assert_allclose(acc, eval_result['acc'])
 
+        # samples padded by DistributedBatchSampler should not be counted in
+        # the metric states reduced from all ranks
+        num_samples = 999
+        eval_result = model.evaluate(
+            paddle.io.Subset(val_dataset, list(range(num_samples))),
+            batch_size=batch_size,
+        )
+        acc = compute_accuracy(
+            output[0][:num_samples], val_dataset.labels[:num_samples]
+        )
+        np.testing.assert_allclose(acc, eval_result['acc'])
+
 
 if __name__ == '__main__':
     unittest.main()
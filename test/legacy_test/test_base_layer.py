@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -518,6 +519,79 @@ class TestLayerTo(unittest.TestCase):
         self.func_test_to_api_none_buffer()
 
 
+class TestLayerToBulk(unittest.TestCase):
+    def build(self):
+        paddle.seed(2023)
+        model = paddle.nn.Sequential(
+            paddle.nn.Linear(4, 8),
+            paddle.nn.Linear(8, 4),
+            paddle.nn.Linear(4, 2),
+        )
+        model.register_buffer("steps", paddle.to_tensor([1], dtype='int64'))
+        model(paddle.rand([3, 4])).sum().backward()
+        return model
+
+    def train(self, model):
+        opt = paddle.optimizer.SGD(0.1, parameters=model.parameters())
+        x = paddle.rand([3, 4], dtype=model[0].weight.dtype)
+        for _ in range(2):
+            model(x).sum().backward()
+            opt.step()
+            opt.clear_grad()
+        return [p.numpy() for p in model.parameters()]
+
+    def test_bulk_to(self):
+        paddle.disable_static()
+        model = self.build()
+        expected = self.build()
+        with mock.patch(
+            'paddle.nn.layer.layers._BULK_TRANSFORM_BUFFER_SIZE', 0
+        ):
+            expected.to(dtype='float64')
+        model.to(dtype='float64')
+
+        params = model.parameters()
+        for param, expected_param in zip(params, expected.parameters()):
+            self.assertEqual(param.dtype, paddle.float64)
+            self.assertEqual(param.shape, expected_param.shape)
+            self.assertIsInstance(param, EagerParamBase)
+            self.assertTrue(param._is_shared_buffer_with(params[0]))
+            self.assertFalse(param.grad._is_shared_buffer_with(params[0]))
+            np.testing.assert_array_equal(param.numpy(), expected_param.numpy())
+            np.testing.assert_array_equal(
+                param.grad.numpy(), expected_param.grad.numpy()
+            )
+        self.assertEqual(model.steps.dtype, paddle.float64)
+        self.assertEqual(model.steps.numpy().tolist(), [1.0])
+
+        paddle.seed(2023)
+        results = self.train(model)
+        paddle.seed(2023)
+        expected_results = self.train(expected)
+        for result, expected_result in zip(results, expected_results):
+            np.testing.assert_allclose(result, expected_result, rtol=1e-12)
+
+    def test_floating_only(self):
+        paddle.disable_static()
+        model = self.build()
+        model._to_impl(dtype='float16', floating_only=True)
+        for param in model.parameters():
+            self.assertEqual(param.dtype, paddle.float16)
+        self.assertEqual(model.steps.dtype, paddle.int64)
+
+    def test_small_buffer(self):
+        paddle.disable_static()
+        model = self.build()
+        # every buffer holds at most the weight and the bias of one linear
+        with mock.patch(
+            'paddle.nn.layer.layers._BULK_TRANSFORM_BUFFER_SIZE', 160
+        ):
+            model.to(dtype='float64')
+        weight, bias = model[0].weight, model[0].bias
+        self.assertTrue(weight._is_shared_buffer_with(bias))
+        self.assertFalse(weight._is_shared_buffer_with(model[1].weight))
+
+
 if __name__ == '__main__':
     paddle.enable_static()
     unittest.main()
@@ -19,6 +19,7 @@ import numpy as np
 from paddle.io import (
     BatchSampler,
     Dataset,
+    DistributedBatchSampler,
     RandomSampler,
     Sampler,
     SequenceSampler,
@@ -109,6 +110,15 @@ class TestRandomSampler(unittest.TestCase):
             rets.append(i)
         assert tuple(sorted(rets)) == tuple(range(0, 50))
 
+    def test_low_memory(self):
+        dataset = RandomDataset(100, 10)
+        sampler = RandomSampler(dataset, low_memory=True)
+        assert len(sampler) == 100
+
+        rets = list(iter(sampler))
+        assert tuple(sorted(rets)) == tuple(range(0, 100))
+        assert rets != list(range(0, 100))
+
 
 class TestBatchSampler(unittest.TestCase):
     def setUp(self):
@@ -207,6 +217,103 @@ class TestBatchSamplerWithSamplerShuffle(unittest.TestCase):
             pass
 
 
+class TestDistributedBatchSampler(unittest.TestCase):
+    def setUp(self):
+        self.num_samples = 1001
+        self.num_replicas = 4
+        self.batch_size = 32
+        self.shuffle = True
+        self.drop_last = False
+        self.low_memory = False
+
+    def init_batch_samplers(self):
+        dataset = RandomDataset(self.num_samples, 10)
+        return [
+            DistributedBatchSampler(
+                dataset,
+                batch_size=self.batch_size,
+                num_replicas=self.num_replicas,
+                rank=rank,
+                shuffle=self.shuffle,
+                drop_last=self.drop_last,
+                low_memory=self.low_memory,
+            )
+            for rank in range(self.num_replicas)
+        ]
+
+    def test_main(self):
+        samplers = self.init_batch_samplers()
+        num_samples_per_rank = int(
+            np.ceil(self.num_samples / self.num_replicas)
+        )
+        for epoch in range(2):
+            indices = []
+            for bs in samplers:
+                batches = list(iter(bs))
+                self.assertEqual(len(batches), len(bs))
+                for batch in batches[:-1]:
+                    self.assertEqual(len(batch), self.batch_size)
+                for batch in batches:
+                    self.assertTrue(all(isinstance(i, int) for i in batch))
+                    indices.extend(batch)
+
+            if self.drop_last:
+                continue
+            # all samples drawn, padded with leading indices if not even
+            self.assertEqual(
+                len(indices), num_samples_per_rank * self.num_replicas
+            )
+            self.assertEqual(set(indices), set(range(self.num_samples)))
+            if not self.shuffle:
+                self.assertEqual(
+                    sorted(indices),
+                    sorted(
+                        list(range(self.num_samples))
+                        + list(range(len(indices) - self.num_samples))
+                    ),
+                )
+
+    def test_set_epoch(self):
+        if not self.shuffle:
+            return
+        bs = self.init_batch_samplers()[0]
+        bs.set_epoch(3)
+        first = list(iter(bs))
+        bs.set_epoch(3)
+        self.assertEqual(first, list(iter(bs)))
+        self.assertNotEqual(first, list(iter(bs)))
+
+
+class TestDistributedBatchSamplerNoShuffle(TestDistributedBatchSampler):
+    def setUp(self):
+        self.num_samples = 1001
+        self.num_replicas = 4
+        self.batch_size = 32
+        self.shuffle = False
+        self.drop_last = False
+        self.low_memory = False
+
+
+class TestDistributedBatchSamplerDropLast(TestDistributedBatchSampler):
+    def setUp(self):
+        self.num_samples = 1001
+        self.num_replicas = 3
+        self.batch_size = 32
+        self.shuffle = True
+        self.drop_last = True
+        self.low_memory = False
+
+
+class TestDistributedBatchSamplerLowMemory(TestDistributedBatchSampler):
+    def setUp(self):
+        self.num_samples = 1001
+        self.num_replicas = 4
+        self.batch_size = 32
+        self.shuffle = True
+        self.drop_last = False
+        self.low_memory = True
+
+
 class TestWeightedRandomSampler(unittest.TestCase):
     def init_probs(self, total, pos):
         pos_probs = np.random.random((pos,)).astype('float32')
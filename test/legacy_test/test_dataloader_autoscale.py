@@ -0,0 +1,140 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import time
+import unittest
+
+import numpy as np
+
+from paddle.io import DataLoader, Dataset, WorkerAutoScaler
+
+IMAGE_SIZE = 8
+SAMPLE_NUM = 40
+BATCH_SIZE = 4
+
+
+class SlowDataset(Dataset):
+    def __init__(self, sample_num, cost=0.0):
+        self.sample_num = sample_num
+        self.cost = cost
+
+    def __getitem__(self, idx):
+        if self.cost > 0:
+            time.sleep(self.cost)
+        return np.full([IMAGE_SIZE], idx, dtype='float32')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestWorkerAutoScalerPolicy(unittest.TestCase):
+    def setUp(self):
+        self.decisions = []
+        self.autoscaler = WorkerAutoScaler(
+            min_workers=1,
+            max_workers=3,
+            min_prefetch_factor=1,
+            max_prefetch_factor=3,
+            callback=self.decisions.append,
+        )
+        self.autoscaler._bind(2, 2)
+
+    def test_bind(self):
+        autoscaler = WorkerAutoScaler(min_workers=2, max_workers=4)
+        autoscaler._bind(8, 2)
+        self.assertEqual(autoscaler.num_workers, 4)
+        # only bind once
+        autoscaler._bind(1, 2)
+        self.assertEqual(autoscaler.num_workers, 4)
+
+    def test_starving(self):
+        # consumer waits and workers busy
+        decision = self.autoscaler._step(10.0, 5.0, 0.0)
+        self.assertEqual(decision['action'], 'add_worker')
+        self.assertEqual(decision['prev_num_workers'], 2)
+        self.assertEqual(decision['num_workers'], 3)
+        # max_workers reached
+        decision = self.autoscaler._step(10.0, 5.0, 0.0)
+        self.assertEqual(decision['action'], 'keep')
+        self.assertEqual(self.autoscaler.num_workers, 3)
+
+    def test_window(self):
+        # consumer waits but workers idle
+        decision = self.autoscaler._step(10.0, 5.0, 15.0)
+        self.assertEqual(decision['action'], 'grow_window')
+        self.assertEqual(decision['prefetch_factor'], 3)
+        decision = self.autoscaler._step(10.0, 5.0, 15.0)
+        self.assertEqual(decision['action'], 'keep')
+
+    def test_over_provisioned(self):
+        actions = [
+            self.autoscaler._step(10.0, 0.0, 18.0)['action'] for _ in range(4)
+        ]
+        self.assertEqual(
+            actions,
+            ['retire_worker', 'shrink_window', 'keep', 'keep'],
+        )
+        self.assertEqual(self.autoscaler.num_workers, 1)
+        self.assertEqual(self.autoscaler.prefetch_factor, 1)
+        self.assertEqual(len(self.decisions), 4)
+        self.assertEqual([d['epoch'] for d in self.decisions], [0, 1, 2, 3])
+
+
+class TestDataLoaderAutoScale(unittest.TestCase):
+    def run_main(self, persistent_workers, cost):
+        decisions = []
+        autoscaler = WorkerAutoScaler(
+            min_workers=1, max_workers=3, callback=decisions.append
+        )
+        loader = DataLoader(
+            SlowDataset(SAMPLE_NUM, cost),
+            batch_size=BATCH_SIZE,
+            num_workers=2,
+            persistent_workers=persistent_workers,
+            worker_autoscaler=autoscaler,
+        )
+        epoch_num = 3
+        for epoch in range(epoch_num):
+            iterator = iter(loader)
+            self.assertEqual(
+                len(iterator._workers),
+                decisions[-1]['num_workers'] if decisions else 2,
+            )
+            values = []
+            for data in iterator:
+                values.extend(data.numpy()[:, 0].tolist())
+            self.assertEqual(values, list(range(SAMPLE_NUM)))
+            self.assertEqual(len(decisions), epoch + 1)
+
+        for decision in decisions:
+            self.assertIn(decision['action'], WorkerAutoScaler.ACTIONS)
+            self.assertGreaterEqual(decision['num_workers'], 1)
+            self.assertLessEqual(decision['num_workers'], 3)
+            self.assertGreaterEqual(decision['consumer_wait'], 0.0)
+            self.assertGreaterEqual(decision['worker_idle'], 0.0)
+        return decisions
+
+    def test_main(self):
+        if sys.platform == 'darwin' or sys.platform == 'win32':
+            return
+        # the decisions depend on timing, so only their validity is checked
+        # here, and the policy is tested with synthetic stats above
+        for persistent_workers in [False, True]:
+            self.run_main(persistent_workers, 0.01)
+            self.run_main(persistent_workers, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
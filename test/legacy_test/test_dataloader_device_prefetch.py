@@ -0,0 +1,151 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.prefetcher import (
+    _DevicePrefetcher,
+    _PinnedBufferPool,
+)
+
+IMAGE_SIZE = 8
+SAMPLE_NUM = 20
+BATCH_SIZE = 4
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num):
+        np.random.seed(1)
+        self.images = np.random.random([sample_num, IMAGE_SIZE])
+        self.images = self.images.astype('float32')
+        self.labels = np.arange(sample_num, dtype='int64').reshape([-1, 1])
+
+    def __getitem__(self, idx):
+        return {'image': self.images[idx], 'label': self.labels[idx]}
+
+    def __len__(self):
+        return len(self.labels)
+
+
+class TestDataLoaderDevicePrefetch(unittest.TestCase):
+    def setUp(self):
+        self.dataset = RandomDataset(SAMPLE_NUM)
+        self.places = [paddle.CPUPlace()]
+        if paddle.is_compiled_with_cuda():
+            self.places.append(paddle.CUDAPlace(0))
+
+    def run_main(self, place, num_workers, depth):
+        loader = DataLoader(
+            self.dataset,
+            places=place,
+            batch_size=BATCH_SIZE,
+            num_workers=num_workers,
+            device_prefetch=depth,
+        )
+        iterator = iter(loader)
+        self.assertIsInstance(iterator, _DevicePrefetcher)
+        self.assertEqual(len(iterator), SAMPLE_NUM // BATCH_SIZE)
+
+        step = 0
+        for data in iterator:
+            self.assertTrue(data['image'].place._equals(place))
+            start = step * BATCH_SIZE
+            np.testing.assert_allclose(
+                data['image'].numpy(),
+                self.dataset.images[start : start + BATCH_SIZE],
+            )
+            np.testing.assert_array_equal(
+                data['label'].numpy(),
+                self.dataset.labels[start : start + BATCH_SIZE],
+            )
+            metrics = iterator.metrics
+            self.assertLessEqual(metrics['queue_depth'], depth)
+            step += 1
+
+        metrics = iterator.metrics
+        self.assertEqual(step, SAMPLE_NUM // BATCH_SIZE)
+        self.assertEqual(metrics['num_batches'], step)
+        self.assertEqual(metrics['queue_depth'], 0)
+        self.assertGreaterEqual(metrics['stall_time'], 0.0)
+        self.assertGreaterEqual(metrics['avg_stall_time'], 0.0)
+
+    def test_single_process(self):
+        for place in self.places:
+            for depth in [1, 2, 10]:
+                self.run_main(place, 0, depth)
+
+    def test_multi_process(self):
+        for place in self.places:
+            self.run_main(place, 2, 2)
+
+    @unittest.skipIf(
+        not paddle.is_compiled_with_cuda(), "pinned memory requires CUDA"
+    )
+    def test_pinned_staging(self):
+        sources = []
+        pin = _PinnedBufferPool.pin
+
+        def record_pin(pool, tensor, buffers):
+            source = pin(pool, tensor, buffers)
+            sources.append(source)
+            return source
+
+        with mock.patch.object(_PinnedBufferPool, 'pin', record_pin):
+            self.run_main(paddle.CUDAPlace(0), 0, 2)
+        # image and label of every batch
+        self.assertEqual(len(sources), 2 * SAMPLE_NUM // BATCH_SIZE)
+        for source in sources:
+            self.assertTrue(source.place.is_cuda_pinned_place())
+
+    @unittest.skipIf(
+        not paddle.is_compiled_with_cuda(), "pinned memory requires CUDA"
+    )
+    def test_pinned_buffer_recycled(self):
+        class Event:
+            def __init__(self, done):
+                self.done = done
+
+            def query(self):
+                return self.done
+
+        pool = _PinnedBufferPool(capacity=1)
+        x = paddle.to_tensor(np.arange(4, dtype='float32'), place='cpu')
+        buffers = []
+        first = pool.pin(x, buffers)
+        event = Event(False)
+        pool.release(event, buffers)
+        # the buffer is still read by the device copy
+        second = pool.pin(x, [])
+        self.assertIsNot(second, first)
+
+        event.done = True
+        y = paddle.to_tensor(np.ones(4, dtype='float32'), place='cpu')
+        third = pool.pin(y, [])
+        self.assertIs(third, first)
+        self.assertTrue(third.place.is_cuda_pinned_place())
+        np.testing.assert_array_equal(third.numpy(), y.numpy())
+
+    def test_disabled(self):
+        loader = DataLoader(self.dataset, batch_size=BATCH_SIZE)
+        self.assertNotIsInstance(iter(loader), _DevicePrefetcher)
+
+
+if __name__ == '__main__':
+    paddle.disable_static()
+    unittest.main()
@@ -0,0 +1,119 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset, Subset, TensorDataset
+from paddle.io.dataloader.dataset import _has_getitems
+
+IMAGE_SIZE = 8
+SAMPLE_NUM = 20
+BATCH_SIZE = 4
+
+
+class ArrayDataset(Dataset):
+    def __init__(self, sample_num):
+        self.images = np.arange(sample_num * IMAGE_SIZE, dtype='float32')
+        self.images = self.images.reshape([sample_num, IMAGE_SIZE])
+        self.labels = np.arange(sample_num, dtype='int64').reshape([-1, 1])
+        self.getitems_calls = 0
+
+    def __getitem__(self, idx):
+        return self.images[idx], self.labels[idx]
+
+    def __getitems__(self, indices):
+        self.getitems_calls += 1
+        return list(zip(self.images[indices], self.labels[indices]))
+
+    def __len__(self):
+        return len(self.labels)
+
+
+class NegativeArrayDataset(ArrayDataset):
+    def __getitem__(self, idx):
+        return -self.images[idx], self.labels[idx]
+
+
+class TestHasGetitems(unittest.TestCase):
+    def test_main(self):
+        self.assertTrue(_has_getitems(ArrayDataset(SAMPLE_NUM)))
+        # __getitem__ overridden only, should read samples one by one
+        self.assertFalse(_has_getitems(NegativeArrayDataset(SAMPLE_NUM)))
+        self.assertFalse(_has_getitems(range(SAMPLE_NUM)))
+        self.assertTrue(_has_getitems(Subset(range(SAMPLE_NUM), [0, 1])))
+
+
+class TestDataLoaderGetitems(unittest.TestCase):
+    def run_main(self, dataset, num_workers, sign=1):
+        loader = DataLoader(
+            dataset,
+            batch_size=BATCH_SIZE,
+            shuffle=True,
+            num_workers=num_workers,
+        )
+        labels = []
+        for image, label in loader:
+            self.assertEqual(image.shape, [BATCH_SIZE, IMAGE_SIZE])
+            self.assertEqual(label.shape, [BATCH_SIZE, 1])
+            expected = dataset.images[label.numpy().flatten()]
+            np.testing.assert_array_equal(image.numpy(), sign * expected)
+            labels.extend(label.numpy().flatten().tolist())
+        self.assertEqual(sorted(labels), list(range(SAMPLE_NUM)))
+
+    def test_single_process(self):
+        dataset = ArrayDataset(SAMPLE_NUM)
+        self.run_main(dataset, 0)
+        self.assertEqual(dataset.getitems_calls, SAMPLE_NUM // BATCH_SIZE)
+
+    def test_multi_process(self):
+        # DataLoader with multi-process mode is not supported on MacOs and Windows currently
+        if sys.platform != 'darwin' and sys.platform != 'win32':
+            self.run_main(ArrayDataset(SAMPLE_NUM), 2)
+
+    def test_getitem_overridden(self):
+        dataset = NegativeArrayDataset(SAMPLE_NUM)
+        self.run_main(dataset, 0, sign=-1)
+        self.assertEqual(dataset.getitems_calls, 0)
+
+
+class TestSubsetGetitems(unittest.TestCase):
+    def test_main(self):
+        dataset = ArrayDataset(SAMPLE_NUM)
+        subset = Subset(dataset, indices=[3, 1, 4, 1, 5])
+        samples = subset.__getitems__([0, 2, 4])
+        self.assertEqual(dataset.getitems_calls, 1)
+        self.assertEqual([int(s[1]) for s in samples], [3, 4, 5])
+
+
+class TestTensorDatasetGetitems(unittest.TestCase):
+    def test_main(self):
+        input_np = np.random.random([16, 3, 4]).astype('float32')
+        label_np = np.random.random([16, 1]).astype('int32')
+        dataset = TensorDataset(
+            [paddle.to_tensor(input_np), paddle.to_tensor(label_np)]
+        )
+        indices = [5, 0, 9]
+        samples = dataset.__getitems__(indices)
+        self.assertEqual(len(samples), len(indices))
+        for idx, (input, label) in zip(indices, samples):
+            np.testing.assert_array_equal(input.numpy(), input_np[idx])
+            np.testing.assert_array_equal(label.numpy(), label_np[idx])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+from paddle.io import (
+    DataLoader,
+    Dataset,
+    DistributedBatchSampler,
+    IterableDataset,
+)
+
+SAMPLE_NUM = 22
+BATCH_SIZE = 4
+EPOCH_NUM = 3
+
+
+class StatefulDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+        self.fetch_count = 0
+
+    def __getitem__(self, idx):
+        # fetch_count is increased in each worker process separately
+        self.fetch_count += 1
+        return np.array([idx, os.getpid(), self.fetch_count], dtype='int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class RangeIterableDataset(IterableDataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __iter__(self):
+        for i in range(self.sample_num):
+            yield np.array([i], dtype='int64')
+
+
+@unittest.skipIf(
+    sys.platform == 'darwin' or sys.platform == 'win32',
+    "multi-process DataLoader is not supported on MacOS and Windows",
+)
+class TestPersistentWorkers(unittest.TestCase):
+    def test_workers_alive(self):
+        loader = DataLoader(
+            StatefulDataset(SAMPLE_NUM),
+            batch_size=BATCH_SIZE,
+            num_workers=2,
+            persistent_workers=True,
+        )
+        worker_pids = None
+        max_count = {}
+        for _ in range(EPOCH_NUM):
+            iterator = iter(loader)
+            pids = {w.pid for w in iterator._workers}
+            if worker_pids is None:
+                worker_pids = pids
+            self.assertEqual(pids, worker_pids)
+
+            indices = []
+            for data in iterator:
+                data = data.numpy()
+                indices.extend(data[:, 0].tolist())
+                for pid, count in data[:, 1:].tolist():
+                    self.assertIn(pid, worker_pids)
+                    # dataset objects in workers are not recreated
+                    self.assertGreater(count, max_count.get(pid, 0))
+                    max_count[pid] = count
+            self.assertEqual(indices, list(range(SAMPLE_NUM)))
+        self.assertIs(iter(loader), iterator)
+
+    def test_break(self):
+        loader = DataLoader(
+            StatefulDataset(SAMPLE_NUM),
+            batch_size=BATCH_SIZE,
+            num_workers=2,
+            persistent_workers=True,
+        )
+        for data in loader:
+            break
+        indices = []
+        for data in loader:
+            indices.extend(data.numpy()[:, 0].tolist())
+        self.assertEqual(indices, list(range(SAMPLE_NUM)))
+
+    def test_set_epoch(self):
+        def run(persistent_workers):
+            dataset = StatefulDataset(SAMPLE_NUM)
+            batch_sampler = DistributedBatchSampler(
+                dataset, batch_size=BATCH_SIZE, shuffle=True
+            )
+            loader = DataLoader(
+                dataset,
+                batch_sampler=batch_sampler,
+                num_workers=2,
+                persistent_workers=persistent_workers,
+            )
+            orders = []
+            for epoch in range(EPOCH_NUM):
+                batch_sampler.set_epoch(epoch)
+                order = []
+                for data in loader:
+                    order.extend(data.numpy()[:, 0].tolist())
+                orders.append(order)
+            return orders
+
+        orders = run(True)
+        self.assertEqual(orders, run(False))
+        self.assertNotEqual(orders[0], orders[1])
+
+    def test_iterable_dataset(self):
+        loader = DataLoader(
+            RangeIterableDataset(SAMPLE_NUM),
+            batch_size=BATCH_SIZE,
+            num_workers=1,
+            drop_last=False,
+            persistent_workers=True,
+        )
+        for _ in range(EPOCH_NUM):
+            values = []
+            for data in loader:
+                values.extend(data.numpy().flatten().tolist())
+            # the last incomplete batch should not be dropped in any epoch
+            self.assertEqual(values, list(range(SAMPLE_NUM)))
+
+
+if __name__ == '__main__':
+    unittest.main()
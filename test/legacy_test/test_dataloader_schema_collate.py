@@ -0,0 +1,121 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset, SchemaCollateFn
+from paddle.io.dataloader.collate import default_collate_fn
+
+IMAGE_SIZE = 8
+SAMPLE_NUM = 20
+BATCH_SIZE = 8
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        np.random.seed(idx)
+        image = np.random.random([3, IMAGE_SIZE]).astype('float32')
+        return {
+            'image': image,
+            'label': idx,
+            'name': str(idx),
+            'extra': [image[0], float(idx)],
+        }
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestSchemaCollateFn(unittest.TestCase):
+    def setUp(self):
+        self.num_buffers = 0
+        self.dataset = RandomDataset(SAMPLE_NUM)
+
+    def get_batch(self, start, end):
+        return [self.dataset[i] for i in range(start, end)]
+
+    def check_same(self, out, expected):
+        self.assertEqual(out.keys(), expected.keys())
+        self.assertEqual(out['image'].dtype, expected['image'].dtype)
+        np.testing.assert_array_equal(out['image'], expected['image'])
+        np.testing.assert_array_equal(out['label'], expected['label'])
+        self.assertEqual(out['name'], expected['name'])
+        self.assertEqual(len(out['extra']), 2)
+        for o, e in zip(out['extra'], expected['extra']):
+            np.testing.assert_array_equal(o, e)
+
+    def test_same_as_default(self):
+        collate_fn = SchemaCollateFn(num_buffers=self.num_buffers)
+        for start in range(0, SAMPLE_NUM, BATCH_SIZE):
+            end = min(start + BATCH_SIZE, SAMPLE_NUM)
+            batch = self.get_batch(start, end)
+            self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+    def test_shape_mismatch_fallback(self):
+        collate_fn = SchemaCollateFn(num_buffers=self.num_buffers)
+        batch = self.get_batch(0, BATCH_SIZE)
+        collate_fn(batch)
+        for sample in batch:
+            sample['image'] = np.zeros([2, IMAGE_SIZE], dtype='float64')
+        self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+    def test_tensor_field(self):
+        collate_fn = SchemaCollateFn(num_buffers=self.num_buffers)
+        batch = [paddle.full([2, 3], i, dtype='float32') for i in range(4)]
+        out = collate_fn(batch)
+        np.testing.assert_array_equal(
+            out.numpy(), default_collate_fn(batch).numpy()
+        )
+
+    def test_dataloader(self):
+        loader = DataLoader(
+            self.dataset,
+            batch_size=BATCH_SIZE,
+            collate_fn=SchemaCollateFn(num_buffers=self.num_buffers),
+        )
+        for i, data in enumerate(loader):
+            expected = default_collate_fn(
+                self.get_batch(
+                    i * BATCH_SIZE, min((i + 1) * BATCH_SIZE, SAMPLE_NUM)
+                )
+            )
+            np.testing.assert_array_equal(
+                data['image'].numpy(), expected['image']
+            )
+            np.testing.assert_array_equal(
+                data['label'].numpy(), expected['label']
+            )
+
+
+class TestSchemaCollateFnRecycleBuffers(TestSchemaCollateFn):
+    def setUp(self):
+        self.num_buffers = 2
+        self.dataset = RandomDataset(SAMPLE_NUM)
+
+    def test_buffer_recycled(self):
+        collate_fn = SchemaCollateFn(num_buffers=self.num_buffers)
+        batch = self.get_batch(0, BATCH_SIZE)
+        outs = [collate_fn(batch)['image'] for _ in range(3)]
+        self.assertFalse(np.shares_memory(outs[0], outs[1]))
+        self.assertTrue(np.shares_memory(outs[0], outs[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
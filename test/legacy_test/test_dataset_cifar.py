@@ -121,5 +121,22 @@ class TestCifar100Test(unittest.TestCase):
             cifar = Cifar100(mode='test', backend=1)
 
 
+class TestCifar10Cache(unittest.TestCase):
+    def test_main(self):
+        cifar = Cifar10(mode='test', backend='cv2')
+        # the first construction builds the cache, the second maps it
+        for _ in range(2):
+            cached = Cifar10(mode='test', backend='cv2', use_cache=True)
+            self.assertTrue(len(cached) == len(cifar))
+
+            indices = np.random.randint(0, len(cifar), [8]).tolist()
+            for idx, (data, label) in zip(
+                indices, cached.__getitems__(indices)
+            ):
+                expected_data, expected_label = cifar[idx]
+                np.testing.assert_array_equal(data, expected_data)
+                self.assertEqual(int(label), int(expected_label))
+
+
 if __name__ == '__main__':
     unittest.main()
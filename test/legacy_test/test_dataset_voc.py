@@ -86,5 +86,20 @@ class TestVOC2012Test(unittest.TestCase):
             voc2012 = VOC2012(mode='test', backend=1)
 
 
+class TestVOC2012Cache(unittest.TestCase):
+    def test_main(self):
+        voc2012 = VOC2012(mode='train', backend='cv2')
+        # the first construction builds the cache, the second maps it
+        for _ in range(2):
+            cached = VOC2012(mode='train', backend='cv2', use_cache=True)
+            self.assertTrue(len(cached) == len(voc2012))
+
+            for idx in range(len(cached)):
+                image, label = cached[idx]
+                expected_image, expected_label = voc2012[idx]
+                np.testing.assert_array_equal(image, expected_image)
+                np.testing.assert_array_equal(label, expected_label)
+
+
 if __name__ == '__main__':
     unittest.main()
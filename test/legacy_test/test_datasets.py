@@ -16,6 +16,7 @@ import os
 import shutil
 import tempfile
 import unittest
+from unittest import mock
 
 import cv2
 import numpy as np
@@ -85,6 +86,52 @@ class TestFolderDatasets(unittest.TestCase):
         for _ in loader:
             pass
 
+    def test_num_workers(self):
+        dataset_folder = DatasetFolder(self.data_dir)
+        for num_workers in [1, 4]:
+            dataset = DatasetFolder(self.data_dir, num_workers=num_workers)
+            self.assertEqual(dataset.samples, dataset_folder.samples)
+
+        loader = ImageFolder(self.data_dir)
+        for num_workers in [1, 4]:
+            dataset = ImageFolder(self.data_dir, num_workers=num_workers)
+            self.assertEqual(dataset.samples, loader.samples)
+
+    def test_cache(self):
+        # write the index files into a temporary directory instead of
+        # DATA_HOME
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch(
+            'paddle.vision.datasets.folder.DATA_HOME', cache_dir.name
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        for _ in range(2):
+            dataset_folder = DatasetFolder(self.data_dir, use_cache=True)
+            assert len(dataset_folder) == 4
+            loader = ImageFolder(self.data_dir, use_cache=True)
+            assert len(loader) == 4
+
+        # adding a file modifies its directory, which invalidates the cache
+        sub_dir = os.path.join(self.data_dir, 'class_0', 'sub_dir')
+        os.makedirs(sub_dir)
+        fake_img = (np.random.random((32, 32, 3)) * 255).astype('uint8')
+        cv2.imwrite(os.path.join(sub_dir, 'new.jpg'), fake_img)
+
+        dataset_folder = DatasetFolder(self.data_dir, use_cache=True)
+        self.assertEqual(
+            dataset_folder.samples, DatasetFolder(self.data_dir).samples
+        )
+        assert len(dataset_folder) == 5
+        loader = ImageFolder(self.data_dir, use_cache=True)
+        self.assertEqual(loader.samples, ImageFolder(self.data_dir).samples)
+        assert len(loader) == 5
+        self.assertTrue(
+            os.listdir(os.path.join(cache_dir.name, 'folder_index'))
+        )
+
     def test_errors(self):
         with self.assertRaises(RuntimeError):
             ImageFolder(self.empty_dir)
@@ -110,6 +157,21 @@ class TestMNISTTest(unittest.TestCase):
         self.assertTrue(0 <= int(label) <= 9)
 
 
+class TestMNISTCache(unittest.TestCase):
+    def test_main(self):
+        mnist = MNIST(mode='test', backend='cv2')
+        # the first construction builds the cache, the second maps it
+        for _ in range(2):
+            cached = MNIST(mode='test', backend='cv2', use_cache=True)
+            self.assertTrue(len(cached) == len(mnist))
+
+            i = np.random.randint(0, len(mnist) - 1)
+            image, label = cached[i]
+            expected_image, expected_label = mnist[i]
+            np.testing.assert_array_equal(image, expected_image)
+            np.testing.assert_array_equal(label, expected_label)
+
+
 class TestMNISTTrain(unittest.TestCase):
     def test_main(self):
         transform = T.Transpose()
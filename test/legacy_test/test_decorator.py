@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import functools
 import sys
 import time
 import unittest
 
+import numpy as np
+
 import paddle.reader
 
 __all__ = []
@@ -129,6 +132,78 @@ class TestShuffle(unittest.TestCase):
             self.assertEqual(total, 10)
 
 
+class TestStreamShuffle(unittest.TestCase):
+    def test_shuffle(self):
+        def reader():
+            for i in range(100):
+                yield np.full([2, 3], i, dtype='float32'), i
+
+        for arena in [None, 'numpy', 'shared_memory']:
+            if arena == 'shared_memory' and (
+                sys.platform == 'win32' or sys.version_info < (3, 8)
+            ):
+                continue
+            for buf_size in [1, 10, 1000]:
+                s = paddle.reader.stream_shuffle(
+                    reader, buf_size, arena=arena, seed=2023
+                )
+                results = list(s())
+                labels = [label for _, label in results]
+                self.assertEqual(sorted(labels), list(range(100)))
+                if buf_size == 1:
+                    self.assertEqual(labels, list(range(100)))
+                for image, label in results:
+                    self.assertIsInstance(label, int)
+                    np.testing.assert_array_equal(
+                        image, np.full([2, 3], label, dtype='float32')
+                    )
+                # the same seed gives the same order
+                self.assertEqual(
+                    [label for _, label in s()],
+                    labels,
+                )
+
+    def test_interleave(self):
+        def shard(index):
+            def reader():
+                for i in range(10):
+                    yield index * 10 + i
+
+            return reader
+
+        s = paddle.reader.stream_shuffle(
+            [shard(i) for i in range(5)], 4, cycle_length=2
+        )
+        results = list(s())
+        self.assertEqual(sorted(results), list(range(50)))
+
+    def test_namedtuple(self):
+        Sample = collections.namedtuple('Sample', ['image', 'label'])
+
+        def reader():
+            for i in range(10):
+                yield Sample(np.full([2], i, dtype='float32'), i)
+
+        for arena in [None, 'numpy']:
+            s = paddle.reader.stream_shuffle(reader, 4, arena=arena)
+            results = list(s())
+            self.assertEqual(sorted(r.label for r in results), list(range(10)))
+            for r in results:
+                self.assertIsInstance(r, Sample)
+                np.testing.assert_array_equal(
+                    r.image, np.full([2], r.label, dtype='float32')
+                )
+
+    def test_arena_mismatch(self):
+        def reader():
+            yield np.zeros([2])
+            yield np.zeros([3])
+
+        s = paddle.reader.stream_shuffle(reader, 4, arena='numpy')
+        with self.assertRaises(ValueError):
+            list(s())
+
+
 class TestXmap(unittest.TestCase):
     def test_xmap(self):
         def mapper(x):
@@ -152,6 +227,56 @@ class TestXmap(unittest.TestCase):
                         for idx, e in enumerate(result):
                             self.assertEqual(e, mapper(idx))
 
+    def test_xmap_chunk(self):
+        def mapper(x):
+            # the later samples are mapped faster
+            time.sleep(0.001 * (10 - x))
+            return x * 2
+
+        for order in (True, False):
+            for chunk_size in (1, 3, 16):
+                reader = paddle.reader.xmap_readers(
+                    mapper,
+                    reader_creator_10(0),
+                    4,
+                    2,
+                    order,
+                    chunk_size=chunk_size,
+                )
+                result = list(reader())
+                if not order:
+                    result.sort()
+                self.assertEqual(result, [i * 2 for i in range(10)])
+
+    def test_xmap_process(self):
+        if sys.platform == 'win32':
+            return
+
+        def mapper(x):
+            return x + 1
+
+        for order in (True, False):
+            reader = paddle.reader.xmap_readers(
+                mapper, reader_creator_10(0), 4, 4, order, use_process=True
+            )
+            for n in range(2):
+                result = list(reader())
+                if not order:
+                    result.sort()
+                self.assertEqual(result, [i + 1 for i in range(10)])
+
+    def test_xmap_exception(self):
+        def mapper(x):
+            if x == 5:
+                raise ValueError("invalid sample")
+            return x
+
+        reader = paddle.reader.xmap_readers(
+            mapper, reader_creator_10(0), 2, 2, True
+        )
+        with self.assertRaises(ValueError):
+            list(reader())
+
 
 class TestMultiProcessReader(unittest.TestCase):
     def setup(self):
@@ -182,6 +307,45 @@ class TestMultiProcessReader(unittest.TestCase):
             self.reader_test(use_pipe=False)
             self.reader_test(use_pipe=True)
 
+    @unittest.skipIf(
+        sys.version_info < (3, 8), "shared memory requires Python 3.8"
+    )
+    def test_shared_memory(self):
+        if sys.platform == 'win32':
+            return
+        self.setup()
+        results = list(
+            paddle.reader.multiprocess_reader(
+                [self.reader0, self.reader1, self.reader2],
+                use_shared_memory=True,
+            )()
+        )
+        self.assertEqual(sorted(self.samples), sorted(results))
+
+        def image_reader(index):
+            for i in range(index, 100, 2):
+                yield np.full([i + 1, 8], i, dtype='float32'), i
+
+        # the small segments are filled by a few samples, and the samples
+        # larger than a segment are sent by pipe
+        for size in [64 * 1024 * 1024, 4096, 1024]:
+            results = list(
+                paddle.reader.multiprocess_reader(
+                    [
+                        functools.partial(image_reader, 0),
+                        functools.partial(image_reader, 1),
+                    ],
+                    use_shared_memory=True,
+                    shared_memory_size=size,
+                )()
+            )
+            self.assertEqual(
+                sorted(label for _, label in results), list(range(100))
+            )
+            for image, label in results:
+                self.assertEqual(image.shape, (label + 1, 8))
+                np.testing.assert_array_equal(image, label)
+
 
 if __name__ == '__main__':
     unittest.main()
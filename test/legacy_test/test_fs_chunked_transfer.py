@@ -0,0 +1,296 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from test_hdfs_client_cache import FAKE_HADOOP
+
+from paddle.base.incubate.checkpoint.checkpoint_saver import (
+    CheckpointSaver,
+    SerializableBase,
+)
+from paddle.distributed.fleet.utils.fs import (
+    FSChecksumError,
+    HDFSClient,
+    LocalFS,
+)
+
+CHUNK_SIZE = 1000
+
+
+def make_data(size, seed=0):
+    return bytes((i * 7 + seed) % 251 for i in range(size))
+
+
+def write_file(path, size, seed=0):
+    data = make_data(size, seed)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return data
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class TestLocalFSChunkedTransfer(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.temp_dir.name, 'src')
+        self.dst = os.path.join(self.temp_dir.name, 'dst')
+        self.fs = LocalFS()
+        os.makedirs(self.src)
+        self.large = write_file(os.path.join(self.src, 'large'), 10500)
+        self.small = write_file(os.path.join(self.src, 'small'), 100)
+        self.parts_path = os.path.join(self.dst, 'large.paddle_parts')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        self.fs.upload(self.src, self.dst, chunk_size=CHUNK_SIZE)
+        self.assertEqual(
+            sorted(os.listdir(self.dst)), ['large.paddle_parts', 'small']
+        )
+        # 11 parts and the MANIFEST
+        self.assertEqual(len(os.listdir(self.parts_path)), 12)
+
+        local_path = os.path.join(self.temp_dir.name, 'local')
+        self.fs.download(self.dst, local_path, num_threads=4)
+        self.assertEqual(sorted(os.listdir(local_path)), ['large', 'small'])
+        self.assertEqual(
+            read_file(os.path.join(local_path, 'large')), self.large
+        )
+        self.assertEqual(
+            read_file(os.path.join(local_path, 'small')), self.small
+        )
+
+        single_path = os.path.join(self.temp_dir.name, 'single')
+        self.fs.download(os.path.join(self.dst, 'large'), single_path)
+        self.assertEqual(read_file(single_path), self.large)
+
+    def test_reupload(self):
+        src = os.path.join(self.temp_dir.name, 'x_src')
+        os.makedirs(src)
+        local_path = os.path.join(self.temp_dir.name, 'local')
+        # x is uploaded in parts, as a whole, and in parts again
+        for size in (5000, 3, 5000):
+            x = write_file(os.path.join(src, 'x'), size, seed=size)
+            self.fs.upload(src, self.dst, chunk_size=CHUNK_SIZE)
+            self.assertEqual(len(os.listdir(self.dst)), 1)
+            self.fs.download(self.dst, local_path)
+            self.assertEqual(read_file(os.path.join(local_path, 'x')), x)
+
+    def test_sub_dir(self):
+        os.makedirs(os.path.join(self.src, 'sub', 'inner'))
+        sub = write_file(os.path.join(self.src, 'sub', 'inner', 'f'), 10)
+        # the sub directory is merged into the existing one
+        for _ in range(2):
+            self.fs.upload(self.src, self.dst, chunk_size=CHUNK_SIZE)
+        local_path = os.path.join(self.temp_dir.name, 'local')
+        for _ in range(2):
+            self.fs.download(self.dst, local_path)
+        self.assertEqual(
+            read_file(os.path.join(local_path, 'sub', 'inner', 'f')), sub
+        )
+
+    def test_resume_upload(self):
+        write_part = LocalFS._write_part
+        calls = []
+        interrupted = []
+
+        def failing_write_part(fs, local_path, offset, length, fs_path):
+            calls.append(offset)
+            if len(calls) == 4 and not interrupted:
+                interrupted.append(offset)
+                raise OSError("interrupted")
+            write_part(fs, local_path, offset, length, fs_path)
+
+        with mock.patch.object(LocalFS, '_write_part', failing_write_part):
+            with self.assertRaises(OSError):
+                self.fs.upload(
+                    self.src, self.dst, chunk_size=CHUNK_SIZE, num_threads=1
+                )
+            self.assertNotIn('MANIFEST', os.listdir(self.parts_path))
+            calls.clear()
+            self.fs.upload(
+                self.src, self.dst, chunk_size=CHUNK_SIZE, num_threads=1
+            )
+        # the 3 uploaded parts are skipped, and the MANIFEST is written last
+        self.assertEqual(calls[:-1], list(range(3000, 11000, CHUNK_SIZE)))
+        self.assertEqual(len(os.listdir(self.parts_path)), 12)
+
+        # only the changed part is uploaded again
+        large = bytearray(self.large)
+        large[5500] = (large[5500] + 1) % 251
+        with open(os.path.join(self.src, 'large'), 'wb') as f:
+            f.write(large)
+        with mock.patch.object(LocalFS, '_write_part', failing_write_part):
+            calls.clear()
+            self.fs.upload(self.src, self.dst, chunk_size=CHUNK_SIZE)
+        self.assertEqual(calls[:-1], [5000])
+        self.assertEqual(len(os.listdir(self.parts_path)), 12)
+
+        local_path = os.path.join(self.temp_dir.name, 'large')
+        self.fs.download(os.path.join(self.dst, 'large'), local_path)
+        self.assertEqual(read_file(local_path), bytes(large))
+
+    def test_resume_download(self):
+        self.fs.upload(self.src, self.dst, chunk_size=CHUNK_SIZE)
+        local_path = os.path.join(self.temp_dir.name, 'large')
+        with open(local_path + '.partial', 'wb') as f:
+            f.write(self.large[:4500])
+
+        read_part = LocalFS._read_part
+        offsets = []
+
+        def counted_read_part(fs, fs_path, local_path, offset):
+            offsets.append(offset)
+            read_part(fs, fs_path, local_path, offset)
+
+        with mock.patch.object(LocalFS, '_read_part', counted_read_part):
+            self.fs.download(
+                os.path.join(self.dst, 'large'), local_path, num_threads=1
+            )
+        self.assertEqual(offsets, list(range(4000, 11000, CHUNK_SIZE)))
+        self.assertEqual(read_file(local_path), self.large)
+        self.assertFalse(os.path.exists(local_path + '.partial'))
+
+    def test_checksum(self):
+        self.fs.upload(self.src, self.dst, chunk_size=CHUNK_SIZE)
+        for part in os.listdir(self.parts_path):
+            if part.startswith('part-00001.'):
+                with open(os.path.join(self.parts_path, part), 'r+b') as f:
+                    f.write(b'\xff')
+        local_path = os.path.join(self.temp_dir.name, 'large')
+        with self.assertRaises(FSChecksumError):
+            self.fs.download(os.path.join(self.dst, 'large'), local_path)
+        self.assertFalse(os.path.exists(local_path))
+
+
+class BigFile(SerializableBase):
+    def __init__(self, size):
+        self.size = size
+        self.data = None
+
+    def serialize(self, path):
+        write_file(os.path.join(path, 'big'), self.size, seed=1)
+        write_file(os.path.join(path, 'meta'), 10, seed=2)
+
+    def deserialize(self, path):
+        self.data = read_file(os.path.join(path, 'big'))
+        self.meta = read_file(os.path.join(path, 'meta'))
+
+
+class TestHDFSClientChunkedTransfer(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        home = self.temp_dir.name
+        os.makedirs(os.path.join(home, 'bin'))
+        hadoop = os.path.join(home, 'bin', 'hadoop')
+        with open(hadoop, 'w') as f:
+            f.write(FAKE_HADOOP.format(python=sys.executable))
+        os.chmod(hadoop, 0o755)
+        self.root = os.path.join(home, 'hdfs')
+        self.log = os.path.join(home, 'commands.log')
+        os.makedirs(os.path.join(self.root, 'ckpt'))
+        patcher = mock.patch.dict(
+            os.environ, {'FAKE_HDFS_ROOT': self.root, 'FAKE_HDFS_LOG': self.log}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.fs = HDFSClient(
+            home,
+            {"hadoop.job.ugi": "hello,hello123"},
+            time_out=5 * 1000,
+            sleep_inter=100,
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def commands(self, name):
+        with open(self.log) as f:
+            return [l for l in f if name in l.split()]
+
+    def test_round_trip(self):
+        src = os.path.join(self.temp_dir.name, 'src')
+        os.makedirs(src)
+        large = write_file(os.path.join(src, 'large'), 5500)
+        small = write_file(os.path.join(src, 'small'), 100)
+        self.fs.upload(src, '/ckpt', chunk_size=CHUNK_SIZE, num_threads=4)
+        parts_path = os.path.join(self.root, 'ckpt', 'large.paddle_parts')
+        self.assertEqual(len(os.listdir(parts_path)), 7)
+        # 6 parts and the MANIFEST
+        self.assertEqual(len(self.commands('-put')), 8)
+
+        dst = os.path.join(self.temp_dir.name, 'dst')
+        self.fs.download('/ckpt', dst, num_threads=4)
+        self.assertEqual(read_file(os.path.join(dst, 'large')), large)
+        self.assertEqual(read_file(os.path.join(dst, 'small')), small)
+
+        # the upload is skipped if all the parts are uploaded
+        num_puts = len(self.commands('-put'))
+        self.fs.upload(
+            os.path.join(src, 'large'), '/ckpt', chunk_size=CHUNK_SIZE
+        )
+        self.assertEqual(len(self.commands('-put')), num_puts)
+
+    def test_reupload(self):
+        src = os.path.join(self.temp_dir.name, 'src')
+        os.makedirs(src)
+        ckpt = os.path.join(self.root, 'ckpt')
+        # x is uploaded in parts, and then as a whole
+        for size in (5000, 3):
+            x = write_file(os.path.join(src, 'x'), size, seed=size)
+            self.fs.upload(src, '/ckpt', chunk_size=CHUNK_SIZE)
+            dst = os.path.join(self.temp_dir.name, f'dst_{size}')
+            os.makedirs(dst)
+            self.fs.download('/ckpt', dst)
+            self.assertEqual(read_file(os.path.join(dst, 'x')), x)
+        self.assertEqual(os.listdir(ckpt), ['x'])
+
+        # the parts replace the file uploaded as a whole
+        write_file(os.path.join(src, 'x'), 5000)
+        self.fs.upload(os.path.join(src, 'x'), '/ckpt/x', chunk_size=CHUNK_SIZE)
+        self.assertEqual(os.listdir(ckpt), ['x.paddle_parts'])
+
+    def test_checkpoint_saver(self):
+        saver = CheckpointSaver(self.fs, chunk_size=CHUNK_SIZE)
+        cache_path = os.path.join(self.temp_dir.name, 'cache')
+        saved = BigFile(3500)
+        real_path, no = saver.save_checkpoint(
+            '/ckpt', [saved], local_cache_path=cache_path
+        )
+        self.assertEqual(no, 0)
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.root, real_path.lstrip('/')))),
+            ['big.paddle_parts', 'meta'],
+        )
+
+        loaded = BigFile(3500)
+        saver.load_checkpoint(
+            '/ckpt', [loaded], trainer_id=0, local_cache_path=cache_path
+        )
+        self.assertEqual(loaded.data, make_data(3500, seed=1))
+        self.assertEqual(loaded.meta, make_data(10, seed=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
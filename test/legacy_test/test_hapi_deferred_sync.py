@@ -0,0 +1,122 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle import Model
+from paddle.hapi.callbacks import Callback
+from paddle.io import Dataset
+from paddle.metric import Accuracy
+from paddle.static import InputSpec
+
+
+class RandomDataset(Dataset):
+    def __init__(self, num_samples=64):
+        np.random.seed(2023)
+        self.images = np.random.random([num_samples, 8]).astype('float32')
+        self.labels = np.random.randint(0, 4, [num_samples, 1]).astype('int64')
+
+    def __getitem__(self, idx):
+        return self.images[idx], self.labels[idx]
+
+    def __len__(self):
+        return len(self.images)
+
+
+class RecordLogs(Callback):
+    def __init__(self):
+        super().__init__()
+        self.train_logs = []
+
+    def on_train_batch_end(self, step, logs=None):
+        self.train_logs.append((logs['step'], logs['loss'], logs['acc']))
+
+
+class TestDeferredSync(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.dataset = RandomDataset()
+
+    def get_model(self):
+        paddle.seed(2023)
+        net = paddle.nn.Sequential(
+            paddle.nn.Linear(8, 16), paddle.nn.ReLU(), paddle.nn.Linear(16, 4)
+        )
+        model = Model(
+            net,
+            InputSpec([None, 8], 'float32', 'x'),
+            InputSpec([None, 1], 'int64', 'y'),
+        )
+        optim = paddle.optimizer.SGD(
+            learning_rate=0.1, parameters=model.parameters()
+        )
+        model.prepare(optim, paddle.nn.CrossEntropyLoss(), Accuracy())
+        return model
+
+    def run_fit(self, deferred_sync, callbacks=None):
+        model = self.get_model()
+        model.fit(
+            self.dataset,
+            epochs=2,
+            batch_size=8,
+            shuffle=False,
+            log_freq=3,
+            verbose=0,
+            callbacks=callbacks,
+            deferred_sync=deferred_sync,
+        )
+        result = model.evaluate(
+            self.dataset,
+            batch_size=8,
+            log_freq=3,
+            verbose=0,
+            deferred_sync=deferred_sync,
+        )
+        return model, result
+
+    def test_same_result(self):
+        model, result = self.run_fit(False)
+        deferred_model, deferred_result = self.run_fit(True)
+
+        self.assertEqual(sorted(result.keys()), sorted(deferred_result.keys()))
+        np.testing.assert_allclose(result['loss'], deferred_result['loss'])
+        self.assertAlmostEqual(result['acc'], deferred_result['acc'])
+        for name, param in model.network.state_dict().items():
+            np.testing.assert_allclose(
+                param.numpy(), deferred_model.network.state_dict()[name].numpy()
+            )
+        self.assertFalse(deferred_model._adapter._deferred_sync)
+
+    def test_read_logs_in_callback(self):
+        record = RecordLogs()
+        self.run_fit(False, callbacks=[record])
+        deferred_record = RecordLogs()
+        self.run_fit(True, callbacks=[deferred_record])
+
+        self.assertEqual(
+            len(record.train_logs), len(deferred_record.train_logs)
+        )
+        for expected, actual in zip(
+            record.train_logs, deferred_record.train_logs
+        ):
+            self.assertEqual(expected[0], actual[0])
+            np.testing.assert_allclose(expected[1], actual[1])
+            self.assertAlmostEqual(expected[2], actual[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
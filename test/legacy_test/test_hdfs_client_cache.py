@@ -0,0 +1,212 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from paddle.distributed.fleet.utils.fs import HDFSClient
+
+# A stand-in of `hadoop fs`, which runs the commands on a local directory,
+# and logs every command to count the started hadoop processes.
+FAKE_HADOOP = '''#!{python}
+import os
+import shutil
+import sys
+import time
+
+root = os.environ['FAKE_HDFS_ROOT']
+with open(os.environ['FAKE_HDFS_LOG'], 'a') as f:
+    f.write(' '.join(sys.argv[1:]) + '\\n')
+
+args = [a for a in sys.argv[2:] if not a.startswith('-D')]
+cmd, args = args[0], args[1:]
+
+
+def local(path):
+    return os.path.join(root, path.lstrip('/'))
+
+
+def merge(src, dst):
+    os.makedirs(dst, exist_ok=True)
+    for name in os.listdir(src):
+        s, d = os.path.join(src, name), os.path.join(dst, name)
+        merge(s, d) if os.path.isdir(s) else shutil.copy(s, d)
+
+
+def entry(path):
+    p = local(path)
+    perm = 'drwxr-xr-x' if os.path.isdir(p) else '-rw-r--r--'
+    size = 0 if os.path.isdir(p) else os.path.getsize(p)
+    date = time.strftime('%Y-%m-%d %H:%M', time.localtime(os.path.getmtime(p)))
+    return f'{{perm}}   - user group {{size}} {{date}} {{path}}'
+
+
+ret = 0
+if cmd == '-test':
+    p = local(args[1])
+    ok = os.path.isdir(p) if args[0] == '-d' else os.path.exists(p)
+    ret = 0 if ok else 1
+elif cmd == '-ls':
+    only_self = args[0] == '-d'
+    for path in args[1:] if only_self else args:
+        if not os.path.exists(local(path)):
+            sys.stderr.write(f"ls: `{{path}}': No such file or directory\\n")
+            ret = 1
+        elif only_self or not os.path.isdir(local(path)):
+            print(entry(path))
+        else:
+            names = sorted(os.listdir(local(path)))
+            print(f'Found {{len(names)}} items')
+            for name in names:
+                print(entry(path.rstrip('/') + '/' + name))
+elif cmd == '-mkdir':
+    os.makedirs(local(args[-1]), exist_ok=True)
+elif cmd in ('-rmr', '-rm'):
+    p = local(args[0])
+    shutil.rmtree(p) if os.path.isdir(p) else os.remove(p)
+elif cmd == '-touchz':
+    open(local(args[0]), 'a').close()
+elif cmd == '-mv':
+    os.rename(local(args[0]), local(args[1]))
+elif cmd == '-put':
+    shutil.copy(args[-2], local(args[-1]))
+elif cmd == '-get':
+    src = local(args[0])
+    if os.path.isdir(src):
+        merge(src, args[1])
+    else:
+        shutil.copy(src, args[1])
+elif cmd == '-cat':
+    print(open(local(args[0])).read())
+else:
+    ret = 255
+sys.exit(ret)
+'''
+
+
+class TestHDFSClientCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        home = self.temp_dir.name
+        os.makedirs(os.path.join(home, 'bin'))
+        hadoop = os.path.join(home, 'bin', 'hadoop')
+        with open(hadoop, 'w') as f:
+            f.write(FAKE_HADOOP.format(python=sys.executable))
+        os.chmod(hadoop, 0o755)
+        self.root = os.path.join(home, 'hdfs')
+        self.log = os.path.join(home, 'commands.log')
+        patcher = mock.patch.dict(
+            os.environ, {'FAKE_HDFS_ROOT': self.root, 'FAKE_HDFS_LOG': self.log}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for i in range(3):
+            os.makedirs(os.path.join(self.root, 'ckpt', f'{i}', 'model'))
+            open(os.path.join(self.root, 'ckpt', f'{i}', 'meta'), 'w').close()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def client(self, cache_ttl):
+        return HDFSClient(
+            self.temp_dir.name,
+            {"hadoop.job.ugi": "hello,hello123"},
+            time_out=5 * 1000,
+            sleep_inter=100,
+            cache_ttl=cache_ttl,
+        )
+
+    def num_commands(self):
+        if not os.path.exists(self.log):
+            return 0
+        with open(self.log) as f:
+            return len(f.readlines())
+
+    def test_no_cache(self):
+        fs = self.client(0)
+        for _ in range(2):
+            self.assertTrue(fs.is_exist('/ckpt/0'))
+        self.assertEqual(self.num_commands(), 2)
+        fs.prefetch(['/ckpt/0'])
+        self.assertEqual(self.num_commands(), 2)
+
+    def test_cache(self):
+        fs = self.client(60 * 1000)
+        self.assertEqual(fs.ls_dir('/ckpt'), (['0', '1', '2'], []))
+        num_commands = self.num_commands()
+        # the stats of the listed paths are cached
+        for _ in range(2):
+            self.assertTrue(fs.is_dir('/ckpt/1'))
+            self.assertEqual(fs.list_dirs('/ckpt'), ['0', '1', '2'])
+        self.assertEqual(self.num_commands(), num_commands)
+
+        # the failed test of a missing path is retried once
+        self.assertFalse(fs.is_exist('/ckpt/9'))
+        self.assertFalse(fs.is_exist('/ckpt/9'))
+        self.assertEqual(self.num_commands(), num_commands + 2)
+
+        # the changes made by the client invalidate the cache
+        fs.mkdirs('/ckpt/9')
+        self.assertTrue(fs.is_dir('/ckpt/9'))
+        self.assertEqual(fs.list_dirs('/ckpt'), ['0', '1', '2', '9'])
+        fs.delete('/ckpt/0')
+        self.assertFalse(fs.is_exist('/ckpt/0/meta'))
+        self.assertEqual(fs.list_dirs('/ckpt'), ['1', '2', '9'])
+
+    def test_lookup_during_change(self):
+        fs = self.client(60 * 1000)
+        run_cmd = fs._run_cmd
+
+        def lookup_run_cmd(cmd, *args, **kwargs):
+            # a concurrent lookup made while the command runs
+            if cmd.startswith('rmr '):
+                fs.is_exist('/ckpt/0')
+                fs.list_dirs('/ckpt')
+            return run_cmd(cmd, *args, **kwargs)
+
+        with mock.patch.object(fs, '_run_cmd', lookup_run_cmd):
+            fs.delete('/ckpt/0')
+        self.assertFalse(fs.is_exist('/ckpt/0'))
+        self.assertEqual(fs.list_dirs('/ckpt'), ['1', '2'])
+
+    def test_prefetch(self):
+        fs = self.client(60 * 1000)
+        paths = ['/ckpt/0', '/ckpt/1', '/ckpt/2', '/ckpt/2/meta', '/ckpt/9']
+        fs.prefetch(paths)
+        # one command for the stats, and one for each directory
+        self.assertEqual(self.num_commands(), 4)
+        for i in range(3):
+            self.assertEqual(fs.ls_dir(f'/ckpt/{i}'), (['model'], ['meta']))
+            self.assertTrue(fs.is_file(f'/ckpt/{i}/meta'))
+            self.assertTrue(fs.is_dir(f'/ckpt/{i}/model'))
+        self.assertFalse(fs.is_exist('/ckpt/9'))
+        self.assertFalse(fs.is_dir('/ckpt/2/meta'))
+        self.assertEqual(self.num_commands(), 4)
+
+    def test_ttl(self):
+        fs = self.client(100)
+        self.assertTrue(fs.is_exist('/ckpt/0'))
+        self.assertTrue(fs.is_exist('/ckpt/0'))
+        self.assertEqual(self.num_commands(), 1)
+        time.sleep(0.2)
+        self.assertTrue(fs.is_exist('/ckpt/0'))
+        self.assertEqual(self.num_commands(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
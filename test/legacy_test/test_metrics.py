@@ -356,5 +356,46 @@ class TestAuc(unittest.TestCase):
         self.assertEqual(m.accumulate(), 0.0)
 
 
+class TestMetricMergeState(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2023)
+        self.preds = np.random.random([64, 1])
+        self.labels = np.random.randint(0, 2, [64, 1])
+
+    def check(self, metric_fn, preds):
+        m = metric_fn()
+        m.update(preds, self.labels)
+
+        merged = metric_fn()
+        for i in range(0, 64, 16):
+            part = metric_fn()
+            part.update(preds[i : i + 16], self.labels[i : i + 16])
+            merged.merge_state(part.get_state())
+        self.assertAlmostEqual(merged.accumulate(), m.accumulate())
+
+        on_device = metric_fn(on_device=True)
+        state = on_device.compute(
+            paddle.to_tensor(preds), paddle.to_tensor(self.labels)
+        )
+        on_device.update(state)
+        self.assertAlmostEqual(on_device.accumulate(), m.accumulate())
+
+        tensor_input = metric_fn()
+        tensor_input.update(
+            paddle.to_tensor(preds), paddle.to_tensor(self.labels)
+        )
+        self.assertAlmostEqual(tensor_input.accumulate(), m.accumulate())
+
+    def test_precision(self):
+        self.check(paddle.metric.Precision, self.preds)
+
+    def test_recall(self):
+        self.check(paddle.metric.Recall, self.preds)
+
+    def test_auc(self):
+        preds = np.concatenate([1 - self.preds, self.preds], axis=1)
+        self.check(paddle.metric.Auc, preds)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -14,6 +14,8 @@
 
 import unittest
 
+import numpy as np
+
 from paddle.profiler import statistic_helper
 
 
@@ -130,6 +132,27 @@ class TestStatisticHelper(unittest.TestCase):
         dst = statistic_helper.subtract_ranges(src1, src2)
         self.assertEqual(dst, [(10, 11)])
 
+    def test_array_ranges(self):
+        src1 = np.array([(9, 12), (1, 7), (14, 18), (2, 3)], dtype='int64')
+        src2 = np.array([(10, 13), (3, 8), (15, 19)], dtype='int64')
+        self.assertEqual(statistic_helper.sum_ranges(src1), 14)
+        self.assertEqual(
+            statistic_helper.merge_self_ranges(src1),
+            [(1, 7), (9, 12), (14, 18)],
+        )
+        self.assertEqual(
+            statistic_helper.merge_ranges(src1, src2),
+            [(1, 8), (9, 13), (14, 19)],
+        )
+        self.assertEqual(
+            statistic_helper.intersection_ranges(src1, src2),
+            [(3, 7), (10, 12), (15, 18)],
+        )
+        self.assertEqual(
+            statistic_helper.subtract_ranges(src1, src2),
+            [(1, 3), (9, 10), (14, 15)],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
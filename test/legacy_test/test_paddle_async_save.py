@@ -0,0 +1,184 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import TimeoutError
+from unittest import mock
+
+import numpy as np
+
+import paddle
+from paddle.framework import AsyncSaver
+from paddle.io import Dataset
+from paddle.static import InputSpec
+
+
+class RandomDataset(Dataset):
+    def __init__(self, num_samples):
+        self.num_samples = num_samples
+
+    def __getitem__(self, idx):
+        image = np.random.random([4]).astype('float32')
+        label = np.random.randint(0, 2, [1]).astype('int64')
+        return image, label
+
+    def __len__(self):
+        return self.num_samples
+
+
+class TestAsyncSave(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.layer = paddle.nn.Linear(4, 2)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_snapshot(self):
+        path = os.path.join(self.temp_dir.name, 'linear.pdparams')
+        expected = {k: v.numpy() for k, v in self.layer.state_dict().items()}
+        task = paddle.async_save(self.layer.state_dict(), path)
+        # in-place update after async_save returned should not be saved
+        with paddle.no_grad():
+            self.layer.weight.set_value(paddle.zeros([4, 2]))
+        task.wait()
+        self.assertTrue(task.done())
+
+        loaded = paddle.load(path)
+        for key, value in expected.items():
+            np.testing.assert_array_equal(loaded[key].numpy(), value)
+        self.assertEqual(os.listdir(self.temp_dir.name), ['linear.pdparams'])
+
+    def test_saver(self):
+        saver = AsyncSaver(max_in_flight=1)
+        paths = []
+        for i in range(4):
+            path = os.path.join(self.temp_dir.name, 'sub', f'{i}.pdparams')
+            saver.save(self.layer.state_dict(), path, format='stream')
+            paths.append(path)
+        saver.wait()
+        self.assertEqual(saver.pending(), 0)
+        for path in paths:
+            np.testing.assert_array_equal(
+                paddle.load(path)['bias'].numpy(), self.layer.bias.numpy()
+            )
+
+    def test_sync_other_task(self):
+        path = os.path.join(self.temp_dir.name, 'linear.pdparams')
+        paddle.async_save(self.layer.state_dict(), path)
+        paddle.async_save(
+            self.layer.state_dict(), path + '.bak', sync_other_task=True
+        )
+        paddle.clear_async_save_task_queue()
+        self.assertTrue(os.path.exists(path))
+        self.assertTrue(os.path.exists(path + '.bak'))
+
+    def test_error(self):
+        saver = AsyncSaver()
+        file_path = os.path.join(self.temp_dir.name, 'file')
+        with open(file_path, 'w') as f:
+            f.write('not a directory')
+        # the parent of path is a file, which fails in background
+        task = saver.save(
+            self.layer.state_dict(), os.path.join(file_path, 'a.pdparams')
+        )
+        with self.assertRaises(OSError):
+            task.wait()
+        with self.assertRaises(OSError):
+            saver.wait()
+
+        with self.assertRaises(ValueError):
+            saver.save(self.layer.state_dict(), self.temp_dir.name + '/')
+
+    def test_wait_all(self):
+        saver = AsyncSaver()
+        file_path = os.path.join(self.temp_dir.name, 'file')
+        with open(file_path, 'w') as f:
+            f.write('not a directory')
+        saver.save(
+            self.layer.state_dict(), os.path.join(file_path, 'a.pdparams')
+        )
+        path = os.path.join(self.temp_dir.name, 'b.pdparams')
+        saver.save(self.layer.state_dict(), path)
+        # the saves after the failed one are waited before raising
+        with self.assertRaises(OSError):
+            saver.wait()
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(saver.pending(), 0)
+        # the failure is raised only once
+        saver.wait()
+
+    def test_wait_timeout(self):
+        saver = AsyncSaver()
+        save = saver._save
+        started = threading.Event()
+        resume = threading.Event()
+
+        def blocked_save(*args):
+            started.set()
+            resume.wait()
+            save(*args)
+
+        path = os.path.join(self.temp_dir.name, 'linear.pdparams')
+        with mock.patch.object(saver, '_save', blocked_save):
+            saver.save(self.layer.state_dict(), path)
+            started.wait()
+            with self.assertRaises(TimeoutError):
+                saver.wait(timeout=0.01)
+            # the unfinished save is still tracked
+            self.assertEqual(saver.pending(), 1)
+            resume.set()
+            saver.wait()
+        self.assertEqual(saver.pending(), 0)
+        self.assertTrue(os.path.exists(path))
+
+    def test_model_checkpoint(self):
+        save_dir = os.path.join(self.temp_dir.name, 'checkpoint')
+        net = paddle.nn.Linear(4, 2)
+        model = paddle.Model(
+            net,
+            [InputSpec([None, 4], 'float32', 'x')],
+            [InputSpec([None, 1], 'int64', 'label')],
+        )
+        optim = paddle.optimizer.Adam(0.001, parameters=net.parameters())
+        model.prepare(optim, paddle.nn.CrossEntropyLoss())
+        callback = paddle.callbacks.ModelCheckpoint(
+            save_dir=save_dir, async_save=True
+        )
+        model.fit(
+            RandomDataset(16),
+            batch_size=4,
+            epochs=2,
+            verbose=0,
+            callbacks=[callback],
+        )
+        for prefix in ['0', '1', 'final']:
+            self.assertTrue(
+                os.path.exists(os.path.join(save_dir, prefix + '.pdparams'))
+            )
+            self.assertTrue(
+                os.path.exists(os.path.join(save_dir, prefix + '.pdopt'))
+            )
+        model.load(os.path.join(save_dir, 'final'))
+        np.testing.assert_array_equal(
+            model.network.weight.numpy(), net.weight.numpy()
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
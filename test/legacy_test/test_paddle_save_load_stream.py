@@ -0,0 +1,153 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+import numpy as np
+
+import paddle
+from paddle.framework.io_stream import ALIGNMENT, MAGIC, _StreamReader
+
+
+class TestSaveLoadStreamFormat(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'model.pdparams')
+
+        self.layer = paddle.nn.Linear(5, 10)
+        adam = paddle.optimizer.Adam(
+            learning_rate=0.001, parameters=self.layer.parameters()
+        )
+        self.layer(paddle.rand([2, 5])).mean().backward()
+        adam.step()
+        self.obj = {
+            'model': self.layer.state_dict(),
+            'opt': adam.state_dict(),
+            'epoch': 10,
+            'array': np.arange(6, dtype='int32').reshape([2, 3]),
+        }
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def check_state_dict(self, loaded, state_dict):
+        self.assertEqual(list(loaded.keys()), list(state_dict.keys()))
+        for key, value in state_dict.items():
+            if isinstance(value, paddle.Tensor):
+                self.assertIsInstance(loaded[key], paddle.Tensor)
+                self.assertEqual(loaded[key].name, value.name)
+                np.testing.assert_array_equal(
+                    loaded[key].numpy(), value.numpy()
+                )
+            elif isinstance(value, dict):
+                self.check_state_dict(loaded[key], value)
+
+    def test_save_load(self):
+        paddle.save(self.obj, self.path, format='stream')
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(len(MAGIC)), MAGIC)
+
+        for mmap in [False, True]:
+            loaded = paddle.load(self.path, mmap=mmap)
+            self.check_state_dict(loaded['model'], self.obj['model'])
+            self.check_state_dict(loaded['opt'], self.obj['opt'])
+            self.assertEqual(loaded['epoch'], 10)
+            np.testing.assert_array_equal(
+                loaded['array'].numpy(), self.obj['array']
+            )
+
+        self.layer.set_state_dict(paddle.load(self.path)['model'])
+
+    def test_alignment(self):
+        paddle.save(self.obj, self.path, format='stream')
+        reader = _StreamReader(self.path)
+        self.assertEqual(reader._data_start % ALIGNMENT, 0)
+        for entry in reader.header['tensors'].values():
+            self.assertEqual(entry['offset'] % ALIGNMENT, 0)
+        self.assertEqual(os.path.getsize(self.path), reader.end)
+        reader.close()
+
+    def test_return_numpy(self):
+        state_dict = self.layer.state_dict()
+        paddle.save(state_dict, self.path, format='stream')
+        loaded = paddle.load(self.path, return_numpy=True, mmap=True)
+        for key, value in state_dict.items():
+            self.assertIsInstance(loaded[key], np.ndarray)
+            self.assertFalse(loaded[key].flags.writeable)
+            np.testing.assert_array_equal(loaded[key], value.numpy())
+
+        loaded = paddle.load(self.path, return_numpy=True)
+        self.assertTrue(loaded['weight'].flags.writeable)
+
+    def test_partial_and_lazy(self):
+        state_dict = self.layer.state_dict()
+        paddle.save(state_dict, self.path, format='stream')
+
+        loaded = paddle.load(self.path, keys=['bias'])
+        self.assertEqual(list(loaded.keys()), ['bias'])
+        np.testing.assert_array_equal(
+            loaded['bias'].numpy(), state_dict['bias'].numpy()
+        )
+        with self.assertRaises(KeyError):
+            paddle.load(self.path, keys=['not_exist'])
+
+        with paddle.load(self.path, lazy=True, mmap=True) as lazy:
+            self.assertEqual(sorted(lazy), sorted(state_dict))
+            self.assertIn('weight', lazy)
+            np.testing.assert_array_equal(
+                lazy['weight'].numpy(), state_dict['weight'].numpy()
+            )
+
+        with paddle.load(self.path, lazy=True) as lazy:
+            np.testing.assert_array_equal(
+                lazy['bias'].numpy(), state_dict['bias'].numpy()
+            )
+
+    def test_tensor_and_buffer(self):
+        tensor = paddle.randn([3, 4])
+        byio = BytesIO()
+        paddle.save(self.layer.state_dict(), byio, format='stream')
+        paddle.save(tensor, byio, format='stream')
+        byio.seek(0)
+        self.check_state_dict(paddle.load(byio), self.layer.state_dict())
+        np.testing.assert_array_equal(paddle.load(byio).numpy(), tensor.numpy())
+
+    def test_keep_name_table(self):
+        state_dict = self.layer.state_dict()
+        paddle.save(state_dict, self.path, format='stream')
+        loaded = paddle.load(self.path, keep_name_table=True)
+        self.assertEqual(
+            loaded["StructuredToParameterName@@"],
+            {key: value.name for key, value in state_dict.items()},
+        )
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            paddle.save(self.obj, self.path, format='json')
+
+        paddle.save(self.obj, self.path)
+        with self.assertRaises(ValueError):
+            paddle.load(self.path, lazy=True)
+
+        paddle.save(paddle.randn([3]), self.path, format='stream')
+        with self.assertRaises(ValueError):
+            paddle.load(self.path, keys=['weight'])
+
+
+if __name__ == '__main__':
+    unittest.main()
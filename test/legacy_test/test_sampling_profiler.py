@@ -0,0 +1,101 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+import urllib.request
+
+import numpy as np
+
+import paddle
+from paddle import profiler
+from paddle.io import DataLoader, Dataset
+from paddle.profiler import utils
+from paddle.profiler.sampler import _RingBuffer
+from paddle.profiler.timer import benchmark
+
+
+class RandomDataset(Dataset):
+    def __init__(self, num_samples):
+        self.num_samples = num_samples
+
+    def __getitem__(self, idx):
+        image = np.random.random([16]).astype('float32')
+        label = np.random.randint(0, 4, (1,)).astype('int64')
+        return image, label
+
+    def __len__(self):
+        return self.num_samples
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_wrap(self):
+        buffer = _RingBuffer(4)
+        buffer.extend(np.arange(10.0))
+        self.assertEqual(buffer.count, 10)
+        self.assertEqual(sorted(buffer.values()), [6.0, 7.0, 8.0, 9.0])
+        buffer.append(10.0)
+        self.assertEqual(sorted(buffer.values()), [7.0, 8.0, 9.0, 10.0])
+        summary = buffer.summary([50, 100])
+        self.assertEqual(summary['count'], 11)
+        self.assertEqual(summary['p50'], 8.5)
+        self.assertEqual(summary['p100'], 10.0)
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def test_sampling(self):
+        paddle.disable_static()
+        net = paddle.nn.Sequential(
+            paddle.nn.Linear(16, 8), paddle.nn.ReLU(), paddle.nn.Linear(8, 4)
+        )
+        loader = DataLoader(RandomDataset(42), batch_size=2)
+        sampler = profiler.SamplingProfiler(
+            interval=5, capacity=8, targets=[profiler.ProfilerTarget.CPU]
+        )
+        with sampler:
+            host, port = sampler.serve()
+            for image, label in loader:
+                out = net(image)
+                loss = paddle.nn.functional.cross_entropy(out, label)
+                loss.backward()
+                sampler.step()
+            self.assertEqual(utils._is_profiler_used, False)
+
+            summary = sampler.summary()
+            self.assertEqual(summary['steps'], 21)
+            self.assertEqual(summary['sampled_steps'], 4)
+            self.assertEqual(summary['step_time']['count'], 17)
+            self.assertEqual(summary['reader_cost']['count'], 21)
+            self.assertIn('Linear', summary['layer'])
+            self.assertEqual(summary['layer']['Linear']['count'], 8)
+            self.assertGreater(len(summary['op']), 0)
+            for stats in summary['op'].values():
+                self.assertLessEqual(stats['p50'], stats['p99'])
+
+            url = f'http://{host}:{port}'
+            with urllib.request.urlopen(url + '/json') as response:
+                self.assertEqual(json.loads(response.read())['steps'], 21)
+            with urllib.request.urlopen(url + '/metrics') as response:
+                text = response.read().decode('utf-8')
+            self.assertIn(
+                'paddle_profiler_layer_latency_seconds{name="Linear",'
+                'quantile="0.99"}',
+                text,
+            )
+        self.assertIsNone(sampler._server)
+        self.assertNotIn(sampler._hook_key, benchmark().hooks)
+
+
+if __name__ == '__main__':
+    unittest.main()
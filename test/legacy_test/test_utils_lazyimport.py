@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import subprocess
+import sys
 import unittest
 
 from paddle.utils.lazy_import import try_import
@@ -42,5 +44,76 @@ class TestUtilsLazyImport(unittest.TestCase):
         self.func_test_lazy_import()
 
 
+class TestLazySubmodules(unittest.TestCase):
+    def run_code(self, code):
+        return subprocess.check_output([sys.executable, '-c', code]).decode()
+
+    def test_not_imported(self):
+        code = (
+            "import sys, paddle\n"
+            "names = ['paddle.vision', 'paddle.distributed', 'paddle.hapi']\n"
+            "print([name in sys.modules for name in names])"
+        )
+        self.assertEqual(
+            self.run_code(code).strip().splitlines()[-1],
+            str([False, False, False]),
+        )
+
+    def test_access(self):
+        code = (
+            "import sys, paddle\n"
+            "from paddle import vision\n"
+            "assert paddle.vision is vision\n"
+            "assert paddle.distributed.fleet is sys.modules['paddle.distributed.fleet']\n"
+            "assert paddle.Model is paddle.hapi.Model\n"
+            "assert paddle.DataParallel is paddle.distributed.DataParallel\n"
+            "assert 'sparse' in dir(paddle)\n"
+            "from paddle import *\n"
+            "assert Model is paddle.Model\n"
+            "print('ok')"
+        )
+        self.assertEqual(self.run_code(code).strip().splitlines()[-1], 'ok')
+
+    def test_public_apis(self):
+        # every snippet runs in a new process, so the lazy import is the
+        # first import of the submodule
+        snippets = [
+            "import paddle\n"
+            "assert isinstance(paddle.vision.models.resnet18(), paddle.nn.Layer)",
+            "import paddle\nassert callable(paddle.distributed.fleet.init)",
+            "import paddle\n"
+            "from paddle import Model, summary, flops, DataParallel\n"
+            "from paddle.hapi import Model as HapiModel\n"
+            "from paddle.hapi import summary as hapi_summary\n"
+            "from paddle.hapi import flops as hapi_flops\n"
+            "from paddle.distributed import DataParallel as DistDataParallel\n"
+            "assert Model is HapiModel and summary is hapi_summary\n"
+            "assert flops is hapi_flops and DataParallel is DistDataParallel",
+            "import paddle\n"
+            "names = dir(paddle)\n"
+            "for name in ['vision', 'distributed', 'hapi', 'Model', 'DataParallel']:\n"
+            "    assert name in names, name",
+            "from paddle import *\n"
+            "import paddle\n"
+            "for name in paddle.__all__:\n"
+            "    assert name in globals(), name\n"
+            "assert Model is paddle.Model and flops is paddle.flops",
+        ]
+        for code in snippets:
+            with self.subTest(code=code):
+                self.assertEqual(
+                    self.run_code(code + "\nprint('ok')")
+                    .strip()
+                    .splitlines()[-1],
+                    'ok',
+                )
+
+    def test_missing_attribute(self):
+        import paddle
+
+        with self.assertRaises(AttributeError):
+            paddle.not_a_submodule  # noqa: B018
+
+
 if __name__ == "__main__":
     unittest.main()